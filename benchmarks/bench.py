@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Pyker benchmarks - timing of pyker's own hot paths
+
+Every benchmark runs against a throwaway HOME, so the real ~/.pyker is never touched.
+Results can be saved as a baseline and later runs compared against it:
+
+    python3 benchmarks/bench.py --save-baseline benchmarks/baseline.json
+    python3 benchmarks/bench.py --compare benchmarks/baseline.json
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+import contextlib
+from pathlib import Path
+from datetime import datetime
+
+ROOT = Path(__file__).resolve().parent.parent
+PYKER = ROOT / 'pyker.py'
+sys.path.insert(0, str(ROOT))
+
+import pyker_core as pyker  # noqa: E402
+
+# Colors for output
+class Colors:
+    RED = '\033[91m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    CYAN = '\033[96m'
+    BOLD = '\033[1m'
+    RESET = '\033[0m'
+
+if not sys.stdout.isatty():
+    for color in ('RED', 'GREEN', 'YELLOW', 'CYAN', 'BOLD', 'RESET'):
+        setattr(Colors, color, '')
+
+SLEEPER = "import time\nwhile True:\n    time.sleep(1)\n"
+FLOOD = ("import sys\n"
+         "write = sys.stdout.write\n"
+         "for i in range({lines}):\n"
+         "    write('benchmark log line %d with some text to make it look real\\n' % i)\n")
+
+
+class Bench:
+    """Runs benchmarks in an isolated HOME and collects their timings"""
+
+    def __init__(self, repeat: int, quick: bool):
+        self.repeat = repeat
+        self.quick = quick
+        self.results = {}
+        self.home = Path(tempfile.mkdtemp(prefix='pyker-bench-'))
+        self.work = self.home / 'work'
+        self.work.mkdir()
+        (self.work / 'sleeper.py').write_text(SLEEPER)
+        self.dummies = []
+
+        # Path.home() follows HOME, for this process and every pyker started from it
+        self.previous_home = os.environ.get('HOME')
+        os.environ['HOME'] = str(self.home)
+        self.pyker = self.new_pyker()
+        self.pyker.config['supervisor']['autostart'] = False
+        self.pyker.config['log_rotation']['enabled'] = False
+        self.pyker._save_config(self.pyker.config)
+
+    def new_pyker(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return pyker.Pyker()
+
+    def close(self):
+        self.kill_dummies()
+        with contextlib.redirect_stdout(io.StringIO()):
+            instance = self.new_pyker()
+            running = [name for name, info in instance.processes.items() if info.get('pid')]
+            if running:
+                instance.stop_many(running)
+        if self.previous_home is None:
+            os.environ.pop('HOME', None)
+        else:
+            os.environ['HOME'] = self.previous_home
+        shutil.rmtree(self.home, ignore_errors=True)
+
+    def record(self, name: str, samples: list, note: str = ''):
+        """Store the timings of one benchmark and print them"""
+        ordered = sorted(samples)
+        result = {
+            'median': statistics.median(ordered),
+            'min': ordered[0],
+            'p95': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            'runs': len(ordered)
+        }
+        if note:
+            result['note'] = note
+        self.results[name] = result
+        details = f"  {note}" if note else ""
+        print(f"  {name:<44} {format_seconds(result['median']):>10}  "
+              f"(min {format_seconds(result['min'])}, p95 {format_seconds(result['p95'])}){details}")
+
+    def measure(self, func, repeat: int = None):
+        """Time func, with its output discarded"""
+        samples = []
+        for _ in range(repeat or self.repeat):
+            with contextlib.redirect_stdout(io.StringIO()):
+                began = time.perf_counter()
+                func()
+                samples.append(time.perf_counter() - began)
+        return samples
+
+    def cli(self, *args):
+        """Run the pyker CLI in a fresh interpreter"""
+        subprocess.run([sys.executable, str(PYKER)] + list(args), stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, env=os.environ.copy(), check=False)
+
+    def set_fleet(self, size: int):
+        """Record size running dummy processes in the state file"""
+        self.kill_dummies()
+        processes = {}
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        for index in range(size):
+            dummy = subprocess.Popen(['sleep', '3600'], start_new_session=True)
+            self.dummies.append(dummy)
+            processes[f"dummy-{index}"] = dummy_info(dummy.pid, now, self.home)
+        self.pyker.processes = processes
+        self.pyker._save_state()
+
+    def kill_dummies(self):
+        for dummy in self.dummies:
+            dummy.kill()
+        for dummy in self.dummies:
+            dummy.wait()
+        self.dummies = []
+
+    # Benchmarks
+
+    def bench_cli(self):
+        """Cold start of the CLI, the time every interactive command pays"""
+        self.set_fleet(10)
+        commands = [['--help'], ['list'], ['list', '-o', 'json'], ['info'], ['info', 'dummy-0'],
+                    ['logs', 'dummy-0', '-n', '20'], ['events', '-n', '20'], ['supervisor', 'status']]
+        for command in commands:
+            self.record(f"cli {' '.join(command)}", self.measure(lambda: self.cli(*command)))
+        self.kill_dummies()
+
+    def bench_list(self):
+        """list_processes with a growing number of running processes"""
+        for size in ([10, 100] if self.quick else [10, 100, 1000]):
+            self.set_fleet(size)
+            for output in ('text', 'json'):
+                self.pyker.processes = self.pyker._load_state()
+                self.record(f"list {output} ({size} processes)",
+                            self.measure(lambda: self.pyker.list_processes(output)))
+        self.kill_dummies()
+
+    def bench_state(self):
+        """Saving and loading the state file, done by every command"""
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        for size in ([10, 100, 1000] if self.quick else [10, 100, 1000, 10000]):
+            self.pyker.processes = {f"p{index}": dummy_info(None, now, self.home) for index in range(size)}
+            self.record(f"save_state ({size} processes)", self.measure(self.pyker._save_state))
+            self.record(f"load_state ({size} processes)", self.measure(self.pyker._load_state))
+        self.pyker.processes = {}
+        self.pyker._save_state()
+
+    def bench_stop_restart(self):
+        """Wall time to stop and restart a group of real managed processes"""
+        size = 5 if self.quick else 20
+        names = [f"worker-{index}" for index in range(size)]
+        instance = self.new_pyker()
+
+        def start_all():
+            for name in names:
+                instance.start(name, str(self.work / 'sleeper.py'))
+
+        stop_samples, restart_samples = [], []
+        for _ in range(self.repeat):
+            with contextlib.redirect_stdout(io.StringIO()):
+                start_all()
+                time.sleep(0.5)
+                began = time.perf_counter()
+                instance.stop_many(names)
+                stop_samples.append(time.perf_counter() - began)
+                start_all()
+                time.sleep(0.5)
+                began = time.perf_counter()
+                for name in names:
+                    instance.restart(name)
+                restart_samples.append(time.perf_counter() - began)
+                instance.stop_many(names)
+        self.record(f"stop ({size} processes)", stop_samples)
+        self.record(f"restart ({size} processes, one by one)", restart_samples)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for name in names:
+                instance.delete(name)
+
+    def bench_log_throughput(self):
+        """Time until a process writing many lines has all of them in its log"""
+        lines = 200000 if self.quick else 1000000
+        script = self.work / 'flood.py'
+        script.write_text(FLOOD.format(lines=lines))
+        instance = self.new_pyker()
+
+        for log_format in ('raw', 'text', 'jsonl'):
+            name = f"flood-{log_format}"
+            samples = []
+            for _ in range(self.repeat):
+                with contextlib.redirect_stdout(io.StringIO()):
+                    if name in instance.processes:
+                        instance.delete(name)
+                    log_file = instance.logs_dir / f"{name}.log"
+                    if log_file.exists():
+                        log_file.unlink()
+                    began = time.perf_counter()
+                    instance.start(name, str(script), log_format=log_format)
+                    info = instance.processes[name]
+                    wait_gone(info['pid'])
+                    if info.get('capture_pid'):
+                        wait_gone(info['capture_pid'])
+                    samples.append(time.perf_counter() - began)
+            self.record(f"log write {log_format} ({lines} lines)", samples,
+                        f"{lines / statistics.median(samples) / 1e6:.2f}M lines/s")
+            with contextlib.redirect_stdout(io.StringIO()):
+                instance.delete(name)
+
+    def bench_tail(self):
+        """Reading the end of a large log, what `logs` and remote hosts do"""
+        size_mb = 64 if self.quick else 512
+        log_file = self.home / '.pyker' / 'logs' / 'dummy-0.log'
+        line = b'2025-08-19 09:30:15.204718 [stdout] benchmark log line with some text to make it look real\n'
+        block = line * (1024 * 1024 // len(line))
+        with open(log_file, 'wb') as f:
+            for _ in range(size_mb):
+                f.write(block)
+
+        self.set_fleet(1)
+        self.record(f"tail 100 lines ({size_mb} MB log)",
+                    self.measure(lambda: pyker._tail_lines(log_file, 100), max(self.repeat, 20)))
+        self.record(f"cli logs -n 100 ({size_mb} MB log)", self.measure(lambda: self.cli('logs', 'dummy-0', '-n', '100')))
+        self.kill_dummies()
+        log_file.unlink()
+
+
+BENCHMARKS = ['cli', 'list', 'state', 'stop_restart', 'log_throughput', 'tail']
+
+
+def dummy_info(pid, start_time: str, home: Path):
+    """State entry of a process as written by start()"""
+    return {
+        'pid': pid,
+        'script_path': str(home / 'work' / 'sleeper.py'),
+        'venv_path': None,
+        'python_exe': sys.executable,
+        'python_version': platform.python_version(),
+        'status': 'running' if pid else 'stopped',
+        'start_time': start_time,
+        'log_file': str(home / '.pyker' / 'logs' / 'dummy-0.log'),
+        'auto_restart': False,
+        'bootstrap': True,
+        'process_group': True,
+        'cpu_percent': 0.0,
+        'memory_mb': 0.0
+    }
+
+
+def wait_gone(pid: int, timeout: float = 120):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return
+        try:
+            # Reap our own children so they do not stay around as zombies
+            if os.waitpid(pid, os.WNOHANG)[0]:
+                return
+        except ChildProcessError:
+            pass
+        time.sleep(0.005)
+    raise TimeoutError(f"process {pid} did not exit")
+
+
+def format_seconds(seconds: float):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.2f}s"
+
+
+def compare(results: dict, baseline_file: Path, threshold: float):
+    """Print how the medians changed against a baseline, returns the regressed benchmarks"""
+    baseline = json.loads(baseline_file.read_text())['results']
+    print(f"\n{Colors.BOLD}{Colors.CYAN}Compared to {baseline_file}:{Colors.RESET}")
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"  {name:<44} {'new':>10}")
+            continue
+        ratio = result['median'] / baseline[name]['median'] if baseline[name]['median'] else 1.0
+        color = Colors.RED if ratio > threshold else Colors.GREEN if ratio < 1 / threshold else ''
+        print(f"  {name:<44} {color}{ratio:>9.2f}x{Colors.RESET}  "
+              f"({format_seconds(baseline[name]['median'])} -> {format_seconds(result['median'])})")
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks of pyker hot paths')
+    parser.add_argument('benchmarks', nargs='*', metavar='BENCHMARK',
+                        help=f"Benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='Runs per measurement (default: 5)')
+    parser.add_argument('--quick', action='store_true', help='Smaller fleets and files, for a fast check')
+    parser.add_argument('--save-baseline', metavar='FILE', help='Write the results to FILE')
+    parser.add_argument('--compare', metavar='FILE', help='Compare the results to a saved baseline')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Slowdown ratio reported as a regression (default: 1.25)')
+    args = parser.parse_args()
+    unknown = [name for name in args.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark {unknown[0]} (choose from {', '.join(BENCHMARKS)})")
+
+    if pyker.psutil is None:
+        print(f"{Colors.RED}[ERROR]{Colors.RESET} psutil is required: pip3 install --user psutil")
+        sys.exit(1)
+
+    print(f"{Colors.BOLD}{Colors.CYAN}Pyker benchmarks{Colors.RESET} "
+          f"(Python {platform.python_version()}, {platform.system()} {platform.machine()}, "
+          f"{os.cpu_count()} CPUs)")
+    bench = Bench(args.repeat, args.quick)
+    try:
+        for name in args.benchmarks or BENCHMARKS:
+            method = getattr(bench, f"bench_{name}")
+            print(f"\n{Colors.BOLD}{name}:{Colors.RESET} {method.__doc__}")
+            method()
+    except KeyboardInterrupt:
+        print(f"\n{Colors.YELLOW}[INFO]{Colors.RESET} Interrupted")
+        sys.exit(130)
+    finally:
+        bench.close()
+
+    if args.save_baseline:
+        report = {
+            'created': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'python': platform.python_version(),
+            'platform': f"{platform.system()} {platform.release()} {platform.machine()}",
+            'cpus': os.cpu_count(),
+            'quick': args.quick,
+            'results': bench.results
+        }
+        Path(args.save_baseline).write_text(json.dumps(report, indent=2) + '\n')
+        print(f"\n{Colors.GREEN}[SUCCESS]{Colors.RESET} Baseline saved to {args.save_baseline}")
+
+    if args.compare:
+        regressions = compare(bench.results, Path(args.compare), args.threshold)
+        if regressions:
+            print(f"\n{Colors.RED}[ERROR]{Colors.RESET} {len(regressions)} benchmarks are more than "
+                  f"{args.threshold:g}x slower: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"\n{Colors.GREEN}[SUCCESS]{Colors.RESET} No regressions over {args.threshold:g}x")
+
+
+if __name__ == '__main__':
+    main()
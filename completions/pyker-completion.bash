@@ -6,27 +6,19 @@ _pyker_completion() {
     _init_completion || return
 
     # Main commands
-    local commands="start stop restart delete list logs info uninstall"
+    local commands="start stop restart delete list logs info events monit profile supervisor save resurrect startup agent uninstall"
     
     # Get current processes for name completion
     local processes=""
     if command -v pyker &> /dev/null && [[ -f ~/.pyker/processes.json ]]; then
-        # Extract process names from JSON file
-        processes=$(python3 -c "
-import json
-try:
-    with open('$HOME/.pyker/processes.json', 'r') as f:
-        data = json.load(f)
-        print(' '.join(data.keys()))
-except:
-    pass
-" 2>/dev/null)
+        # Top-level keys of the state file, written by pyker with an indent of 2
+        processes=$(sed -n 's/^  "\(.*\)": {$/\1/p' ~/.pyker/processes.json 2>/dev/null)
     fi
 
     case $cword in
         1)
-            # Complete main commands
-            COMPREPLY=($(compgen -W "$commands" -- "$cur"))
+            # Complete main commands and the options for remote hosts
+            COMPREPLY=($(compgen -W "$commands --hosts --timeout" -- "$cur"))
             ;;
         2)
             case $prev in
@@ -34,12 +26,27 @@ except:
                     # Complete with process name (new) and show files
                     COMPREPLY=($(compgen -f -- "$cur"))
                     ;;
-                stop|restart|delete|logs|info)
+                stop|restart|delete|logs|info|events|profile)
                     # Complete with existing process names
                     COMPREPLY=($(compgen -W "$processes" -- "$cur"))
                     ;;
-                list|uninstall)
-                    # No completion for list and uninstall
+                supervisor)
+                    COMPREPLY=($(compgen -W "start stop status run" -- "$cur"))
+                    ;;
+                list)
+                    COMPREPLY=($(compgen -W "-o --output" -- "$cur"))
+                    ;;
+                resurrect)
+                    COMPREPLY=($(compgen -W "-c --concurrency" -- "$cur"))
+                    ;;
+                agent)
+                    COMPREPLY=($(compgen -W "enable disable status token" -- "$cur"))
+                    ;;
+                --hosts)
+                    COMPREPLY=($(compgen -f -- "$cur"))
+                    ;;
+                monit|save|startup|uninstall)
+                    # No completion for monit, save, startup and uninstall
                     ;;
             esac
             ;;
@@ -53,6 +60,27 @@ except:
                     # Complete with log options
                     COMPREPLY=($(compgen -W "-f --follow -n --lines" -- "$cur"))
                     ;;
+                profile)
+                    COMPREPLY=($(compgen -W "-d --duration -r --rate" -- "$cur"))
+                    ;;
+                info)
+                    COMPREPLY=($(compgen -W "--allocations -d --duration -o --output" -- "$cur"))
+                    ;;
+                events)
+                    COMPREPLY=($(compgen -W "-f --follow -n --lines -o --output" -- "$cur"))
+                    ;;
+                list)
+                    COMPREPLY=($(compgen -W "json jsonl csv text" -- "$cur"))
+                    ;;
+                stop)
+                    COMPREPLY=($(compgen -W "$processes --no-wait" -- "$cur"))
+                    ;;
+                restart)
+                    COMPREPLY=($(compgen -W "$processes" -- "$cur"))
+                    ;;
+                agent)
+                    COMPREPLY=($(compgen -W "--bind --port" -- "$cur"))
+                    ;;
             esac
             ;;
         *)
@@ -65,11 +93,49 @@ except:
                             local venv_path="${cur#--venv=}"
                             COMPREPLY=($(compgen -d -- "$venv_path"))
                             ;;
+                        --overlap=*)
+                            local overlap="${cur#--overlap=}"
+                            COMPREPLY=($(compgen -P "--overlap=" -W "skip queue kill-previous" -- "$overlap"))
+                            ;;
+                        --log-format=*)
+                            local log_format="${cur#--log-format=}"
+                            COMPREPLY=($(compgen -P "--log-format=" -W "raw text jsonl" -- "$log_format"))
+                            ;;
+                        --stop-signal=*)
+                            local stop_signal="${cur#--stop-signal=}"
+                            COMPREPLY=($(compgen -P "--stop-signal=" -W "SIGTERM SIGINT SIGHUP SIGQUIT SIGUSR1 SIGUSR2" -- "$stop_signal"))
+                            ;;
+                        --class=*)
+                            local priority_class="${cur#--class=}"
+                            COMPREPLY=($(compgen -P "--class=" -W "critical normal best-effort" -- "$priority_class"))
+                            ;;
+                        --anomaly-action=*)
+                            local action="${cur#--anomaly-action=}"
+                            COMPREPLY=($(compgen -P "--anomaly-action=" -W "warn restart dump" -- "$action"))
+                            ;;
                         *)
-                            COMPREPLY=($(compgen -W "--auto-restart --venv=" -- "$cur"))
+                            COMPREPLY=($(compgen -W "--auto-restart --venv= --telemetry --watch --ignore --cron --overlap= --anomaly-action= --priority --log-format= --log-lines-per-sec --log-bytes-per-sec --stop-signal= --kill-timeout --pre-stop --pre-stop-url --listen --idle-timeout --class= --precompile --importtime --inspect --cpus" -- "$cur"))
                             ;;
                     esac
                     ;;
+                info|events)
+                    if [[ $prev == "-o" || $prev == "--output" ]]; then
+                        COMPREPLY=($(compgen -W "json jsonl csv text" -- "$cur"))
+                    elif [[ ${words[1]} == "events" ]]; then
+                        COMPREPLY=($(compgen -W "-f --follow -n --lines -o --output" -- "$cur"))
+                    else
+                        COMPREPLY=($(compgen -W "--allocations -d --duration -o --output" -- "$cur"))
+                    fi
+                    ;;
+                stop)
+                    COMPREPLY=($(compgen -W "$processes --no-wait" -- "$cur"))
+                    ;;
+                restart)
+                    COMPREPLY=($(compgen -W "$processes" -- "$cur"))
+                    ;;
+                agent)
+                    COMPREPLY=($(compgen -W "--bind --port" -- "$cur"))
+                    ;;
                 logs)
                     if [[ ${words[3]} == "-n" || ${words[3]} == "--lines" ]]; then
                         # Complete with numbers for line count
@@ -8,6 +8,7 @@ import os
 import sys
 import subprocess
 import shutil
+import py_compile
 from pathlib import Path
 
 # Colors for output
@@ -111,11 +112,12 @@ def install_pyker():
     """Install pyker to ~/.local/bin"""
     print_colored("Installing Pyker...", Colors.YELLOW)
     
-    # Check if pyker.py exists
-    if not Path("pyker.py").exists():
-        print_colored("Error: pyker.py not found in current directory", Colors.RED)
-        print_colored("Please run this script from the pyker directory", Colors.YELLOW)
-        sys.exit(1)
+    # Check if pyker.py and its modules exist
+    for file in ("pyker.py", "pyker_core.py", "pyker_bootstrap.py"):
+        if not Path(file).exists():
+            print_colored(f"Error: {file} not found in current directory", Colors.RED)
+            print_colored("Please run this script from the pyker directory", Colors.YELLOW)
+            sys.exit(1)
     
     # Setup local bin
     local_bin = setup_local_bin()
@@ -124,6 +126,11 @@ def install_pyker():
     try:
         shutil.copy2("pyker.py", target_path)
         os.chmod(target_path, 0o755)
+        # The launcher imports pyker_core, scripts started with runtime options run through pyker_bootstrap
+        for module in ("pyker_core.py", "pyker_bootstrap.py"):
+            shutil.copy2(module, local_bin / module)
+        # Compiled now, the first command does not pay for it
+        py_compile.compile(str(local_bin / "pyker_core.py"), doraise=True)
         print_colored(f"✓ pyker installed to {target_path}", Colors.GREEN)
     except Exception as e:
         print_colored(f"Error copying file: {e}", Colors.RED)
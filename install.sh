@@ -78,19 +78,21 @@ else
     exit 1
 fi
 
-# Download pyker.py if not present
-if [ ! -f "pyker.py" ]; then
-    echo -e "${YELLOW}Downloading pyker.py...${NC}"
-    if command -v curl &> /dev/null; then
-        curl -sSL https://raw.githubusercontent.com/mrvi0/pyker/main/pyker.py -o pyker.py
-    elif command -v wget &> /dev/null; then
-        wget -q https://raw.githubusercontent.com/mrvi0/pyker/main/pyker.py
-    else
-        echo -e "${RED}Error: Neither curl nor wget is available${NC}"
-        echo -e "${YELLOW}Please download pyker.py manually and run this script again${NC}"
-        exit 1
+# Download pyker.py and its modules if not present
+for file in pyker.py pyker_core.py pyker_bootstrap.py; do
+    if [ ! -f "$file" ]; then
+        echo -e "${YELLOW}Downloading $file...${NC}"
+        if command -v curl &> /dev/null; then
+            curl -sSL https://raw.githubusercontent.com/mrvi0/pyker/main/$file -o $file
+        elif command -v wget &> /dev/null; then
+            wget -q https://raw.githubusercontent.com/mrvi0/pyker/main/$file
+        else
+            echo -e "${RED}Error: Neither curl nor wget is available${NC}"
+            echo -e "${YELLOW}Please download $file manually and run this script again${NC}"
+            exit 1
+        fi
     fi
-fi
+done
 
 # Make pyker.py executable
 chmod +x pyker.py
@@ -100,6 +102,10 @@ mkdir -p ~/.local/bin
 
 # Copy pyker to local bin
 cp pyker.py ~/.local/bin/pyker
+cp pyker_core.py ~/.local/bin/pyker_core.py
+cp pyker_bootstrap.py ~/.local/bin/pyker_bootstrap.py
+# Compile the implementation now, the first command does not pay for it
+python3 -m py_compile ~/.local/bin/pyker_core.py
 
 # Check if ~/.local/bin is in PATH
 if [[ ":$PATH:" != *":$HOME/.local/bin:"* ]]; then
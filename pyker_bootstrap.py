@@ -0,0 +1,253 @@
+"""
+Pyker bootstrap - runs a managed script as __main__ with pyker's runtime hooks.
+
+Kept apart from pyker itself so a managed script only pays for what it asked for: stack dumps,
+profiling, allocation tracing, telemetry, priority class, CPU pinning and socket activation.
+Everything beyond os, sys and signal is imported when a feature is used.
+"""
+
+import os
+import sys
+import time
+import signal
+
+# Separates the bootstrap's own imports from the script's in the -X importtime output
+IMPORT_TIME_MARKER = 'import time: -- script --'
+
+
+def _profile_samples(duration: float, rate: int):
+    """Sample stacks of all threads and count identical stacks"""
+    import runpy
+    import threading
+    
+    # Frames of runpy and the bootstrap itself are cut from the stacks
+    bootstrap_frame = runpy._run_code.__code__
+    own_thread = threading.get_ident()
+    interval = 1.0 / rate
+    counts = {}
+    deadline = time.monotonic() + duration
+    
+    while time.monotonic() < deadline:
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread:
+                continue
+            stack = []
+            while frame is not None and frame.f_code is not bootstrap_frame:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            stack.append(thread_names.get(thread_id, f"thread-{thread_id}"))
+            key = ';'.join(reversed(stack))
+            counts[key] = counts.get(key, 0) + 1
+        time.sleep(interval)
+    
+    return counts
+
+
+def _trace_allocations(duration: float, top: int):
+    """Get the source lines holding most memory allocated during the given time"""
+    import tracemalloc
+    
+    started_here = not tracemalloc.is_tracing()
+    if started_here:
+        tracemalloc.start()
+    try:
+        time.sleep(duration)
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        if started_here:
+            tracemalloc.stop()
+    
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    return [
+        {'location': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+         'size_kb': round(stat.size / 1024, 1),
+         'count': stat.count}
+        for stat in snapshot.statistics('lineno')[:top]
+    ]
+
+
+def _run_request(request_file: str):
+    """Serve a request file written by `pyker profile` or `pyker info --allocations`"""
+    import json
+    
+    try:
+        with open(request_file, 'r', encoding='utf-8') as f:
+            request = json.load(f)
+        os.unlink(request_file)
+    except (OSError, ValueError):
+        return
+    
+    output = request['output']
+    tmp_file = os.path.splitext(output)[0] + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        if request.get('type') == 'allocations':
+            json.dump(_trace_allocations(request['duration'], request['top']), f)
+        else:
+            counts = _profile_samples(request['duration'], request['rate'])
+            # Collapsed stack format, one "frame;frame;frame count" line per stack (flamegraph.pl, speedscope)
+            for stack, count in sorted(counts.items()):
+                f.write(f"{stack} {count}\n")
+    os.replace(tmp_file, output)
+
+
+def _handle_request_signal(signum, frame):
+    """Serve a pending pyker request in a background thread on SIGUSR2"""
+    import threading
+    
+    request_file = os.path.join(os.path.expanduser('~'), '.pyker', 'profiles', f"{os.getpid()}.request")
+    if not os.path.exists(request_file):
+        return
+    if any(thread.name == 'pyker-request' for thread in threading.enumerate()):
+        return
+    threading.Thread(target=_run_request, args=(request_file,), name='pyker-request', daemon=True).start()
+
+
+def _start_telemetry(socket_path: str, interval: float):
+    """Periodically send interpreter statistics to the supervisor's telemetry socket"""
+    import gc
+    import json
+    import socket
+    import threading
+    import asyncio.base_events
+    
+    gc_stats = {'collections': [0, 0, 0], 'pause_ms': 0.0, 'max_pause_ms': 0.0, 'started': None}
+    
+    def on_gc(phase, info):
+        if phase == 'start':
+            gc_stats['started'] = time.perf_counter()
+        elif gc_stats['started'] is not None:
+            pause_ms = (time.perf_counter() - gc_stats['started']) * 1000
+            gc_stats['started'] = None
+            gc_stats['collections'][info['generation']] += 1
+            gc_stats['pause_ms'] += pause_ms
+            gc_stats['max_pause_ms'] = max(gc_stats['max_pause_ms'], pause_ms)
+    
+    gc.callbacks.append(on_gc)
+    
+    # Remember event loops as they start so their lag can be probed from the telemetry thread
+    loops = []
+    run_forever = asyncio.base_events.BaseEventLoop.run_forever
+    
+    def tracked_run_forever(loop):
+        loops.append(loop)
+        try:
+            return run_forever(loop)
+        finally:
+            loops.remove(loop)
+    
+    asyncio.base_events.BaseEventLoop.run_forever = tracked_run_forever
+    
+    # Scheduled time of each loop's pending probe; the probe clears it when it runs
+    probes = {}
+    
+    def probe_done(loop, scheduled):
+        probes[loop] = None
+        lags[loop] = (time.perf_counter() - scheduled) * 1000
+    
+    lags = {}
+    
+    def report():
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        last_pause_ms = 0.0
+        last_report = time.perf_counter()
+        
+        while True:
+            time.sleep(interval)
+            now = time.perf_counter()
+            
+            # A probe that has not run yet means the loop is blocked right now
+            loop_lag_ms = None
+            for loop in list(loops):
+                scheduled = probes.get(loop)
+                lag = (now - scheduled) * 1000 if scheduled is not None else lags.get(loop, 0.0)
+                loop_lag_ms = max(loop_lag_ms or 0.0, lag)
+                if scheduled is None:
+                    probes[loop] = now
+                    try:
+                        loop.call_soon_threadsafe(probe_done, loop, now)
+                    except RuntimeError:
+                        pass
+            
+            pause_ms = gc_stats['pause_ms']
+            payload = {
+                'pid': os.getpid(),
+                'threads': threading.active_count(),
+                'gc_collections': list(gc_stats['collections']),
+                'gc_pause_ms': round(pause_ms, 2),
+                'gc_max_pause_ms': round(gc_stats['max_pause_ms'], 2),
+                'gc_pause_percent': round((pause_ms - last_pause_ms) / ((now - last_report) * 10), 2),
+                'loop_lag_ms': round(loop_lag_ms, 2) if loop_lag_ms is not None else None
+            }
+            last_pause_ms = pause_ms
+            last_report = now
+            
+            try:
+                sock.sendto(json.dumps(payload).encode('utf-8'), socket_path)
+            except OSError:
+                pass  # Supervisor is not running
+    
+    threading.Thread(target=report, name='pyker-telemetry', daemon=True).start()
+
+
+def bootstrap(argv):
+    """Run a managed script as __main__ after installing the runtime hooks given as --option value pairs"""
+    import runpy
+    import pkgutil  # noqa: F401  imported by run_path, keeps it out of the script's import times
+    
+    argv = list(argv)
+    options = {}
+    while argv and argv[0].startswith('--'):
+        options[argv[0][2:]] = argv[1]
+        argv = argv[2:]
+    script_path = argv[0]
+    
+    if 'inspect' in options:
+        import faulthandler
+        # Let the supervisor request a stack dump of all threads into the log
+        if hasattr(signal, 'SIGUSR1'):
+            faulthandler.register(signal.SIGUSR1, all_threads=True)
+        # Let `pyker profile` and `pyker info --allocations` send requests
+        if hasattr(signal, 'SIGUSR2'):
+            signal.signal(signal.SIGUSR2, _handle_request_signal)
+    
+    if 'telemetry' in options:
+        _start_telemetry(options['telemetry'], float(options['telemetry-interval']))
+    
+    # Apply the priority class before the script allocates anything; lowering either value needs privileges
+    if 'oom-score-adj' in options:
+        try:
+            with open('/proc/self/oom_score_adj', 'w') as f:
+                f.write(options['oom-score-adj'])
+        except OSError as e:
+            print(f"[pyker] cannot set oom_score_adj to {options['oom-score-adj']}: {e.strerror}", file=sys.stderr)
+    if 'nice' in options and hasattr(os, 'setpriority'):
+        try:
+            os.setpriority(os.PRIO_PROCESS, 0, int(options['nice']))
+        except OSError as e:
+            print(f"[pyker] cannot set nice to {options['nice']}: {e.strerror}", file=sys.stderr)
+    # Threads started later inherit the CPUs, so pin before the script runs
+    if 'cpus' in options:
+        try:
+            os.sched_setaffinity(0, [int(cpu) for cpu in options['cpus'].split(',')])
+        except OSError as e:
+            print(f"[pyker] cannot pin to CPUs {options['cpus']}: {e.strerror}", file=sys.stderr)
+    
+    # Hand the socket of an on-demand process over the way systemd socket activation does: as fd 3
+    if 'listen-fd' in options:
+        listen_fd = int(options['listen-fd'])
+        if listen_fd != 3:
+            os.dup2(listen_fd, 3)
+            os.close(listen_fd)
+        os.environ.update(LISTEN_FDS='1', LISTEN_PID=str(os.getpid()))
+    
+    sys.argv = argv
+    sys.path[0] = os.path.dirname(script_path)
+    if 'importtime' in sys._xoptions:
+        print(IMPORT_TIME_MARKER, file=sys.stderr, flush=True)
+    runpy.run_path(script_path, run_name='__main__')
+
+
+if __name__ == '__main__':
+    bootstrap(sys.argv[1:])
@@ -0,0 +1,5942 @@
+#!/usr/bin/env python3
+"""
+Pyker - Simple Python Process Manager
+A lightweight alternative to PM2 for Python scripts
+
+The implementation behind the `pyker` launcher, kept in a module so it is cached as bytecode.
+"""
+
+import io
+import os
+import copy
+import re
+import sys
+import glob
+import json
+import math
+import mmap
+import time
+import signal
+import socket
+import heapq
+import contextlib
+import struct
+import fnmatch
+import collections
+import argparse
+import threading
+import selectors
+import subprocess
+from pathlib import Path
+from datetime import datetime, timedelta
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: state saves are merged but not locked
+    fcntl = None
+
+try:
+    import psutil
+except ImportError:
+    # Checked in main, the log capture entry point does not need it
+    psutil = None
+
+# Pyker re-runs itself through its launcher: `pyker` when installed, pyker.py in a checkout
+PYKER_DIR = os.path.dirname(os.path.abspath(__file__))
+PYKER_FILE = next((path for path in (os.path.join(PYKER_DIR, 'pyker'), os.path.join(PYKER_DIR, 'pyker.py'))
+                   if os.path.isfile(path)), os.path.abspath(__file__))
+BOOTSTRAP_FILE = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'pyker_bootstrap.py')
+ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*m')
+
+class Pyker:
+    # ANSI color constants
+    RESET = '\033[0m'
+    BOLD = '\033[1m'
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    YELLOW = '\033[93m'
+    CYAN = '\033[96m'
+    BLUE = '\033[94m'
+    
+    EVENTS_MAX_BYTES = 1024 * 1024
+    
+    # Arguments of start() that apply to one call only and are not kept in the process record
+    ONE_TIME_START_ARGS = ('self', 'name', 'queue', 'precompile')
+    
+    # Columns of machine-readable output
+    LIST_FIELDS = ['name', 'status', 'pid', 'cpu_percent', 'memory_mb', 'processes', 'restarts',
+                   'start_time', 'stop_time', 'script_path', 'auto_restart', 'cron', 'warnings', 'queued']
+    INFO_FIELDS = LIST_FIELDS + ['log_file', 'log_format', 'venv_path', 'python_exe', 'python_version', 'priority',
+                                 'watch', 'watch_ignore', 'stop_signal', 'kill_timeout', 'pre_stop', 'pre_stop_url',
+                                 'listen', 'idle_timeout', 'priority_class', 'oom_score_adj', 'nice', 'cpus',
+                                 'numa_nodes', 'importtime',
+                                 'first_output_seconds', 'slowest_imports', 'anomaly_action', 'memory_trend_mb_per_hour', 'telemetry', 'next_run', 'runs']
+    EVENT_FIELDS = ['time', 'name', 'event', 'pid', 'exit_code', 'message']
+    SYSTEM_FIELDS = ['total', 'running', 'stopped', 'scheduled', 'standby', 'queued', 'state_file', 'logs_dir', 'config_file',
+                     'supervisor_pid']
+    
+    def __init__(self):
+        self.state_file = Path.home() / ".pyker" / "processes.json"
+        self.state_lock_file = Path.home() / ".pyker" / "state.lock"
+        self.logs_dir = Path.home() / ".pyker" / "logs"
+        self.config_file = Path.home() / ".pyker" / "config.json"
+        self.status_file = Path.home() / ".pyker" / "status.json"
+        self.status_table = Path.home() / ".pyker" / "status.table"
+        self.supervisor_pid_file = Path.home() / ".pyker" / "supervisor.pid"
+        self.supervisor_log = Path.home() / ".pyker" / "supervisor.log"
+        self.profiles_dir = Path.home() / ".pyker" / "profiles"
+        self.telemetry_socket = Path.home() / ".pyker" / "telemetry.sock"
+        self.events_file = Path.home() / ".pyker" / "events.jsonl"
+        self.dump_file = Path.home() / ".pyker" / "dump.json"
+        self.spool_dir = Path.home() / ".pyker" / "spool"
+        self.rings_dir = Path.home() / ".pyker" / "rings"
+        self.startup_dir = Path.home() / ".pyker" / "startup"
+        self.interpreters_file = Path.home() / ".pyker" / "interpreters.json"
+        self.agent_token_file = Path.home() / ".pyker" / "agent.token"
+        self.systemd_unit = Path.home() / ".config" / "systemd" / "user" / "pyker.service"
+        self._ensure_dirs()
+        # Threads of one command take the state lock in turn, and a holder may save while holding it
+        self._state_mutex = threading.RLock()
+        self._state_lock_depth = 0
+        self.config = self._load_config()
+        self.processes = self._load_state()
+        self.anomalies = {}
+    
+    def _ensure_dirs(self):
+        """Create necessary directories"""
+        self.state_file.parent.mkdir(exist_ok=True)
+        self.logs_dir.mkdir(exist_ok=True)
+        self.profiles_dir.mkdir(exist_ok=True)
+        self.rings_dir.mkdir(mode=0o700, exist_ok=True)
+        self.startup_dir.mkdir(exist_ok=True)
+    
+    def _load_state(self):
+        """Load processes state from JSON file"""
+        state = {}
+        if self.state_file.exists():
+            try:
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+            except:
+                state = {}
+        # A save writes only what changed since this load, so it keeps what other commands saved meanwhile
+        self._state_base = copy.deepcopy(state)
+        return state
+    
+    @contextlib.contextmanager
+    def _state_lock(self):
+        """Hold the lock that serializes writes of the state file between the CLI and the supervisor"""
+        with self._state_mutex:
+            # flock is per open file, taking it again from the same command would wait for itself
+            if fcntl is None or self._state_lock_depth:
+                self._state_lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._state_lock_depth -= 1
+                return
+            with open(self.state_lock_file, 'a') as f:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                self._state_lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._state_lock_depth -= 1
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    
+    def _save_state(self):
+        """Save the changes made since the state was loaded on top of the state file as it is now"""
+        with self._state_lock():
+            current = {}
+            try:
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    current = json.load(f)
+            except (OSError, ValueError):
+                pass
+            merged = _merge_state(self._state_base, self.processes, current)
+            # Write to a temporary file first so the supervisor never reads a half-written state
+            tmp_file = self.state_file.with_suffix(f'.json.{os.getpid()}.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(merged, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.state_file)
+        
+        # Take over what the others changed, keeping the dicts callers still hold
+        for name in list(self.processes):
+            if name not in merged:
+                del self.processes[name]
+        for name, info in merged.items():
+            if name not in self.processes:
+                self.processes[name] = info
+            elif self.processes[name] is not info:
+                self.processes[name].clear()
+                self.processes[name].update(info)
+        self._state_base = copy.deepcopy(merged)
+    
+    def _load_config(self):
+        """Load configuration from JSON file"""
+        default_config = {
+            "log_rotation": {
+                "enabled": True,
+                "max_size_mb": 10,
+                "max_files": 5
+            },
+            "log_limits": {
+                "lines_per_second": 0,
+                "bytes_per_second": 0,
+                "burst_seconds": 5,
+                "quota_mb": 0
+            },
+            "log_sinks": [],
+            "log_ring": {
+                "size_kb": 64,
+                "all_processes": False
+            },
+            "process_check_interval": 5,
+            "auto_cleanup_stopped": False,
+            "stop": {
+                "signal": "SIGTERM",
+                "kill_timeout": 2,
+                "pre_stop_timeout": 10
+            },
+            "supervisor": {
+                "autostart": True
+            },
+            "crash_loop": {
+                "max_restarts": 5,
+                "window": 60
+            },
+            "hooks": [],
+            "hook_dispatch": {
+                "queue_size": 256,
+                "workers": 4,
+                "retries": 3,
+                "timeout": 10
+            },
+            "anomaly_detection": {
+                "enabled": True,
+                "action": "warn",
+                "trend_window": 120,
+                "memory_growth_mb_per_hour": 20,
+                "min_correlation": 0.9,
+                "cpu_spin_percent": 95,
+                "cpu_spin_seconds": 120
+            },
+            "telemetry": {
+                "interval": 5
+            },
+            "cron": {
+                "history": 20
+            },
+            "on_demand": {
+                "idle_timeout": 300
+            },
+            "admission": {
+                "enabled": True,
+                "min_available_mb": 256,
+                "memory_pressure": 10,
+                "cpu_pressure": 0,
+                "io_pressure": 0
+            },
+            "classes": {
+                "critical": {"oom_score_adj": -500, "nice": 0},
+                "normal": {"oom_score_adj": 0, "nice": 0},
+                "best-effort": {"oom_score_adj": 500, "nice": 10}
+            },
+            "placement": {
+                "enabled": False,
+                "cpus_per_process": 1
+            },
+            "resurrect": {
+                "concurrency": 8,
+                "grace": 1.0
+            },
+            "interpreters": {
+                "restart_on_change": True,
+                "settle_seconds": 10
+            },
+            "agent": {
+                "enabled": False,
+                "bind": "127.0.0.1",
+                "port": 7070
+            },
+            "watch": {
+                "debounce": 1.0,
+                "ignore": ["*.pyc", "*.pyo", "*.log", "*.tmp", "*.swp", "*~", ".git/*", "__pycache__/*"]
+            }
+        }
+        
+        if self.config_file.exists():
+            try:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
+                # Merge with defaults to ensure all keys exist
+                for key, value in default_config.items():
+                    if key not in config:
+                        config[key] = value
+                return config
+            except:
+                pass
+        
+        # Create default config file
+        self._save_config(default_config)
+        return default_config
+    
+    def _save_config(self, config):
+        """Save configuration to JSON file"""
+        with open(self.config_file, 'w', encoding='utf-8') as f:
+            json.dump(config, f, indent=2, ensure_ascii=False)
+    
+    def _record_event(self, name: str, event: str, message: str = '', pid: int = None, exit_code: int = None):
+        """Append a lifecycle event to the events file"""
+        record = {
+            'time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'name': name,
+            'event': event,
+            'pid': pid,
+            'exit_code': exit_code,
+            'message': message
+        }
+        try:
+            # Keep a single old file once the events file grows past the limit
+            if self.events_file.exists() and self.events_file.stat().st_size > self.EVENTS_MAX_BYTES:
+                os.replace(self.events_file, self.events_file.with_suffix('.jsonl.1'))
+            # One short append is written in one go, so the CLI and the supervisor can share the file
+            with open(self.events_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        except OSError:
+            pass
+    
+    def _update_process_status(self, name: str):
+        """Update process status"""
+        if name not in self.processes:
+            return
+        
+        process_info = self.processes[name]
+        pid = process_info.get('pid')
+        
+        if pid:
+            try:
+                process = psutil.Process(pid)
+                if process.is_running() and not self._pid_reused(process_info):
+                    process_info['status'] = 'running'
+                    # CPU needs two samples of the same process, only the supervisor takes them
+                    process_info['cpu_percent'] = None
+                    process_info['memory_mb'] = round(process.memory_info().rss / 1024 / 1024, 1)
+                else:
+                    self._mark_exited(process_info)
+            except psutil.NoSuchProcess:
+                self._mark_exited(process_info)
+        else:
+            process_info['status'] = self._idle_status(process_info)
+    
+    def _mark_exited(self, process_info: dict):
+        """Clear the PID of a process that is gone, leaving it for the supervisor to record the exit"""
+        if not process_info.get('stopping') and not process_info.get('cron'):
+            process_info['exited_pid'] = process_info['pid']
+        process_info['status'] = self._idle_status(process_info)
+        process_info['pid'] = None
+        if 'stop_time' not in process_info:
+            process_info['stop_time'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    def _update_tree_usage(self, skip=(), supervised: dict = None):
+        """Set CPU and memory of running processes to totals over their whole process tree"""
+        running = {name: info for name, info in self.processes.items()
+                   if info['status'] == 'running' and info.get('pid') and name not in skip}
+        if not running:
+            return
+        
+        # Prefer the supervisor's numbers, it measures CPU over the whole check interval
+        if supervised is None:
+            supervised = self._load_supervisor_status()
+        unsupervised = [info['pid'] for name, info in running.items()
+                        if supervised.get(name, {}).get('pid') != info['pid']]
+        usage = _tree_usage(unsupervised, _scan_processes()) if unsupervised else {}
+        
+        for name, info in running.items():
+            metrics = supervised.get(name)
+            if metrics and metrics['pid'] == info['pid']:
+                info['cpu_percent'] = metrics['cpu_percent']
+                info['memory_mb'] = metrics['memory_mb']
+                info['tree_processes'] = metrics.get('processes', 1)
+            elif info['pid'] in usage:
+                _, rss, count = usage[info['pid']]
+                info['cpu_percent'] = None
+                info['memory_mb'] = round(rss / 1024 / 1024, 1)
+                info['tree_processes'] = count
+    
+    @staticmethod
+    def _pid_reused(process_info: dict):
+        """Whether the host rebooted since the process was started, so its PID may belong to another process"""
+        try:
+            started = datetime.strptime(process_info.get('start_time') or '', "%Y-%m-%d %H:%M:%S").timestamp()
+        except ValueError:
+            return False
+        return started < psutil.boot_time()
+    
+    def _host_pressure(self):
+        """Why the host should not take another process right now, None if it has room"""
+        settings = self.config['admission']
+        available_mb = psutil.virtual_memory().available / 1024 / 1024
+        if available_mb < settings['min_available_mb']:
+            return f"{available_mb:.0f} MB memory available, minimum {settings['min_available_mb']:g} MB"
+        for resource in ('memory', 'cpu', 'io'):
+            limit = settings[f'{resource}_pressure']
+            stalled = _pressure_stall(resource) if limit else None
+            if stalled is not None and stalled >= limit:
+                return f"{resource} pressure {stalled:.1f}%, limit {limit:g}%"
+        return None
+    
+    def _class_settings(self, process_info: dict):
+        """oom_score_adj and nice value of the priority class of a process"""
+        settings = {'oom_score_adj': 0, 'nice': 0}
+        settings.update(self.config['classes'].get(process_info.get('priority_class') or 'normal', {}))
+        return settings
+    
+    def _placement_cpus(self, process_info: dict):
+        """Number of CPUs the placement engine pins a process to, 0 when it is not pinned"""
+        count = process_info.get('placement_cpus')
+        if count is None:
+            placement = self.config['placement']
+            count = placement['cpus_per_process'] if placement['enabled'] else 0
+        return count if hasattr(os, 'sched_setaffinity') else 0
+    
+    def _placement(self, running: dict):
+        """CPUs of the pinned processes among running ones (name -> info), replicas of a script spread over nodes"""
+        requests = [(name, info['script_path'], self._placement_cpus(info), info.get('cpus'))
+                    for name, info in running.items() if self._placement_cpus(info)]
+        return _plan_placement(_cpu_topology(), requests) if requests else {}
+    
+    @staticmethod
+    def _numa_nodes(cpus):
+        """NUMA nodes the CPUs belong to"""
+        return sorted({node for node, cores in _cpu_topology() for core in cores for cpu in core if cpu in cpus})
+    
+    def _idle_timeout(self, process_info: dict):
+        """Seconds an on-demand process may go without connections before it is stopped"""
+        return process_info.get('idle_timeout') or self.config['on_demand']['idle_timeout']
+    
+    @staticmethod
+    def _idle_status(process_info: dict):
+        """Status of a process that has no running PID"""
+        if process_info.get('queued'):
+            return 'queued'
+        if process_info.get('cron') and process_info.get('cron_enabled'):
+            return 'scheduled'
+        if process_info.get('listen') and process_info.get('listen_enabled'):
+            return 'standby'
+        return 'stopped'
+    
+    def _rotate_log_if_needed(self, log_file_path):
+        """Rotate log file if it exceeds maximum size"""
+        if not self.config['log_rotation']['enabled']:
+            return
+        
+        log_file = Path(log_file_path)
+        if not log_file.exists():
+            return
+        
+        max_size_bytes = self.config['log_rotation']['max_size_mb'] * 1024 * 1024
+        if log_file.stat().st_size <= max_size_bytes:
+            return
+        
+        _rotate_log(log_file, self.config['log_rotation']['max_files'])
+    
+    def _log_sinks(self, name: str):
+        """Configured log sinks that forward the output of a process"""
+        return [sink for sink in self.config['log_sinks']
+                if any(fnmatch.fnmatch(name, pattern) for pattern in sink.get('processes', ['*']))]
+    
+    def _log_limits(self, process_info: dict):
+        """Lines and bytes per second allowed into the log of a process, 0 for unlimited"""
+        defaults = self.config['log_limits']
+        lines = process_info.get('log_lines_per_sec')
+        size = process_info.get('log_bytes_per_sec')
+        return (defaults['lines_per_second'] if lines is None else lines,
+                defaults['bytes_per_second'] if size is None else size)
+    
+    def start(self, name: str, script_path: str, auto_restart: bool = False, venv_path: str = None,
+              anomaly_action: str = None, telemetry: bool = False, watch: list = None,
+              watch_ignore: list = None, cron: str = None, overlap: str = 'skip', priority: int = 0,
+              log_format: str = 'raw', log_lines_per_sec: float = None, log_bytes_per_sec: float = None,
+              stop_signal: str = None, kill_timeout: float = None, pre_stop: str = None, pre_stop_url: str = None,
+              listen: str = None, idle_timeout: float = None, priority_class: str = 'normal',
+              queue: bool = True, importtime: bool = False, precompile: bool = False, cpus: int = None,
+              inspect: bool = False):
+        """Start a process, or queue it while the host is under memory pressure"""
+        script_path = os.path.abspath(script_path)
+        # Restart, save and resurrect start the process again with the same arguments
+        options = {key: value for key, value in locals().items() if key not in self.ONE_TIME_START_ARGS}
+        
+        if stop_signal:
+            try:
+                stop_signal = options['stop_signal'] = self._signal_name(stop_signal)
+            except ValueError:
+                print(f"{self.RED}[ERROR]{self.RESET} Unknown stop signal: {stop_signal}")
+                return False
+        if kill_timeout is not None and kill_timeout < 0:
+            print(f"{self.RED}[ERROR]{self.RESET} --kill-timeout must not be negative")
+            return False
+        if pre_stop_url and not pre_stop_url.startswith(('http://', 'https://')):
+            print(f"{self.RED}[ERROR]{self.RESET} --pre-stop-url must be an http:// or https:// URL")
+            return False
+        
+        if log_format != 'raw' and os.name != 'posix':
+            print(f"{self.RED}[ERROR]{self.RESET} --log-format {log_format} is only supported on Linux and macOS")
+            return False
+        if importtime and os.name != 'posix':
+            print(f"{self.RED}[ERROR]{self.RESET} --importtime is only supported on Linux and macOS")
+            return False
+        if cpus is not None and cpus < 0:
+            print(f"{self.RED}[ERROR]{self.RESET} --cpus must not be negative")
+            return False
+        if cpus and not hasattr(os, 'sched_setaffinity'):
+            print(f"{self.RED}[ERROR]{self.RESET} --cpus is only supported on Linux")
+            return False
+        if (log_lines_per_sec or log_bytes_per_sec) and os.name != 'posix':
+            print(f"{self.RED}[ERROR]{self.RESET} Log rate limits are only supported on Linux and macOS")
+            return False
+        
+        # Watch the script directory when --watch is given without paths
+        if watch is not None:
+            watch = options['watch'] = [os.path.abspath(path) for path in watch] or [os.path.dirname(script_path)]
+            missing = [path for path in watch if not os.path.exists(path)]
+            if missing:
+                print(f"{self.RED}[ERROR]{self.RESET} Watch path not found: {missing[0]}")
+                return False
+        
+        if listen:
+            if cron:
+                print(f"{self.RED}[ERROR]{self.RESET} --listen cannot be combined with --cron")
+                return False
+            if os.name != 'posix':
+                print(f"{self.RED}[ERROR]{self.RESET} --listen is only supported on Linux and macOS")
+                return False
+            try:
+                host, port = _parse_listen(listen)
+            except ValueError as e:
+                print(f"{self.RED}[ERROR]{self.RESET} Invalid --listen address '{listen}': {e}")
+                return False
+            listen = options['listen'] = f"{host}:{port}"
+        if idle_timeout is not None and idle_timeout <= 0:
+            print(f"{self.RED}[ERROR]{self.RESET} --idle-timeout must be positive")
+            return False
+        
+        if cron:
+            try:
+                next_run = CronSchedule(cron).next_after(datetime.now())
+            except ValueError as e:
+                print(f"{self.RED}[ERROR]{self.RESET} Invalid cron expression '{cron}': {e}")
+                return False
+        
+        if not os.path.exists(script_path):
+            print(f"{self.RED}[ERROR]{self.RESET} File not found: {script_path}")
+            return False
+        
+        if not script_path.endswith('.py'):
+            print(f"{self.RED}[ERROR]{self.RESET} File must be a Python script: {script_path}")
+            return False
+        
+        # Check if process with this name is already running
+        if name in self.processes:
+            self._update_process_status(name)
+            if self.processes[name]['status'] == 'running':
+                print(f"{self.YELLOW}[WARNING]{self.RESET} Process '{name}' is already running")
+                return False
+        
+        # Create log file
+        log_file = self.logs_dir / f"{name}.log"
+        
+        # Determine Python executable (venv or system)
+        interpreter = self._resolve_interpreter(venv_path)
+        if not interpreter:
+            return False
+        options['venv_path'] = interpreter['venv_path']
+        
+        process_info = {
+            'pid': None,
+            'script_path': script_path,
+            'venv_path': interpreter['venv_path'],
+            'python_exe': interpreter['python_exe'],
+            'python_version': interpreter['version'],
+            'venv_fingerprint': interpreter['fingerprint'],
+            'status': 'running',
+            'start_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'log_file': str(log_file),
+            'auto_restart': auto_restart,
+            'anomaly_action': anomaly_action,
+            'telemetry': telemetry,
+            'watch': watch,
+            'watch_ignore': watch_ignore,
+            'priority': priority,
+            'log_format': log_format,
+            'log_lines_per_sec': log_lines_per_sec,
+            'log_bytes_per_sec': log_bytes_per_sec,
+            'stop_signal': stop_signal,
+            'kill_timeout': kill_timeout,
+            'pre_stop': pre_stop,
+            'pre_stop_url': pre_stop_url,
+            'listen': listen,
+            'idle_timeout': idle_timeout,
+            'priority_class': priority_class,
+            'placement_cpus': cpus,
+            'importtime': importtime,
+            'inspect': inspect,
+            'options': options,
+            'process_group': os.name == 'posix',
+            'cpu_percent': 0.0,
+            'memory_mb': 0.0
+        }
+        
+        if precompile:
+            self._precompile(process_info)
+        
+        # Scheduled jobs are spawned by the supervisor on every run
+        if cron:
+            process_info.update({
+                'status': 'scheduled',
+                'start_time': None,
+                'cron': cron,
+                'cron_enabled': True,
+                'overlap': overlap,
+                'runs': self.processes.get(name, {}).get('runs', [])
+            })
+            self.processes[name] = process_info
+            self._save_state()
+            self._record_event(name, 'scheduled', cron)
+            print(f"{self.GREEN}[SUCCESS]{self.RESET} Job '{name}' scheduled: {cron}")
+            print(f"{self.BLUE}[INFO]{self.RESET} Next run: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
+            print(f"{self.BLUE}[INFO]{self.RESET} Logs: {log_file}")
+            if self.config['supervisor']['autostart']:
+                self._ensure_supervisor()
+            else:
+                print(f"{self.YELLOW}[HINT]{self.RESET} Scheduled jobs need the supervisor: pyker supervisor start")
+            return True
+        
+        # On-demand processes are spawned by the supervisor when the first connection arrives
+        if listen:
+            previous = self.processes.get(name, {})
+            if not (previous.get('listen') == listen and previous.get('listen_enabled')):
+                try:
+                    _open_listener(listen).close()
+                except OSError as e:
+                    print(f"{self.RED}[ERROR]{self.RESET} Cannot listen on {listen}: {e}")
+                    return False
+            process_info.update({
+                'status': 'standby',
+                'start_time': None,
+                'listen_enabled': True
+            })
+            self.processes[name] = process_info
+            self._save_state()
+            self._record_event(name, 'standby', f"listening on {listen}")
+            idle = idle_timeout or self.config['on_demand']['idle_timeout']
+            print(f"{self.GREEN}[SUCCESS]{self.RESET} Process '{name}' waiting for connections on {listen}")
+            print(f"{self.BLUE}[INFO]{self.RESET} Started on the first connection, stopped after {idle:g}s without one")
+            print(f"{self.BLUE}[INFO]{self.RESET} Logs: {log_file}")
+            if self.config['supervisor']['autostart']:
+                self._ensure_supervisor()
+            else:
+                print(f"{self.YELLOW}[HINT]{self.RESET} On-demand processes need the supervisor: pyker supervisor start")
+            return True
+        
+        # Wait for room on the host instead of pushing it into swap; critical processes always start
+        if queue and priority_class != 'critical' and self.config['admission']['enabled']:
+            pressure = self._host_pressure()
+            if pressure:
+                process_info.update({
+                    'status': 'queued',
+                    'start_time': None,
+                    'queued': {'since': datetime.now().strftime("%Y-%m-%d %H:%M:%S"), 'reason': pressure}
+                })
+                self.processes[name] = process_info
+                self._save_state()
+                self._record_event(name, 'queued', pressure)
+                print(f"{self.YELLOW}[WARNING]{self.RESET} Host under pressure ({pressure}), process '{name}' queued")
+                print(f"{self.BLUE}[INFO]{self.RESET} The supervisor starts it once the host has room again")
+                if self.config['supervisor']['autostart']:
+                    self._ensure_supervisor()
+                else:
+                    print(f"{self.YELLOW}[HINT]{self.RESET} Queued processes need the supervisor: pyker supervisor start")
+                return True
+        
+        # Start process
+        try:
+            process = self._spawn(name, process_info)
+            
+            # Save process info
+            process_info['pid'] = process.pid
+            self.processes[name] = process_info
+            
+            self._save_state()
+            self._record_event(name, 'started', pid=process.pid)
+            print(f"{self.GREEN}[SUCCESS]{self.RESET} Process '{name}' started (PID: {process.pid})")
+            print(f"{self.BLUE}[INFO]{self.RESET} Logs: {log_file}")
+            if watch:
+                print(f"{self.BLUE}[INFO]{self.RESET} Watching for changes: {', '.join(watch)}")
+                if not self.config['supervisor']['autostart']:
+                    print(f"{self.YELLOW}[HINT]{self.RESET} Watch mode needs the supervisor: pyker supervisor start")
+            
+            if self.config['supervisor']['autostart']:
+                self._ensure_supervisor()
+            return True
+            
+        except Exception as e:
+            print(f"{self.RED}[ERROR]{self.RESET} Failed to start process: {e}")
+            return False
+    
+    def _precompile(self, process_info: dict):
+        """Write the bytecode of the script directory and the venv's packages once, before any replica starts"""
+        directories = [os.path.dirname(process_info['script_path'])]
+        # Without a venv the site-packages usually belong to the system and are not writable
+        code = ("import compileall, re, sys, sysconfig\n"
+                "dirs = sys.argv[1:]\n"
+                "if sys.prefix != sys.base_prefix:\n"
+                "    paths = sysconfig.get_paths()\n"
+                "    dirs += [paths['purelib'], paths['platlib']]\n"
+                "skip = re.compile(r'[/\\\\]\\.')\n"
+                "ok = [compileall.compile_dir(d, quiet=1, workers=0, rx=skip) for d in dict.fromkeys(dirs)]\n"
+                "sys.exit(0 if all(ok) else 1)\n")
+        print(f"{self.BLUE}[INFO]{self.RESET} Precompiling bytecode...")
+        began = time.monotonic()
+        result = subprocess.run([process_info['python_exe'], '-c', code] + directories,
+                                capture_output=True, text=True)
+        if result.returncode == 0:
+            print(f"{self.GREEN}[SUCCESS]{self.RESET} Bytecode up to date in {time.monotonic() - began:.1f}s")
+            return True
+        problems = [line for line in (result.stdout + result.stderr).splitlines() if line.strip()]
+        print(f"{self.YELLOW}[WARNING]{self.RESET} Some files could not be compiled"
+              + (f": {problems[-1]}" if problems else ""))
+        return False
+    
+    def _spawn(self, name: str, process_info: dict, listen_fd: int = None):
+        """Launch the script of a process with its output appended to the log file.
+        
+        listen_fd is the listening socket handed over to an on-demand process.
+        """
+        log_file = process_info['log_file']
+        
+        # Rotate log if needed
+        self._rotate_log_if_needed(log_file)
+        
+        # Features that work inside the script's interpreter are options of pyker's bootstrap
+        options = []
+        anomaly_action = process_info.get('anomaly_action') or self.config['anomaly_detection']['action']
+        if process_info.get('inspect') or anomaly_action == 'dump':
+            options += ['--inspect', '1']
+        if process_info.get('telemetry'):
+            options += ['--telemetry', str(self.telemetry_socket),
+                        '--telemetry-interval', str(self.config['telemetry']['interval'])]
+        if os.name == 'posix':
+            settings = self._class_settings(process_info)
+            if settings['oom_score_adj']:
+                options += ['--oom-score-adj', str(settings['oom_score_adj'])]
+            if settings['nice']:
+                options += ['--nice', str(settings['nice'])]
+        if self._placement_cpus(process_info):
+            # Keep the CPUs of the previous run where they are still free
+            process_info.setdefault('cpus', self.processes.get(name, {}).get('cpus'))
+            running = {other: info for other, info in self.processes.items() if info.get('pid') and other != name}
+            running[name] = process_info
+            process_info['cpus'] = self._placement(running)[name]
+            options += ['--cpus', ','.join(map(str, process_info['cpus']))]
+        pass_fds = ()
+        if listen_fd is not None:
+            options += ['--listen-fd', str(listen_fd)]
+            pass_fds = (listen_fd,)
+        
+        # Without any of them the script runs as plain `python script.py`, pyker adds nothing to its memory
+        command = [process_info['python_exe'], '-u'] + (['-X', 'importtime'] if process_info.get('importtime') else [])
+        if options or process_info.get('importtime'):
+            if not os.path.exists(BOOTSTRAP_FILE):
+                raise FileNotFoundError(f"{BOOTSTRAP_FILE} is missing, reinstall pyker")
+            command += [BOOTSTRAP_FILE] + options
+        command.append(process_info['script_path'])
+        # Only processes with the inspection hooks handle SIGUSR1 and SIGUSR2, others would be killed
+        process_info['bootstrap'] = '--inspect' in options
+        
+        # Formatting, rate limits, forwarding, the in-memory ring and import times need a reader
+        # between the script and its log
+        if (process_info.get('log_format', 'raw') != 'raw' or any(self._log_limits(process_info))
+                or self._log_sinks(name) or self.config['log_ring']['all_processes'] or process_info.get('importtime')):
+            return self._spawn_captured(name, command, process_info, pass_fds)
+        
+        # Open log file for writing
+        log_handle = open(log_file, 'a', encoding='utf-8')
+        
+        try:
+            # A new session makes the script the leader of its own process group,
+            # so stop can signal every process it spawned
+            return subprocess.Popen(
+                command,
+                stdout=log_handle,
+                stderr=subprocess.STDOUT,
+                cwd=os.path.dirname(process_info['script_path']) or '.',
+                start_new_session=(os.name == 'posix'),
+                pass_fds=pass_fds
+            )
+        finally:
+            log_handle.close()
+    
+    def _spawn_captured(self, name: str, command: list, process_info: dict, pass_fds: tuple = ()):
+        """Launch a script with separate stdout and stderr pipes, read by a capture process that writes the log"""
+        lines_per_second, bytes_per_second = self._log_limits(process_info)
+        rotation = self.config['log_rotation']
+        stdout_read, stdout_write = os.pipe()
+        stderr_read, stderr_write = os.pipe()
+        options = {
+            'format': process_info.get('log_format', 'raw'),
+            'stdout-fd': stdout_read,
+            'stderr-fd': stderr_read,
+            'lines-per-second': lines_per_second,
+            'bytes-per-second': bytes_per_second,
+            'burst': self.config['log_limits']['burst_seconds'],
+            'max-bytes': rotation['max_size_mb'] * 1024 * 1024 if rotation['enabled'] else 0,
+            'max-files': rotation['max_files'],
+            'name': name,
+            'sinks': json.dumps(self._log_sinks(name)),
+            'spool-dir': self.spool_dir,
+            'ring-size': int(self.config['log_ring']['size_kb'] * 1024),
+            'ring-socket': self.rings_dir / f"{name}.sock",
+            'import-times': self.startup_dir / f"{name}.importtime" if process_info.get('importtime') else '',
+            'startup-file': self.startup_dir / f"{name}.json",
+            'started': time.time()
+        }
+        command_options = [str(part) for key, value in options.items() for part in (f'--{key}', value)]
+        try:
+            # In its own session the reader is not signalled by stop, it exits once the script closed both pipes
+            capture = subprocess.Popen(
+                [sys.executable, '-u', PYKER_FILE, '_capture'] + command_options + [process_info['log_file']],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                pass_fds=(stdout_read, stderr_read),
+                start_new_session=True
+            )
+            process_info['capture_pid'] = capture.pid
+            
+            return subprocess.Popen(
+                command,
+                stdout=stdout_write,
+                stderr=stderr_write,
+                cwd=os.path.dirname(process_info['script_path']) or '.',
+                start_new_session=True,
+                pass_fds=pass_fds
+            )
+        finally:
+            for fd in (stdout_read, stdout_write, stderr_read, stderr_write):
+                os.close(fd)
+    
+    def stop(self, name: str):
+        """Stop a process"""
+        return self.stop_many([name])
+    
+    def stop_many(self, names: list, wait: bool = True):
+        """Stop processes at the same time, each with its own stop signal, kill timeout and pre-stop hooks.
+        
+        Without wait the processes are only signalled, the supervisor kills them at their deadline.
+        """
+        ok = True
+        pending = []
+        for name in names:
+            if name not in self.processes:
+                print(f"{self.RED}[ERROR]{self.RESET} Process '{name}' not found")
+                ok = False
+                continue
+            
+            # Never signal a PID that was reused after a reboot
+            self._update_process_status(name)
+            process_info = self.processes[name]
+            pid = process_info.get('pid')
+            
+            # Stopping a job also cancels its schedule
+            if process_info.get('cron') and process_info.get('cron_enabled'):
+                process_info['cron_enabled'] = False
+                if not pid:
+                    process_info['status'] = 'stopped'
+                # Save before terminating so the supervisor does not start a queued run
+                self._save_state()
+                if not pid:
+                    self._record_event(name, 'unscheduled')
+                    print(f"{self.GREEN}[SUCCESS]{self.RESET} Job '{name}' unscheduled")
+                    continue
+            
+            # Stopping a queued process takes it out of the queue
+            if process_info.get('queued'):
+                del process_info['queued']
+                process_info['status'] = self._idle_status(process_info)
+                self._save_state()
+                self._record_event(name, 'unqueued')
+                print(f"{self.GREEN}[SUCCESS]{self.RESET} Process '{name}' removed from the start queue")
+                continue
+            
+            # Stopping an on-demand process also closes its socket
+            if process_info.get('listen') and process_info.get('listen_enabled'):
+                process_info['listen_enabled'] = False
+                if not pid:
+                    process_info['status'] = 'stopped'
+                self._save_state()
+                if not pid:
+                    self._record_event(name, 'stopped', f"no longer listening on {process_info['listen']}")
+                    print(f"{self.GREEN}[SUCCESS]{self.RESET} Process '{name}' no longer listening on {process_info['listen']}")
+                    continue
+            
+            if not pid:
+                print(f"{self.YELLOW}[WARNING]{self.RESET} Process '{name}' is already stopped")
+                continue
+            if process_info.get('stopping'):
+                print(f"{self.YELLOW}[WARNING]{self.RESET} Process '{name}' is already stopping")
+                continue
+            pending.append(name)
+        
+        if not pending:
+            return ok
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # Hooks run at the same time so that one slow drain does not hold up the others
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            problems = list(executor.map(self._run_pre_stop, pending, [self.processes[name] for name in pending]))
+        
+        stopping = {}
+        for name, problem in zip(pending, problems):
+            if problem:
+                print(f"{self.YELLOW}[WARNING]{self.RESET} Pre-stop hook of '{name}': {problem}")
+            try:
+                stopping[name] = self._begin_stop(name, os.getpid() if wait else None)
+            except psutil.NoSuchProcess:
+                self._finish_stop(name, message='process was already terminated')
+            except Exception as e:
+                self.processes[name].pop('stopping', None)
+                print(f"{self.RED}[ERROR]{self.RESET} Failed to stop process: {e}")
+                ok = False
+        self._save_state()
+        
+        if not wait:
+            for name in stopping:
+                stop_signal, kill_timeout = self._stop_policy(self.processes[name])
+                print(f"{self.BLUE}[INFO]{self.RESET} Sent {stop_signal} to '{name}', "
+                      f"it is killed if still running after {kill_timeout:g}s")
+            if stopping and not self._ensure_supervisor():
+                return False
+            return ok
+        
+        self._wait_stopped(stopping)
+        return ok
+    
+    def _stop_policy(self, process_info: dict):
+        """Stop signal and kill timeout of a process, falling back to the config defaults"""
+        defaults = self.config['stop']
+        kill_timeout = process_info.get('kill_timeout')
+        return (process_info.get('stop_signal') or defaults['signal'],
+                defaults['kill_timeout'] if kill_timeout is None else kill_timeout)
+    
+    @staticmethod
+    def _signal_name(value: str):
+        """Normalize 'int', 'SIGINT' or '2' to 'SIGINT'"""
+        value = str(value).strip().upper()
+        if value.isdigit():
+            return signal.Signals(int(value)).name
+        name = value if value.startswith('SIG') else 'SIG' + value
+        if not isinstance(getattr(signal, name, None), signal.Signals):
+            raise ValueError(f"unknown signal {value}")
+        return name
+    
+    def _run_pre_stop(self, name: str, process_info: dict):
+        """Run the pre-stop command and HTTP call of a process, returns what went wrong or None"""
+        timeout = self.config['stop']['pre_stop_timeout']
+        problems = []
+        
+        if process_info.get('pre_stop'):
+            env = dict(os.environ, PYKER_NAME=name, PYKER_PID=str(process_info.get('pid') or ''))
+            try:
+                result = subprocess.run(process_info['pre_stop'], shell=True, env=env, timeout=timeout,
+                                        cwd=os.path.dirname(process_info['script_path']),
+                                        stdin=subprocess.DEVNULL, capture_output=True, text=True, errors='replace')
+                if result.returncode:
+                    output = (result.stderr or result.stdout).strip().splitlines()
+                    problems.append(f"command exited with code {result.returncode}"
+                                    + (f": {output[-1]}" if output else ""))
+            except subprocess.TimeoutExpired:
+                problems.append(f"command did not finish in {timeout}s")
+            except OSError as e:
+                problems.append(f"command failed: {e}")
+        
+        if process_info.get('pre_stop_url'):
+            # urllib pulls in http, email and ssl, only hooks that call a URL pay for them
+            import urllib.error
+            import urllib.request
+            body = json.dumps({'name': name, 'pid': process_info.get('pid')}).encode('utf-8')
+            request = urllib.request.Request(process_info['pre_stop_url'], data=body, method='POST',
+                                             headers={'Content-Type': 'application/json'})
+            try:
+                with urllib.request.urlopen(request, timeout=timeout) as response:
+                    response.read()
+            except (urllib.error.URLError, OSError, ValueError) as e:
+                problems.append(f"request to {process_info['pre_stop_url']} failed: {e}")
+        
+        return '; '.join(problems) or None
+    
+    def _begin_stop(self, name: str, waiter: int = None, restart: bool = False):
+        """Send the stop signal to a process tree and record the deadline for killing it.
+        
+        The waiter is the PID that finishes the stop; without a live waiter the supervisor does.
+        Returns the signalled processes.
+        """
+        process_info = self.processes[name]
+        stop_signal, kill_timeout = self._stop_policy(process_info)
+        process_info['stopping'] = {
+            'pid': process_info['pid'],
+            'signal': stop_signal,
+            'kill_timeout': kill_timeout,
+            'deadline': time.time() + kill_timeout,
+            'waiter': waiter,
+            'restart': restart
+        }
+        return self._signal_tree(process_info['pid'], process_info.get('process_group', False),
+                                 getattr(signal, stop_signal))
+    
+    def _wait_stopped(self, stopping: dict):
+        """Wait for all stopping process trees at once, killing each one at its own deadline"""
+        roots = {name: processes[0] for name, processes in stopping.items()}
+        while stopping:
+            gone, _ = psutil.wait_procs([process for processes in stopping.values() for process in processes],
+                                        timeout=0.1)
+            now = time.time()
+            for name in list(stopping):
+                state = self.processes[name]['stopping']
+                alive = [process for process in stopping[name] if process not in gone]
+                message = ''
+                if alive and now >= state['deadline']:
+                    self._kill_tree(state['pid'], self.processes[name].get('process_group', False), alive)
+                    psutil.wait_procs(alive, timeout=2)
+                    message = f"killed after {state['kill_timeout']:g}s"
+                elif alive:
+                    stopping[name] = alive
+                    continue
+                del stopping[name]
+                self._finish_stop(name, getattr(roots[name], 'returncode', None), message)
+    
+    def _finish_stop(self, name: str, exit_code: int = None, message: str = ''):
+        """Record a process as stopped once its process tree is gone"""
+        process_info = self.processes[name]
+        pid = (process_info.pop('stopping', None) or {}).get('pid') or process_info.get('pid')
+        process_info['status'] = 'stopped'
+        process_info['pid'] = None
+        process_info['stop_time'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._save_state()
+        self._record_event(name, 'stopped', message, pid=pid, exit_code=exit_code)
+        
+        details = f" ({message})" if message else ""
+        print(f"{self.GREEN}[SUCCESS]{self.RESET} Process '{name}' stopped{details}")
+    
+    def _signal_tree(self, pid: int, process_group: bool, signum: int):
+        """Send a signal to a process and all its descendants, returns the signalled processes"""
+        root = psutil.Process(pid)
+        try:
+            processes = [root] + root.children(recursive=True)
+        except psutil.NoSuchProcess:
+            processes = [root]
+        
+        # Signal the whole group at once, then descendants that left it (e.g. with setsid)
+        grouped = set()
+        if process_group and hasattr(os, 'killpg'):
+            try:
+                os.killpg(pid, signum)
+                grouped = {process.pid for process in processes if self._process_group(process.pid) == pid}
+            except OSError:
+                pass
+        for process in processes:
+            if process.pid not in grouped:
+                try:
+                    process.send_signal(signum)
+                except psutil.NoSuchProcess:
+                    pass
+        return processes
+    
+    def _kill_tree(self, pid: int, process_group: bool, processes: list):
+        """SIGKILL what is left of a process tree"""
+        if process_group and hasattr(os, 'killpg'):
+            try:
+                os.killpg(pid, signal.SIGKILL)
+            except OSError:
+                pass
+        for process in processes:
+            try:
+                process.kill()
+            except psutil.NoSuchProcess:
+                pass
+    
+    def _terminate_tree(self, pid: int, process_group: bool, timeout: float = 2, signum: int = signal.SIGTERM):
+        """Terminate a process together with all its descendants.
+        
+        Returns the exit code of the top process when it is a child of this process.
+        """
+        processes = self._signal_tree(pid, process_group, signum)
+        
+        # Wait for graceful shutdown
+        _, alive = psutil.wait_procs(processes, timeout=timeout)
+        if alive:
+            self._kill_tree(pid, process_group, alive)
+            psutil.wait_procs(alive, timeout=2)
+        
+        return getattr(processes[0], 'returncode', None)
+    
+    @staticmethod
+    def _process_group(pid: int):
+        try:
+            return os.getpgid(pid)
+        except OSError:
+            return None
+    
+    def restart(self, name: str):
+        """Restart a process"""
+        if name not in self.processes:
+            print(f"{self.RED}[ERROR]{self.RESET} Process '{name}' not found")
+            return False
+        
+        # Stop first
+        if self.processes[name].get('pid'):
+            print(f"{self.BLUE}[INFO]{self.RESET} Stopping process '{name}'...")
+            self.stop(name)
+        
+        return self._start_again(name)
+    
+    def _start_again(self, name: str):
+        """Start a stopped process with its previous options, counting it as a restart"""
+        process_info = self.processes[name]
+        print(f"{self.BLUE}[INFO]{self.RESET} Starting process '{name}'...")
+        started = self._start_with_options(name)
+        
+        if started:
+            self.processes[name]['restarts'] = process_info.get('restarts', 0) + 1
+            self._save_state()
+            self._record_event(name, 'restarted', f"restart #{self.processes[name]['restarts']}",
+                               pid=self.processes[name].get('pid'))
+        return started
+    
+    def _start_with_options(self, name: str, queue: bool = True):
+        """Start a process with the options it was last started with"""
+        return self.start(name, queue=queue, **self._start_options(self.processes[name]))
+    
+    def _start_options(self, info: dict):
+        """Arguments of start() a process record was created with"""
+        if 'options' in info:
+            return dict(info['options'])
+        # Records written before the options were kept have them as fields
+        import inspect
+        fields = dict(info, cpus=info.get('placement_cpus'))
+        return {key: fields[key] for key in inspect.signature(self.start).parameters
+                if key in fields and key not in self.ONE_TIME_START_ARGS}
+    
+    def delete(self, name: str):
+        """Delete a process from the list"""
+        if name not in self.processes:
+            print(f"{self.RED}[ERROR]{self.RESET} Process '{name}' not found")
+            return False
+        
+        # Stop first
+        self.stop(name)
+        
+        # Remove from list
+        del self.processes[name]
+        self._save_state()
+        self._record_event(name, 'deleted')
+        
+        print(f"{self.GREEN}[SUCCESS]{self.RESET} Process '{name}' deleted")
+        return True
+    
+    def _refresh_processes(self):
+        """Update status and resource usage of all processes and load supervisor warnings"""
+        # Processes the supervisor saw running with the same PID need no check of their own
+        table = self._load_status_table()
+        published = set()
+        before = {name: (info.get('pid'), info['status']) for name, info in self.processes.items()}
+        for name, info in self.processes.items():
+            row = table.get(name)
+            if row and row['status'] == 'running' and row['pid'] == info.get('pid'):
+                info.update(status='running', cpu_percent=row['cpu_percent'], memory_mb=row['memory_mb'],
+                            tree_processes=row['processes'])
+                published.add(name)
+            else:
+                self._update_process_status(name)
+        # status.json is written with the table, it has no numbers for processes the table does not show running
+        self._update_tree_usage(skip=published, supervised={} if table else None)
+        
+        # Usage numbers are not worth a write of the state file, only processes found gone are
+        if any((info.get('pid'), info['status']) != before.get(name) for name, info in self.processes.items()):
+            self._save_state()
+        # The warning messages are only in status.json, which is not needed when the table flags none
+        if table and not any(row['anomalies'] for row in table.values()):
+            self.anomalies = {}
+        else:
+            self.anomalies = self._load_anomalies()
+    
+    def list_processes(self, output: str = 'text'):
+        """Show list of processes in table format"""
+        if not self.processes and output == 'text':
+            print(f"{self.YELLOW}No processes{self.RESET}")
+            return
+        
+        self._refresh_processes()
+        
+        if output != 'text':
+            writer = RecordWriter(output, self.LIST_FIELDS)
+            for name, info in self.processes.items():
+                writer.write(self._process_record(name, info))
+            writer.close()
+            return
+        
+        print(f"\n{self.BOLD}{self.CYAN}Process List:{self.RESET}")
+        
+        # Piped output keeps one fixed layout instead of following the terminal width
+        if not sys.stdout.isatty():
+            self._print_table(25, 12, 5, 7, 19, 19, 30)
+            return
+        
+        # Get terminal size
+        try:
+            import shutil
+            terminal_width = shutil.get_terminal_size().columns
+        except:
+            terminal_width = 120  # Fallback for wider display
+        
+        # Minimum column sizes (no separate status column now)
+        min_name_width = 10  # Increased to fit status symbol + name
+        min_pid_width = 8    # Increased for long PIDs
+        min_cpu_width = 5
+        min_mem_width = 7
+        min_start_width = 19  # Increased for full date format
+        min_stop_width = 19   # Increased for full date format
+        min_script_width = 8
+        
+        # Base table width (borders + minimum columns, no status column)
+        base_width = 8 + min_name_width + min_pid_width + min_cpu_width + min_mem_width + min_start_width + min_stop_width + min_script_width
+        
+        # If terminal is too narrow - compact output (need at least 45 chars for compact table)
+        if terminal_width < max(base_width, 45):
+            self._show_compact_list()
+            return
+        
+        # Distribute available space
+        available_width = terminal_width - 8  # 8 characters for borders
+        
+        # Priority distribution of width
+        name_width = min(20, min_name_width + (available_width - base_width + 8) // 7)
+        pid_width = min(12, min_pid_width)  # Max 12 chars for PID
+        cpu_width = min_cpu_width
+        mem_width = min_mem_width
+        start_width = min(19, min_start_width + (available_width - base_width + 8) // 5)
+        stop_width = min(19, min_stop_width + (available_width - base_width + 8) // 5)
+        script_width = available_width - name_width - pid_width - cpu_width - mem_width - start_width - stop_width
+        
+        # Limit maximum sizes
+        name_width = max(min_name_width, min(name_width, 25))
+        start_width = max(min_start_width, min(start_width, 19))
+        stop_width = max(min_stop_width, min(stop_width, 19))
+        script_width = max(min_script_width, script_width)
+        
+        self._print_table(name_width, pid_width, cpu_width, mem_width, start_width, stop_width, script_width)
+    
+    def _show_compact_list(self):
+        """Compact table output for narrow terminals"""
+        # Fixed widths for compact mode
+        name_width = 18  # Status symbol + name
+        pid_width = 10
+        script_width = 15
+        
+        # Top border
+        print("┌" + "─" * name_width + "┬" + "─" * pid_width + "┬" + "─" * script_width + "┐")
+        
+        # Header
+        print(f"│{self.BOLD}{'Name':<{name_width}}{self.RESET}│{self.BOLD}{'PID':<{pid_width}}{self.RESET}│{self.BOLD}{'Script':<{script_width}}{self.RESET}│")
+        
+        # Separator line
+        print("├" + "─" * name_width + "┼" + "─" * pid_width + "┼" + "─" * script_width + "┤")
+        
+        for name, info in self.processes.items():
+            status = info['status']
+            pid = info.get('pid') or '-'
+            script = os.path.basename(info.get('script_path', ''))
+            
+            # Status symbols
+            if status == 'running' and name in self.anomalies:
+                status_symbol = f"{self.YELLOW}⚠{self.RESET}"
+            elif status == 'running':
+                status_symbol = f"{self.GREEN}✓{self.RESET}"
+            elif status == 'stopped':
+                status_symbol = f"{self.RED}✗{self.RESET}"
+            elif status == 'scheduled':
+                status_symbol = f"{self.CYAN}◷{self.RESET}"
+            elif status == 'standby':
+                status_symbol = f"{self.CYAN}◌{self.RESET}"
+            elif status == 'queued':
+                status_symbol = f"{self.YELLOW}◔{self.RESET}"
+            else:
+                status_symbol = f"{self.YELLOW}⚠{self.RESET}"
+            
+            # Truncate long values
+            pid_str = str(pid)[:pid_width-1] if len(str(pid)) >= pid_width else str(pid)
+            name_display = name[:name_width-3] if len(name) >= name_width-2 else name  # -3 for symbol and space
+            script_display = script[:script_width-1] if len(script) >= script_width else script
+            
+            # Format name with status symbol
+            name_with_status = f"{status_symbol} {name_display}"
+            name_padded = name_with_status + " " * (name_width - len(name_display) - 2)  # -2 for symbol and space
+            
+            print(f"│{name_padded}│{pid_str:<{pid_width}}│{script_display:<{script_width}}│")
+        
+        # Bottom border
+        print("└" + "─" * name_width + "┴" + "─" * pid_width + "┴" + "─" * script_width + "┘")
+        
+        # Statistics
+        running = sum(1 for p in self.processes.values() if p['status'] == 'running')
+        stopped = sum(1 for p in self.processes.values() if p['status'] == 'stopped')
+        scheduled = sum(1 for p in self.processes.values() if p['status'] == 'scheduled')
+        scheduled_display = f" | {self.CYAN}Scheduled:{self.RESET} {scheduled}" if scheduled else ""
+        standby = sum(1 for p in self.processes.values() if p['status'] == 'standby')
+        scheduled_display += f" | {self.CYAN}Standby:{self.RESET} {standby}" if standby else ""
+        queued = sum(1 for p in self.processes.values() if p['status'] == 'queued')
+        scheduled_display += f" | {self.YELLOW}Queued:{self.RESET} {queued}" if queued else ""
+        print(f"\n{self.BOLD}Total:{self.RESET} {len(self.processes)} | {self.GREEN}Running:{self.RESET} {running} | {self.RED}Stopped:{self.RESET} {stopped}{scheduled_display}")
+        self._print_anomalies()
+        self._print_queue()
+    
+    def _print_table(self, name_width, pid_width, cpu_width, mem_width, start_width, stop_width, script_width):
+        """Print full table with given column sizes"""
+        # Top border
+        print("┌" + "─" * name_width + "┬" + "─" * pid_width + 
+              "┬" + "─" * cpu_width + "┬" + "─" * mem_width + "┬" + "─" * start_width + 
+              "┬" + "─" * stop_width + "┬" + "─" * script_width + "┐")
+        
+        # Header
+        print(f"│{self.BOLD}{'Name':<{name_width}}{self.RESET}│{self.BOLD}{'PID':<{pid_width}}{self.RESET}│{self.BOLD}{'CPU%':<{cpu_width}}{self.RESET}│{self.BOLD}{'RAM':<{mem_width}}{self.RESET}│{self.BOLD}{'Started':<{start_width}}{self.RESET}│{self.BOLD}{'Stopped':<{stop_width}}{self.RESET}│{self.BOLD}{'Script':<{script_width}}{self.RESET}│")
+        
+        # Separator line
+        print("├" + "─" * name_width + "┼" + "─" * pid_width + 
+              "┼" + "─" * cpu_width + "┼" + "─" * mem_width + "┼" + "─" * start_width + 
+              "┼" + "─" * stop_width + "┼" + "─" * script_width + "┤")
+        
+        for name, info in self.processes.items():
+            status = info['status']
+            pid = info.get('pid') or '-'
+            cpu = info.get('cpu_percent')
+            memory = info.get('memory_mb') or 0.0
+            start_time = info.get('start_time', '')
+            stop_time = info.get('stop_time', '')
+            script = os.path.basename(info.get('script_path', ''))
+            
+            # Status symbols and colors
+            if status == 'running' and name in self.anomalies:
+                status_symbol = f"{self.YELLOW}⚠{self.RESET}"
+                status_color = self.YELLOW
+            elif status == 'running':
+                status_symbol = f"{self.GREEN}✓{self.RESET}"
+                status_color = self.GREEN
+            elif status == 'stopped':
+                status_symbol = f"{self.RED}✗{self.RESET}"
+                status_color = self.RED
+            elif status == 'scheduled':
+                status_symbol = f"{self.CYAN}◷{self.RESET}"
+                status_color = self.CYAN
+            elif status == 'standby':
+                status_symbol = f"{self.CYAN}◌{self.RESET}"
+                status_color = self.CYAN
+            elif status == 'queued':
+                status_symbol = f"{self.YELLOW}◔{self.RESET}"
+                status_color = self.YELLOW
+            else:
+                status_symbol = f"{self.YELLOW}⚠{self.RESET}"
+                status_color = self.YELLOW
+            
+            # Format times - show only time part if same day, full date if different
+            start_display = self._format_time(start_time, start_width)
+            stop_display = self._format_time(stop_time, stop_width) if stop_time else "-"
+            
+            # Format CPU and memory
+            cpu_str = f"{cpu:.1f}" if isinstance(cpu, (int, float)) else "-"
+            mem_str = f"{memory:.1f}" if isinstance(memory, (int, float)) else "0.0"
+            
+            # Truncate long values
+            name_display = name[:name_width-3] if len(name) >= name_width-2 else name  # -3 for symbol and space
+            script_display = script[:script_width-1] if len(script) >= script_width else script
+            
+            # Handle long PIDs by truncating
+            pid_str = str(pid)
+            if len(pid_str) > pid_width:
+                pid_str = pid_str[:pid_width-3] + "..."
+            
+            # Colored PID for running processes
+            pid_colored = f"{status_color}{pid_str}{self.RESET}" if status == 'running' else pid_str
+            
+            # Format name with status symbol
+            name_with_status = f"{status_symbol} {name_display}"
+            name_padded = name_with_status + " " * (name_width - len(name_display) - 2)  # -2 for symbol and space
+            pid_padded = pid_colored + " " * (pid_width - len(pid_str))
+            
+            print(f"│{name_padded}│{pid_padded}│{cpu_str:<{cpu_width}}│{mem_str:<{mem_width}}│{start_display:<{start_width}}│{stop_display:<{stop_width}}│{script_display:<{script_width}}│")
+        
+        # Bottom border
+        print("└" + "─" * name_width + "┴" + "─" * pid_width + 
+              "┴" + "─" * cpu_width + "┴" + "─" * mem_width + "┴" + "─" * start_width + 
+              "┴" + "─" * stop_width + "┴" + "─" * script_width + "┘")
+        
+        # Statistics
+        running = sum(1 for p in self.processes.values() if p['status'] == 'running')
+        stopped = sum(1 for p in self.processes.values() if p['status'] == 'stopped')
+        
+        scheduled = sum(1 for p in self.processes.values() if p['status'] == 'scheduled')
+        scheduled_display = f" | {self.CYAN}Scheduled: {scheduled}{self.RESET}" if scheduled else ""
+        standby = sum(1 for p in self.processes.values() if p['status'] == 'standby')
+        scheduled_display += f" | {self.CYAN}Standby: {standby}{self.RESET}" if standby else ""
+        queued = sum(1 for p in self.processes.values() if p['status'] == 'queued')
+        scheduled_display += f" | {self.YELLOW}Queued: {queued}{self.RESET}" if queued else ""
+        
+        print(f"\n{self.BOLD}Statistics:{self.RESET} Total: {self.BLUE}{len(self.processes)}{self.RESET} | {self.GREEN}Running: {running}{self.RESET} | {self.RED}Stopped: {stopped}{self.RESET}{scheduled_display}")
+        self._print_anomalies()
+        self._print_queue()
+    
+    def _process_record(self, name: str, info: dict, supervised: dict = None):
+        """Machine-readable fields of a process, with the extra info fields when supervisor metrics are given"""
+        running = info['status'] == 'running'
+        record = {
+            'name': name,
+            'status': info['status'],
+            'pid': info.get('pid'),
+            'cpu_percent': info.get('cpu_percent', 0.0) if running else 0.0,
+            'memory_mb': info.get('memory_mb', 0.0) if running else 0.0,
+            'processes': info.get('tree_processes', 1) if running else 0,
+            'restarts': info.get('restarts', 0),
+            'start_time': info.get('start_time'),
+            'stop_time': info.get('stop_time'),
+            'script_path': info.get('script_path'),
+            'auto_restart': info.get('auto_restart', False),
+            'cron': info.get('cron'),
+            'warnings': [anomaly['message'] for anomaly in self.anomalies.get(name, [])],
+            'queued': info['queued']['reason'] if info.get('queued') else None
+        }
+        if supervised is None:
+            return record
+        
+        next_run = None
+        if info.get('cron') and info.get('cron_enabled'):
+            next_run = CronSchedule(info['cron']).next_after(datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
+        record.update({
+            'log_file': info.get('log_file'),
+            'venv_path': info.get('venv_path'),
+            'python_exe': info.get('python_exe'),
+            'python_version': info.get('python_version'),
+            'priority': info.get('priority', 0),
+            'log_format': info.get('log_format', 'raw'),
+            'watch': info.get('watch'),
+            'watch_ignore': info.get('watch_ignore'),
+            'stop_signal': self._stop_policy(info)[0],
+            'kill_timeout': self._stop_policy(info)[1],
+            'pre_stop': info.get('pre_stop'),
+            'pre_stop_url': info.get('pre_stop_url'),
+            'listen': info.get('listen'),
+            'idle_timeout': self._idle_timeout(info) if info.get('listen') else None,
+            'priority_class': info.get('priority_class') or 'normal',
+            'oom_score_adj': self._class_settings(info)['oom_score_adj'],
+            'nice': self._class_settings(info)['nice'],
+            'cpus': info.get('cpus') if info.get('pid') else None,
+            'numa_nodes': self._numa_nodes(info['cpus']) if info.get('pid') and info.get('cpus') else None,
+            'importtime': info.get('importtime', False),
+            'first_output_seconds': [start['first_output'] for start in self._startup_history(name)],
+            'slowest_imports': [{'module': module, 'self_us': own, 'cumulative_us': cumulative}
+                                for module, own, cumulative in self._slowest_imports(name)],
+            'anomaly_action': info.get('anomaly_action') or self.config['anomaly_detection']['action'],
+            'memory_trend_mb_per_hour': supervised.get('memory_trend_mb_per_hour'),
+            'telemetry': supervised.get('telemetry'),
+            'next_run': next_run,
+            'runs': info.get('runs', [])
+        })
+        return record
+    
+    def _info_record(self, name: str):
+        """Machine-readable info of a process including the metrics of the supervisor"""
+        self.anomalies = self._load_anomalies()
+        info = self.processes[name]
+        supervised = self._load_supervisor_status().get(name, {})
+        if supervised.get('pid') != info.get('pid'):
+            supervised = {}
+        return self._process_record(name, info, supervised)
+    
+    def _startup_history(self, name: str):
+        """Time to first output of the last starts of a process, oldest first"""
+        try:
+            with open(self.startup_dir / f"{name}.json", 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+    
+    def _slowest_imports(self, name: str, count: int = 10):
+        """Top-level imports of the script from its last -X importtime run, slowest first"""
+        _, imports = _parse_import_times(self.startup_dir / f"{name}.importtime")
+        top = sorted((entry for entry in imports if entry[3] == 0), key=lambda entry: entry[2], reverse=True)
+        return [(module, own, cumulative) for module, own, cumulative, _ in top[:count]]
+    
+    def _print_startup(self, name: str, info: dict):
+        """Print how long the last starts took to produce output and which imports were slowest"""
+        starts = self._startup_history(name)
+        if starts:
+            previous = ', '.join(f"{start['first_output']:.2f}s" for start in reversed(starts[-5:-1]))
+            print(f"{self.BOLD}Time to first output:{self.RESET} {starts[-1]['first_output']:.2f}s"
+                  + (f" (previous starts: {previous})" if previous else ""))
+        if not info.get('importtime'):
+            return
+        bootstrap, imports = _parse_import_times(self.startup_dir / f"{name}.importtime")
+        if not imports:
+            print(f"{self.BOLD}Slowest imports:{self.RESET} no import times recorded yet")
+            return
+        total = sum(entry[2] for entry in imports if entry[3] == 0)
+        own = sum(entry[2] for entry in bootstrap if entry[3] == 0)
+        print(f"{self.BOLD}Slowest imports:{self.RESET} {total / 1000:.0f} ms in the script's imports "
+              f"({own / 1000:.0f} ms in pyker's)")
+        for module, _, cumulative in self._slowest_imports(name):
+            print(f"  {cumulative / 1000:8.1f} ms  {module}")
+    
+    def _print_queue(self):
+        """Print why queued processes are waiting, in the order the supervisor starts them"""
+        queued = [name for name in self._start_queue() if self.processes[name]['status'] == 'queued']
+        if not queued:
+            return
+        
+        print(f"\n{self.BOLD}{self.YELLOW}Start queue:{self.RESET}")
+        for position, name in enumerate(queued, 1):
+            waiting = self.processes[name]['queued']
+            print(f"  {position}. {name} ({self.processes[name].get('priority_class') or 'normal'}) "
+                  f"since {waiting['since']}: {waiting['reason']}")
+    
+    def _start_queue(self):
+        """Names of queued processes, most important class first, then by priority and time queued"""
+        ranks = {'critical': 0, 'normal': 1, 'best-effort': 2}
+        queued = [name for name, info in self.processes.items() if info.get('queued')]
+        return sorted(queued, key=lambda name: (ranks.get(self.processes[name].get('priority_class'), 1),
+                                                -self.processes[name].get('priority', 0),
+                                                self.processes[name]['queued']['since']))
+    
+    def _print_anomalies(self):
+        """Print warnings reported by the supervisor below the process table"""
+        if not self.anomalies:
+            return
+        
+        print(f"\n{self.BOLD}{self.YELLOW}Warnings:{self.RESET}")
+        for name, anomalies in self.anomalies.items():
+            for anomaly in anomalies:
+                print(f"  {self.YELLOW}⚠{self.RESET} {name}: {anomaly['message']}")
+    
+    def _format_time(self, time_str, max_width):
+        """Format time string to fit in column"""
+        if not time_str:
+            return "-"
+        
+        try:
+            # Try to parse the time
+            if 'T' in time_str:  # ISO format
+                dt = datetime.fromisoformat(time_str.replace('T', ' '))
+            else:
+                dt = datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S")
+            
+            # Always show date and time for clarity
+            if max_width >= 19:
+                # Full format: 2025-08-19 01:42:48
+                formatted = dt.strftime("%Y-%m-%d %H:%M:%S")
+            elif max_width >= 16:
+                # Abbreviated: 08-19 01:42:48
+                formatted = dt.strftime("%m-%d %H:%M:%S")
+            elif max_width >= 14:
+                # Short: 08-19 01:42
+                formatted = dt.strftime("%m-%d %H:%M")
+            else:
+                # Very short: 08-19
+                formatted = dt.strftime("%m-%d")
+            
+            return formatted[:max_width] if len(formatted) > max_width else formatted
+        except:
+            # Fallback: just truncate the original string
+            return time_str[:max_width]
+    
+    def logs(self, name: str, lines: int = 50, follow: bool = False):
+        """Show process logs"""
+        if name not in self.processes:
+            print(f"{self.RED}[ERROR]{self.RESET} Process '{name}' not found")
+            return
+        
+        log_file = Path(self.processes[name].get('log_file', ''))
+        
+        if not log_file.exists():
+            print(f"{self.YELLOW}[WARNING]{self.RESET} No logs found for process '{name}'")
+            return
+        
+        # Recent output is answered from the memory of the capture process when it holds enough of it
+        if not follow:
+            recent, complete = self._recent_output(name, lines)
+            if complete:
+                print(f"{self.CYAN}[LOGS]{self.RESET} Last {lines} lines from process '{name}':")
+                print("─" * 80)
+                if self.processes[name].get('log_format') == 'jsonl':
+                    for line in recent:
+                        self._print_jsonl_line(line)
+                else:
+                    print('\n'.join(recent) + '\n' if recent else "No logs available")
+                return
+        
+        # JSON lines logs are shown in the same layout as the text capture format
+        if self.processes[name].get('log_format') == 'jsonl':
+            return self._show_jsonl_logs(name, log_file, lines, follow)
+        
+        if follow:
+            print(f"{self.CYAN}[LOGS]{self.RESET} Following logs for process '{name}' (Ctrl+C to exit):")
+            print("─" * 80)
+            
+            # Show last lines first
+            try:
+                result = subprocess.run(['tail', '-n', str(lines), str(log_file)], 
+                                      capture_output=True, text=True)
+                if result.stdout:
+                    print(result.stdout, end='')
+            except:
+                pass
+            
+            # Follow new lines
+            try:
+                subprocess.run(['tail', '-f', str(log_file)])
+            except KeyboardInterrupt:
+                print(f"\n{self.YELLOW}[INFO]{self.RESET} Stopped")
+        else:
+            print(f"{self.CYAN}[LOGS]{self.RESET} Last {lines} lines from process '{name}':")
+            print("─" * 80)
+            
+            try:
+                result = subprocess.run(['tail', '-n', str(lines), str(log_file)], 
+                                      capture_output=True, text=True)
+                if result.stdout:
+                    print(result.stdout)
+                else:
+                    print("No logs available")
+            except Exception as e:
+                print(f"{self.RED}[ERROR]{self.RESET} Failed to read logs: {e}")
+    
+    def _recent_output(self, name: str, lines: int):
+        """Last lines of output kept in memory by the capture process of a process.
+        
+        Returns the lines and whether they are all the lines asked for, or (None, False) without a ring.
+        """
+        if not hasattr(socket, 'AF_UNIX'):
+            return None, False
+        chunks = []
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(1)
+                sock.connect(str(self.rings_dir / f"{name}.sock"))
+                sock.sendall(f"{lines}\n".encode())
+                while True:
+                    chunk = sock.recv(65536)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+        except OSError:
+            return None, False
+        header, _, body = b''.join(chunks).partition(b'\n')
+        return body.decode('utf-8', errors='replace').split('\n')[:-1], header == b'complete'
+    
+    def _show_jsonl_logs(self, name: str, log_file: Path, lines: int, follow: bool):
+        """Print log records written by the jsonl capture format"""
+        if follow:
+            print(f"{self.CYAN}[LOGS]{self.RESET} Following logs for process '{name}' (Ctrl+C to exit):")
+        else:
+            print(f"{self.CYAN}[LOGS]{self.RESET} Last {lines} lines from process '{name}':")
+        print("─" * 80)
+        
+        command = ['tail', '-n', str(lines)] + (['-f'] if follow else []) + [str(log_file)]
+        try:
+            with subprocess.Popen(command, stdout=subprocess.PIPE, text=True, errors='replace') as tail:
+                for line in tail.stdout:
+                    self._print_jsonl_line(line)
+        except KeyboardInterrupt:
+            print(f"\n{self.YELLOW}[INFO]{self.RESET} Stopped")
+        except Exception as e:
+            print(f"{self.RED}[ERROR]{self.RESET} Failed to read logs: {e}")
+    
+    def _print_jsonl_line(self, line: str):
+        """Print one jsonl log record in the layout of the text capture format"""
+        try:
+            record = json.loads(line)
+            stream = f"{self.RED}[stderr]{self.RESET}" if record['stream'] == 'stderr' else "[stdout]"
+            print(f"{record['time']} {stream} {record['line']}", flush=True)
+        except (ValueError, KeyError, TypeError):
+            print(line.rstrip('\n'), flush=True)
+    
+    def info(self, name: str = None, output: str = 'text'):
+        """Show detailed process information"""
+        if name:
+            # Show info for specific process
+            if name not in self.processes:
+                print(f"{self.RED}[ERROR]{self.RESET} Process '{name}' not found",
+                      file=sys.stdout if output == 'text' else sys.stderr)
+                return
+            
+            self._update_process_status(name)
+            self._update_tree_usage()
+            info = self.processes[name]
+            
+            if output != 'text':
+                RecordWriter.single(output, self.INFO_FIELDS, self._info_record(name))
+                return
+            
+            # Status symbol
+            status = info['status']
+            if status == 'running':
+                status_display = f"{self.GREEN}✓ Running{self.RESET}"
+            elif status == 'stopped':
+                status_display = f"{self.RED}✗ Stopped{self.RESET}"
+            elif status == 'scheduled':
+                status_display = f"{self.CYAN}◷ Scheduled{self.RESET}"
+            elif status == 'standby':
+                status_display = f"{self.CYAN}◌ Standby{self.RESET}"
+            elif status == 'queued':
+                status_display = f"{self.YELLOW}◔ Queued{self.RESET} since {info['queued']['since']}: {info['queued']['reason']}"
+            else:
+                status_display = f"{self.YELLOW}⚠ Error{self.RESET}"
+            
+            print(f"\n{self.BOLD}{self.CYAN}Process Information: {name}{self.RESET}")
+            print(f"{self.BOLD}Status:{self.RESET} {status_display}")
+            print(f"{self.BOLD}PID:{self.RESET} {info.get('pid', '-')}")
+            print(f"{self.BOLD}Script:{self.RESET} {info.get('script_path', '-')}")
+            cpu = info.get('cpu_percent', 0.0)
+            print(f"{self.BOLD}CPU Usage:{self.RESET} {f'{cpu:.1f}%' if cpu is not None else '- (needs the supervisor)'}")
+            print(f"{self.BOLD}Memory:{self.RESET} {info.get('memory_mb', 0.0):.1f} MB")
+            if info.get('tree_processes', 1) > 1:
+                print(f"{self.BOLD}Processes:{self.RESET} {info['tree_processes']} (usage includes all child processes)")
+            
+            supervised = self._load_supervisor_status().get(name, {})
+            if supervised.get('memory_trend_mb_per_hour') is not None:
+                print(f"{self.BOLD}Memory trend:{self.RESET} {supervised['memory_trend_mb_per_hour']:+.1f} MB/h")
+            for anomaly in supervised.get('anomalies', []):
+                print(f"{self.BOLD}Warning:{self.RESET} {self.YELLOW}⚠ {anomaly['message']}{self.RESET}")
+            if supervised.get('telemetry'):
+                self._print_telemetry(supervised['telemetry'])
+            elif info.get('telemetry') and status == 'running':
+                print(f"{self.BOLD}Telemetry:{self.RESET} waiting for data from the process")
+            
+            start_time = info.get('start_time', '')
+            if start_time:
+                print(f"{self.BOLD}Started:{self.RESET} {start_time}")
+            
+            stop_time = info.get('stop_time', '')
+            if stop_time:
+                print(f"{self.BOLD}Stopped:{self.RESET} {stop_time}")
+            
+            log_file = info.get('log_file', '')
+            if log_file:
+                print(f"{self.BOLD}Log file:{self.RESET} {log_file}")
+            if info.get('log_format', 'raw') != 'raw':
+                print(f"{self.BOLD}Log format:{self.RESET} {info['log_format']} (stdout and stderr captured separately)")
+            lines_per_second, bytes_per_second = self._log_limits(info)
+            if lines_per_second or bytes_per_second:
+                limits = []
+                if lines_per_second:
+                    limits.append(f"{lines_per_second:g} lines/s")
+                if bytes_per_second:
+                    limits.append(f"{bytes_per_second / 1024:g} KB/s")
+                print(f"{self.BOLD}Log rate limit:{self.RESET} {', '.join(limits)}")
+            
+            auto_restart = info.get('auto_restart', False)
+            print(f"{self.BOLD}Auto restart:{self.RESET} {'Yes' if auto_restart else 'No'}")
+            stop_signal, kill_timeout = self._stop_policy(info)
+            print(f"{self.BOLD}Stop:{self.RESET} {stop_signal}, killed after {kill_timeout:g}s")
+            if info.get('pre_stop'):
+                print(f"{self.BOLD}Pre-stop:{self.RESET} {info['pre_stop']}")
+            if info.get('pre_stop_url'):
+                print(f"{self.BOLD}Pre-stop URL:{self.RESET} {info['pre_stop_url']}")
+            if info.get('listen'):
+                listening = 'listening' if info.get('listen_enabled') else 'not listening'
+                print(f"{self.BOLD}On demand:{self.RESET} {info['listen']} ({listening}), "
+                      f"stopped after {self._idle_timeout(info):g}s idle")
+            if info.get('stopping') and status == 'running':
+                remaining = max(0, info['stopping']['deadline'] - time.time())
+                print(f"{self.BOLD}Stopping:{self.RESET} {self.YELLOW}{info['stopping']['signal']} sent, "
+                      f"killed in {remaining:.0f}s{self.RESET}")
+            print(f"{self.BOLD}Restarts:{self.RESET} {info.get('restarts', 0)}")
+            settings = self._class_settings(info)
+            applied = ''
+            if status == 'running' and info.get('pid'):
+                try:
+                    oom_score_adj = Path(f"/proc/{info['pid']}/oom_score_adj").read_text().strip()
+                    applied = f", now {oom_score_adj}"
+                except OSError:
+                    pass
+            print(f"{self.BOLD}Class:{self.RESET} {info.get('priority_class') or 'normal'} "
+                  f"(oom_score_adj {settings['oom_score_adj']}{applied}, nice {settings['nice']})")
+            if status == 'running' and info.get('cpus'):
+                nodes = self._numa_nodes(info['cpus'])
+                print(f"{self.BOLD}CPUs:{self.RESET} {_format_cpu_list(info['cpus'])} "
+                      f"(NUMA node{'s' if len(nodes) > 1 else ''} {', '.join(map(str, nodes))})")
+            if info.get('priority'):
+                print(f"{self.BOLD}Priority:{self.RESET} {info['priority']}")
+            
+            if info.get('watch'):
+                print(f"{self.BOLD}Watching:{self.RESET} {', '.join(info['watch'])}")
+                if info.get('watch_ignore'):
+                    print(f"{self.BOLD}Watch ignore:{self.RESET} {', '.join(info['watch_ignore'])}")
+            
+            anomaly_action = info.get('anomaly_action') or self.config['anomaly_detection']['action']
+            print(f"{self.BOLD}Anomaly action:{self.RESET} {anomaly_action}")
+            self._print_startup(name, info)
+            
+            if info.get('cron'):
+                self._print_schedule(info)
+            
+            venv_path = info.get('venv_path')
+            if venv_path:
+                print(f"{self.BOLD}Virtual env:{self.RESET} {venv_path}")
+                python_exe = info.get('python_exe')
+                if python_exe:
+                    print(f"{self.BOLD}Python executable:{self.RESET} {python_exe}")
+                fingerprint = info.get('venv_fingerprint')
+                if fingerprint and status == 'running' and _venv_fingerprint(venv_path)[0] != fingerprint:
+                    print(f"{self.BOLD}Warning:{self.RESET} {self.YELLOW}⚠ Virtual env changed since the process started{self.RESET}")
+            else:
+                print(f"{self.BOLD}Virtual env:{self.RESET} System Python")
+            if info.get('python_version'):
+                print(f"{self.BOLD}Python version:{self.RESET} {info['python_version']}")
+            
+            recent, _ = self._recent_output(name, 5) if status == 'running' else (None, False)
+            if recent:
+                print(f"{self.BOLD}Recent output:{self.RESET}")
+                for line in recent:
+                    if info.get('log_format') == 'jsonl':
+                        print("  ", end='')
+                        self._print_jsonl_line(line)
+                    else:
+                        print(f"  {line}")
+        else:
+            # Show overall system info
+            for name in self.processes:
+                self._update_process_status(name)
+            
+            running = sum(1 for p in self.processes.values() if p['status'] == 'running')
+            stopped = sum(1 for p in self.processes.values() if p['status'] == 'stopped')
+            
+            if output != 'text':
+                scheduled = sum(1 for p in self.processes.values() if p['status'] == 'scheduled')
+                RecordWriter.single(output, self.SYSTEM_FIELDS, {
+                    'total': len(self.processes),
+                    'running': running,
+                    'stopped': stopped,
+                    'scheduled': scheduled,
+                    'standby': sum(1 for p in self.processes.values() if p['status'] == 'standby'),
+                    'queued': sum(1 for p in self.processes.values() if p['status'] == 'queued'),
+                    'state_file': str(self.state_file),
+                    'logs_dir': str(self.logs_dir),
+                    'config_file': str(self.config_file),
+                    'supervisor_pid': self._supervisor_pid()
+                })
+                return
+            
+            print(f"\n{self.BOLD}{self.CYAN}Pyker System Information{self.RESET}")
+            print(f"{self.BOLD}Total processes:{self.RESET} {self.BLUE}{len(self.processes)}{self.RESET}")
+            print(f"{self.BOLD}Running:{self.RESET} {self.GREEN}{running}{self.RESET}")
+            print(f"{self.BOLD}Stopped:{self.RESET} {self.RED}{stopped}{self.RESET}")
+            print(f"{self.BOLD}State file:{self.RESET} {self.state_file}")
+            print(f"{self.BOLD}Logs directory:{self.RESET} {self.logs_dir}")
+            print(f"{self.BOLD}Config file:{self.RESET} {self.state_file.parent / 'config.json'}")
+            
+            supervisor_pid = self._supervisor_pid()
+            if supervisor_pid:
+                print(f"{self.BOLD}Supervisor:{self.RESET} {self.GREEN}Running{self.RESET} (PID: {supervisor_pid})")
+            else:
+                print(f"{self.BOLD}Supervisor:{self.RESET} {self.RED}Stopped{self.RESET}")
+    
+    def events(self, lines: int = 20, follow: bool = False, name: str = None, output: str = 'text'):
+        """Show recent lifecycle events, optionally waiting for new ones"""
+        writer = RecordWriter(output, self.EVENT_FIELDS) if output != 'text' else None
+        
+        def parse(line):
+            try:
+                event = json.loads(line)
+            except ValueError:
+                return None
+            return event if not name or event.get('name') == name else None
+        
+        def emit(event):
+            if writer:
+                writer.write(event)
+            else:
+                self._print_event(event)
+        
+        # Last events of the current file; older events are in the rotated file
+        position = 0
+        inode = None
+        recent = []
+        if self.events_file.exists():
+            with open(self.events_file, 'r', encoding='utf-8') as f:
+                recent = [event for event in map(parse, f) if event]
+                position = f.tell()
+                inode = os.fstat(f.fileno()).st_ino
+        if not recent and not follow and not writer:
+            print(f"{self.YELLOW}No events recorded{self.RESET}")
+        for event in recent[-lines:] if lines > 0 else []:
+            emit(event)
+        
+        try:
+            while follow:
+                time.sleep(0.5)
+                try:
+                    stat = self.events_file.stat()
+                except OSError:
+                    continue
+                # Start over when the file was rotated
+                if stat.st_ino != inode or stat.st_size < position:
+                    inode = stat.st_ino
+                    position = 0
+                if stat.st_size == position:
+                    continue
+                with open(self.events_file, 'r', encoding='utf-8') as f:
+                    f.seek(position)
+                    for line in f:
+                        if not line.endswith('\n'):
+                            break
+                        position += len(line.encode('utf-8'))
+                        event = parse(line)
+                        if event:
+                            emit(event)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if writer:
+                writer.close()
+    
+    def _print_event(self, event: dict):
+        colors = {'started': self.GREEN, 'restarted': self.GREEN, 'run_started': self.GREEN,
+                  'stopped': self.RED, 'exited': self.RED, 'deleted': self.RED,
+                  'anomaly': self.YELLOW, 'run_skipped': self.YELLOW,
+                  'scheduled': self.CYAN, 'unscheduled': self.CYAN, 'standby': self.CYAN,
+                  'activated': self.GREEN, 'idle': self.CYAN, 'queued': self.YELLOW, 'unqueued': self.CYAN,
+                  'crash_loop': self.RED}
+        details = []
+        if event.get('pid'):
+            details.append(f"PID {event['pid']}")
+        if event.get('exit_code') is not None:
+            details.append(f"exit {event['exit_code']}")
+        if event.get('message'):
+            details.append(event['message'])
+        color = colors.get(event['event'], self.BLUE)
+        print(f"{event['time']}  {self.BOLD}{event['name']}{self.RESET}  "
+              f"{color}{event['event']}{self.RESET}  {', '.join(details)}", flush=True)
+    
+    def _print_schedule(self, info: dict):
+        """Print schedule and recent runs of a job"""
+        print(f"{self.BOLD}Schedule:{self.RESET} {info['cron']} (overlap: {info.get('overlap', 'skip')})")
+        if info.get('cron_enabled'):
+            next_run = CronSchedule(info['cron']).next_after(datetime.now())
+            print(f"{self.BOLD}Next run:{self.RESET} {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
+        else:
+            print(f"{self.BOLD}Next run:{self.RESET} - (unscheduled, use 'pyker restart' to resume)")
+        
+        runs = info.get('runs', [])
+        if not runs:
+            return
+        print(f"{self.BOLD}Recent runs:{self.RESET}")
+        for run in runs[-5:]:
+            if run.get('skipped'):
+                result = f"{self.YELLOW}skipped (previous run still active){self.RESET}"
+            elif run.get('exit_code') == 0:
+                result = f"{self.GREEN}exit 0{self.RESET} in {run['duration']:.1f}s"
+            else:
+                result = f"{self.RED}exit {run.get('exit_code')}{self.RESET} in {run['duration']:.1f}s"
+            print(f"  {run['started']}  {result}")
+    
+    def _print_telemetry(self, telemetry: dict):
+        """Print interpreter statistics streamed by a process with telemetry enabled"""
+        print(f"{self.BOLD}Threads:{self.RESET} {telemetry['threads']}")
+        
+        collections = telemetry['gc_collections']
+        gc_color = self.YELLOW if telemetry['gc_pause_percent'] >= 5 else ''
+        print(f"{self.BOLD}GC:{self.RESET} {sum(collections)} collections "
+              f"(gen0 {collections[0]} / gen1 {collections[1]} / gen2 {collections[2]}), "
+              f"paused {telemetry['gc_pause_ms']:.1f} ms total, max {telemetry['gc_max_pause_ms']:.1f} ms, "
+              f"{gc_color}{telemetry['gc_pause_percent']:.1f}% of recent time{self.RESET}")
+        
+        if telemetry['loop_lag_ms'] is not None:
+            lag_color = self.YELLOW if telemetry['loop_lag_ms'] >= 100 else ''
+            print(f"{self.BOLD}Event loop lag:{self.RESET} {lag_color}{telemetry['loop_lag_ms']:.1f} ms{self.RESET}")
+    
+    def profile(self, name: str, duration: int = 30, rate: int = 100):
+        """Profile a running process with the in-process sampling profiler"""
+        output = self.profiles_dir / f"{name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.folded"
+        request = {'type': 'profile', 'duration': duration, 'rate': rate}
+        
+        print(f"{self.BLUE}[INFO]{self.RESET} Profiling '{name}' for {duration}s at {rate} Hz (Ctrl+C to detach)...")
+        if not self._request_from_process(name, request, output):
+            return False
+        
+        self._print_profile_summary(output)
+        print(f"{self.GREEN}[SUCCESS]{self.RESET} Profile saved: {output}")
+        print(f"{self.BLUE}[INFO]{self.RESET} Render with flamegraph.pl or open in https://www.speedscope.app")
+        return True
+    
+    def allocations(self, name: str, duration: int = 10, top: int = 10):
+        """Show the top memory allocators of a running process using tracemalloc"""
+        output = self.profiles_dir / f"{name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.allocations.json"
+        request = {'type': 'allocations', 'duration': duration, 'top': top}
+        
+        print(f"{self.BLUE}[INFO]{self.RESET} Tracing allocations of '{name}' for {duration}s...")
+        if not self._request_from_process(name, request, output):
+            return False
+        
+        with open(output, 'r', encoding='utf-8') as f:
+            allocations = json.load(f)
+        output.unlink()
+        
+        print(f"\n{self.BOLD}{self.CYAN}Top allocators of '{name}' (memory still allocated after {duration}s):{self.RESET}")
+        if not allocations:
+            print("No allocations recorded")
+        for allocation in allocations:
+            print(f"  {allocation['size_kb']:10.1f} KB  {allocation['count']:8} blocks  {allocation['location']}")
+        print()
+        return True
+    
+    def _request_from_process(self, name: str, request: dict, output: Path):
+        """Ask a bootstrapped process to write a report to output and wait for it"""
+        if name not in self.processes:
+            print(f"{self.RED}[ERROR]{self.RESET} Process '{name}' not found")
+            return False
+        
+        self._update_process_status(name)
+        info = self.processes[name]
+        pid = info.get('pid')
+        if info['status'] != 'running':
+            print(f"{self.RED}[ERROR]{self.RESET} Process '{name}' is not running")
+            return False
+        
+        if not hasattr(signal, 'SIGUSR2'):
+            print(f"{self.RED}[ERROR]{self.RESET} This feature is not supported on this platform")
+            return False
+        
+        if not info.get('bootstrap'):
+            print(f"{self.RED}[ERROR]{self.RESET} Process '{name}' was not started with --inspect")
+            print(f"{self.YELLOW}[HINT]{self.RESET} Start it again with it: pyker stop {name} && "
+                  f"pyker start {name} {info['script_path']} --inspect")
+            return False
+        
+        request_file = self.profiles_dir / f"{pid}.request"
+        with open(request_file, 'w', encoding='utf-8') as f:
+            json.dump(dict(request, output=str(output)), f)
+        
+        try:
+            os.kill(pid, signal.SIGUSR2)
+        except OSError as e:
+            request_file.unlink()
+            print(f"{self.RED}[ERROR]{self.RESET} Failed to signal process: {e}")
+            return False
+        
+        # The report is written by the process itself, wait for it to appear
+        deadline = time.monotonic() + request['duration'] + 10
+        try:
+            while not output.exists():
+                if time.monotonic() > deadline or not psutil.pid_exists(pid):
+                    if request_file.exists():
+                        request_file.unlink()
+                    print(f"{self.RED}[ERROR]{self.RESET} Process '{name}' did not respond")
+                    return False
+                time.sleep(0.2)
+        except KeyboardInterrupt:
+            print(f"\n{self.YELLOW}[INFO]{self.RESET} Detached, report will be written to {output}")
+            return False
+        
+        return True
+    
+    def _print_profile_summary(self, profile_file: Path, top: int = 10):
+        """Print functions with the most samples on top of the stack"""
+        total = 0
+        own_samples = {}
+        with open(profile_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                stack, _, count = line.rstrip('\n').rpartition(' ')
+                count = int(count)
+                total += count
+                leaf = stack.rsplit(';', 1)[-1]
+                own_samples[leaf] = own_samples.get(leaf, 0) + count
+        
+        if not total:
+            print(f"{self.YELLOW}[WARNING]{self.RESET} No samples collected")
+            return
+        
+        print(f"\n{self.BOLD}{self.CYAN}Top functions ({total} samples):{self.RESET}")
+        for function, count in sorted(own_samples.items(), key=lambda item: item[1], reverse=True)[:top]:
+            print(f"  {count * 100.0 / total:5.1f}%  {function}")
+        print()
+    
+    def monit(self):
+        """Show the live dashboard"""
+        try:
+            import curses  # noqa: F401
+        except ImportError:
+            print(f"{self.RED}[ERROR]{self.RESET} The dashboard needs the curses module, which is not available")
+            return False
+        
+        if not sys.stdout.isatty():
+            print(f"{self.RED}[ERROR]{self.RESET} The dashboard needs an interactive terminal")
+            return False
+        
+        # Live metrics come from the supervisor
+        if self.config['supervisor']['autostart']:
+            self._ensure_supervisor()
+        
+        try:
+            Monitor(self).run()
+        except KeyboardInterrupt:
+            pass
+        return True
+    
+    def _load_supervisor_status(self):
+        """Load per-process metrics published by the supervisor, empty if it is not running"""
+        if not self._supervisor_pid() or not self.status_file.exists():
+            return {}
+        try:
+            with open(self.status_file, 'r', encoding='utf-8') as f:
+                status = json.load(f)
+        except:
+            return {}
+        
+        # Ignore metrics the supervisor has not refreshed for a few check intervals
+        if time.time() - status.get('updated', 0) > self.config['process_check_interval'] * 3:
+            return {}
+        return status.get('processes', {})
+    
+    def _load_status_table(self):
+        """Rows of the shared status table by process name, empty if the supervisor has not refreshed it"""
+        table = StatusTable.read(self.status_table)
+        if not table or time.time() - table[0] > self.config['process_check_interval'] * 3:
+            return {}
+        return table[1]
+    
+    def _load_anomalies(self):
+        """Get supervisor-reported anomalies of running processes"""
+        anomalies = {}
+        for name, metrics in self._load_supervisor_status().items():
+            info = self.processes.get(name)
+            if metrics.get('anomalies') and info and info.get('pid') == metrics.get('pid'):
+                anomalies[name] = metrics['anomalies']
+        return anomalies
+    
+    def _supervisor_pid(self):
+        """Get PID of the running supervisor or None"""
+        try:
+            pid = int(self.supervisor_pid_file.read_text().strip())
+            process = psutil.Process(pid)
+            if process.is_running() and 'supervisor' in process.cmdline():
+                return pid
+        except (OSError, ValueError, psutil.Error):
+            pass
+        return None
+    
+    def _ensure_supervisor(self):
+        """Start the supervisor in the background unless it is already running"""
+        if self._supervisor_pid():
+            return True
+        
+        try:
+            log_handle = open(self.supervisor_log, 'a', encoding='utf-8')
+            subprocess.Popen(
+                [sys.executable, '-u', PYKER_FILE, 'supervisor', 'run'],
+                stdin=subprocess.DEVNULL,
+                stdout=log_handle,
+                stderr=subprocess.STDOUT,
+                cwd=str(Path.home()),
+                start_new_session=(os.name == 'posix')
+            )
+            return True
+        except Exception as e:
+            print(f"{self.YELLOW}[WARNING]{self.RESET} Failed to start supervisor: {e}")
+            return False
+    
+    def supervisor(self, action: str, resurrect: bool = False):
+        """Manage the background supervisor"""
+        pid = self._supervisor_pid()
+        
+        if action == 'run':
+            if pid and pid != os.getpid():
+                print(f"{self.YELLOW}[WARNING]{self.RESET} Supervisor is already running (PID: {pid})")
+                return False
+            Supervisor(self, resurrect=resurrect).run()
+            return True
+        
+        if action == 'start':
+            if pid:
+                print(f"{self.YELLOW}[WARNING]{self.RESET} Supervisor is already running (PID: {pid})")
+                return True
+            if self._ensure_supervisor():
+                print(f"{self.GREEN}[SUCCESS]{self.RESET} Supervisor started")
+                print(f"{self.BLUE}[INFO]{self.RESET} Logs: {self.supervisor_log}")
+                return True
+            return False
+        
+        if action == 'stop':
+            if not pid:
+                print(f"{self.YELLOW}[WARNING]{self.RESET} Supervisor is not running")
+                return True
+            try:
+                process = psutil.Process(pid)
+                process.terminate()
+                process.wait(timeout=10)
+            except psutil.NoSuchProcess:
+                pass
+            except psutil.TimeoutExpired:
+                print(f"{self.RED}[ERROR]{self.RESET} Supervisor did not stop in time")
+                return False
+            print(f"{self.GREEN}[SUCCESS]{self.RESET} Supervisor stopped")
+            return True
+        
+        # Status
+        if pid:
+            print(f"{self.BOLD}Supervisor:{self.RESET} {self.GREEN}Running{self.RESET} (PID: {pid})")
+        else:
+            print(f"{self.BOLD}Supervisor:{self.RESET} {self.RED}Stopped{self.RESET}")
+        print(f"{self.BOLD}Check interval:{self.RESET} {self.config['process_check_interval']}s")
+        print(f"{self.BOLD}Log file:{self.RESET} {self.supervisor_log}")
+        return True
+    
+    def save(self):
+        """Remember the running processes and scheduled jobs for resurrect"""
+        for name in self.processes:
+            self._update_process_status(name)
+        self._save_state()
+        
+        entries = []
+        for name, info in self.processes.items():
+            if info['status'] not in ('running', 'scheduled', 'standby', 'queued'):
+                continue
+            entries.append({'name': name, **self._start_options(info)})
+        
+        # An empty save right after a reboot would throw away the previous one
+        if not entries:
+            print(f"{self.YELLOW}[WARNING]{self.RESET} No running processes, keeping the previous save")
+            return False
+        
+        tmp_file = self.dump_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'saved': datetime.now().strftime("%Y-%m-%d %H:%M:%S"), 'processes': entries},
+                      f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, self.dump_file)
+        
+        print(f"{self.GREEN}[SUCCESS]{self.RESET} Saved {len(entries)} processes to {self.dump_file}")
+        print(f"{self.BLUE}[INFO]{self.RESET} Restore them with: pyker resurrect")
+        return True
+    
+    def resurrect(self, concurrency: int = None):
+        """Start the saved processes, highest priority first and several at a time"""
+        if not self.dump_file.exists():
+            print(f"{self.RED}[ERROR]{self.RESET} Nothing saved yet, use 'pyker save' first")
+            return False
+        try:
+            with open(self.dump_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)['processes']
+        except (ValueError, KeyError) as e:
+            print(f"{self.RED}[ERROR]{self.RESET} Failed to read {self.dump_file}: {e}")
+            return False
+        
+        concurrency = max(1, concurrency or self.config['resurrect']['concurrency'])
+        grace = self.config['resurrect']['grace']
+        began = time.monotonic()
+        
+        # Start the supervisor first, otherwise every start would try to spawn one
+        if self.config['supervisor']['autostart'] and not self._supervisor_pid():
+            self._ensure_supervisor()
+            deadline = time.monotonic() + 5
+            while not self._supervisor_pid() and time.monotonic() < deadline:
+                time.sleep(0.05)
+        
+        # The check and start() hold the state lock, so neither another command nor the supervisor can
+        # start the same process in between; only the wait for each process runs in parallel
+        def launch(entry):
+            name = entry['name']
+            with self._state_lock():
+                self.processes = self._load_state()
+                if name in self.processes:
+                    self._update_process_status(name)
+                    if self.processes[name]['status'] in ('running', 'scheduled', 'standby', 'queued'):
+                        return 'skipped'
+                started = self.start(name, **{key: value for key, value in entry.items() if key != 'name'})
+                pid = self.processes[name].get('pid') if started else None
+                queued = started and self.processes[name].get('queued')
+            if not started:
+                return 'failed'
+            if queued:
+                return 'queued'
+            if not pid:
+                return 'started'
+            
+            # Hold the slot until the process has survived its startup
+            time.sleep(grace)
+            try:
+                if psutil.Process(pid).status() != psutil.STATUS_ZOMBIE:
+                    return 'started'
+            except psutil.NoSuchProcess:
+                pass
+            with self._state_mutex:
+                print(f"{self.RED}[ERROR]{self.RESET} Process '{name}' exited during startup, "
+                      f"see: pyker logs {name}")
+            return 'failed'
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # Every priority level is up before the next one starts
+        results = {}
+        for priority in sorted({entry.get('priority', 0) for entry in entries}, reverse=True):
+            level = [entry for entry in entries if entry.get('priority', 0) == priority]
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(level))) as executor:
+                for entry, result in zip(level, executor.map(launch, level)):
+                    results[entry['name']] = result
+        
+        started = sum(1 for result in results.values() if result == 'started')
+        skipped = sum(1 for result in results.values() if result == 'skipped')
+        failed = [name for name, result in results.items() if result == 'failed']
+        
+        queued = sum(1 for result in results.values() if result == 'queued')
+        skipped_display = f", {skipped} already running" if skipped else ""
+        skipped_display += f", {queued} queued until the host has room" if queued else ""
+        print(f"{self.GREEN}[SUCCESS]{self.RESET} Resurrected {started} of {len(entries)} processes "
+              f"in {time.monotonic() - began:.1f}s{skipped_display}")
+        if failed:
+            print(f"{self.RED}[ERROR]{self.RESET} Failed to start: {', '.join(failed)}")
+        return not failed
+    
+    def startup(self):
+        """Write a systemd user unit that runs the supervisor and resurrects saved processes at boot"""
+        unit = (
+            "[Unit]\n"
+            "Description=Pyker process manager\n"
+            "\n"
+            "[Service]\n"
+            "Type=simple\n"
+            f"ExecStart={sys.executable} -u {PYKER_FILE} supervisor run --resurrect\n"
+            "Restart=on-failure\n"
+            "# Stopping the unit stops the supervisor, managed processes keep running\n"
+            "KillMode=process\n"
+            "\n"
+            "[Install]\n"
+            "WantedBy=default.target\n"
+        )
+        self.systemd_unit.parent.mkdir(parents=True, exist_ok=True)
+        self.systemd_unit.write_text(unit)
+        
+        print(f"{self.GREEN}[SUCCESS]{self.RESET} Systemd unit written to {self.systemd_unit}")
+        print(f"{self.BLUE}[INFO]{self.RESET} Enable it with:")
+        print(f"  systemctl --user daemon-reload")
+        print(f"  systemctl --user enable --now pyker")
+        print(f"{self.YELLOW}[HINT]{self.RESET} To start at boot without logging in: loginctl enable-linger {os.environ.get('USER', '$USER')}")
+        if not self.dump_file.exists():
+            print(f"{self.YELLOW}[HINT]{self.RESET} Save the processes to bring back: pyker save")
+        if self._supervisor_pid():
+            print(f"{self.YELLOW}[HINT]{self.RESET} Stop the running supervisor first: pyker supervisor stop")
+        return True
+    
+    def _agent_token(self):
+        """Get the shared secret of the agent, generated on first use"""
+        try:
+            return self.agent_token_file.read_text().strip()
+        except OSError:
+            pass
+        import secrets
+        token = secrets.token_hex(32)
+        fd = os.open(self.agent_token_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(token + '\n')
+        return token
+    
+    def agent(self, action: str = 'status', bind: str = None, port: int = None):
+        """Let the supervisor accept commands from `pyker --hosts` on other machines"""
+        agent = self.config['agent']
+        
+        if action == 'enable':
+            if bind:
+                agent['bind'] = bind
+            if port:
+                agent['port'] = port
+            agent['enabled'] = True
+            self._save_config(self.config)
+            self._agent_token()
+            if not self._ensure_supervisor():
+                return False
+            print(f"{self.GREEN}[SUCCESS]{self.RESET} Agent enabled on {agent['bind']}:{agent['port']}")
+            print(f"{self.BLUE}[INFO]{self.RESET} Token: {self.agent_token_file}")
+            print(f"{self.YELLOW}[HINT]{self.RESET} Inventory line for this host: "
+                  f"{socket.gethostname()}:{agent['port']} $(pyker agent token)")
+            return True
+        
+        if action == 'disable':
+            agent['enabled'] = False
+            self._save_config(self.config)
+            print(f"{self.GREEN}[SUCCESS]{self.RESET} Agent disabled")
+            return True
+        
+        if action == 'token':
+            print(self._agent_token())
+            return True
+        
+        # Status
+        published = {}
+        if self._supervisor_pid() and self.status_file.exists():
+            try:
+                published = json.loads(self.status_file.read_text()).get('agent') or {}
+            except (OSError, ValueError):
+                pass
+        if not agent['enabled']:
+            state = f"{self.RED}Disabled{self.RESET}"
+        elif published.get('listening'):
+            state = f"{self.GREEN}Listening{self.RESET} ({published.get('clients', 0)} connected)"
+        elif published.get('error'):
+            state = f"{self.RED}Failed{self.RESET} ({published['error']})"
+        else:
+            state = f"{self.YELLOW}Not listening{self.RESET} (supervisor is not running)"
+        print(f"{self.BOLD}Agent:{self.RESET} {state}")
+        print(f"{self.BOLD}Address:{self.RESET} {agent['bind']}:{agent['port']}")
+        print(f"{self.BOLD}Token file:{self.RESET} {self.agent_token_file}")
+        return True
+    
+    def _load_inventory(self, path: str, timeout: float):
+        """Read the `host[:port] [token]` lines of an inventory file"""
+        default_token = os.environ.get('PYKER_AGENT_TOKEN')
+        hosts = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for number, line in enumerate(f, 1):
+                fields = line.split('#', 1)[0].split()
+                if not fields:
+                    continue
+                if len(fields) > 2:
+                    raise ValueError(f"{path}:{number}: expected 'host[:port] [token]'")
+                token = fields[1] if len(fields) == 2 else default_token
+                if token is None:
+                    if not self.agent_token_file.exists():
+                        raise ValueError(f"{path}:{number}: no token for {fields[0]} "
+                                         f"(add it to the line or set PYKER_AGENT_TOKEN)")
+                    token = self._agent_token()
+                try:
+                    hosts.append(RemoteHost(fields[0], token, timeout))
+                except ValueError:
+                    raise ValueError(f"{path}:{number}: invalid address '{fields[0]}'")
+        return hosts
+    
+    def remote(self, inventory: str, command: str, names: list = None, lines: int = 50,
+               output: str = 'text', timeout: float = 10.0):
+        """Run a command on every host of an inventory file at the same time and merge the results"""
+        error_stream = sys.stdout if output == 'text' else sys.stderr
+        try:
+            hosts = self._load_inventory(inventory, timeout)
+        except (OSError, ValueError) as e:
+            print(f"{self.RED}[ERROR]{self.RESET} Failed to read inventory: {e}", file=error_stream)
+            return False
+        if not hosts:
+            print(f"{self.RED}[ERROR]{self.RESET} No hosts in {inventory}", file=error_stream)
+            return False
+        
+        def run(host):
+            # All requests to a host share one connection
+            try:
+                if command == 'list':
+                    return [host.call('list')], None
+                return [host.call(command, name=name, lines=lines) for name in names], None
+            except OSError as e:
+                return None, e.strerror or str(e) or type(e).__name__
+            except ValueError as e:
+                return None, f"invalid response ({e})"
+            finally:
+                host.close()
+        
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(len(hosts), 64)) as pool:
+            results = list(pool.map(run, hosts))
+        
+        if command == 'list':
+            rows = []
+            for host, (responses, _) in zip(hosts, results):
+                if responses:
+                    rows.extend(dict(record, host=host.address) for record in responses[0].get('result', []))
+            if output != 'text':
+                writer = RecordWriter(output, ['host'] + self.LIST_FIELDS)
+                for row in rows:
+                    writer.write(row)
+                writer.close()
+            else:
+                self._print_host_table(rows, sum(1 for responses, _ in results if responses), len(hosts))
+        elif command == 'info' and output != 'text':
+            writer = RecordWriter(output, ['host'] + self.INFO_FIELDS)
+            for host, (responses, _) in zip(hosts, results):
+                for response in responses or []:
+                    if response.get('ok'):
+                        writer.write(dict(response['result'], host=host.address))
+            writer.close()
+        else:
+            for host, (responses, _) in zip(hosts, results):
+                for name, response in zip(names, responses or []):
+                    self._print_remote_response(host.address, command, name, lines, response)
+        
+        failed = False
+        for host, (responses, error) in zip(hosts, results):
+            if error:
+                failed = True
+                print(f"{self.RED}[ERROR]{self.RESET} {host.address}: {error}", file=error_stream)
+            for response in responses or []:
+                if not response.get('ok'):
+                    failed = True
+                    # Text output already shows the error next to the host
+                    if output != 'text':
+                        print(f"{self.RED}[ERROR]{self.RESET} {host.address}: {response.get('error')}",
+                              file=error_stream)
+        return not failed
+    
+    def _print_remote_response(self, host: str, command: str, name: str, lines: int, response: dict):
+        """Print the answer of one host to an info, logs, restart or stop request"""
+        if not response.get('ok') and 'output' not in response:
+            print(f"{self.BOLD}{host}{self.RESET} {self.RED}[ERROR]{self.RESET} {response.get('error')}")
+            return
+        
+        if command == 'logs':
+            print(f"{self.CYAN}[LOGS]{self.RESET} {self.BOLD}{host}{self.RESET}: "
+                  f"last {lines} lines from process '{name}':")
+            print("─" * 80)
+            for line in response['result']:
+                if response.get('log_format') == 'jsonl':
+                    self._print_jsonl_line(line)
+                else:
+                    print(line)
+            if not response['result']:
+                print("No logs available")
+            print()
+        elif command == 'info':
+            record = response['result']
+            print(f"{self.BOLD}{self.CYAN}{host}{self.RESET} {self.BOLD}{name}{self.RESET}")
+            print(f"  {self.BOLD}Status:{self.RESET} {record['status']}")
+            print(f"  {self.BOLD}PID:{self.RESET} {record['pid'] or '-'}")
+            cpu = record['cpu_percent']
+            print(f"  {self.BOLD}CPU:{self.RESET} {f'{cpu:.1f}%' if cpu is not None else '-'}  "
+                  f"{self.BOLD}Memory:{self.RESET} {record['memory_mb']:.1f} MB")
+            print(f"  {self.BOLD}Restarts:{self.RESET} {record['restarts']}")
+            print(f"  {self.BOLD}Started:{self.RESET} {record['start_time'] or '-'}")
+            print(f"  {self.BOLD}Script:{self.RESET} {record['script_path']}")
+            print(f"  {self.BOLD}Python:{self.RESET} {record.get('python_version') or '-'}")
+            for warning in record.get('warnings', []):
+                print(f"  {self.YELLOW}⚠ {warning}{self.RESET}")
+        else:
+            for line in response['output'].splitlines():
+                print(f"{self.BOLD}{host}{self.RESET} {line}")
+    
+    def _print_host_table(self, rows: list, reachable: int, total: int):
+        """Print the processes of several hosts in one table"""
+        symbols = {'running': (self.GREEN, '✓'), 'stopped': (self.RED, '✗'), 'scheduled': (self.CYAN, '◷'),
+                   'standby': (self.CYAN, '◌'), 'queued': (self.YELLOW, '◔')}
+        headers = ['Host', 'Name', 'PID', 'CPU%', 'RAM', 'Restarts', 'Started', 'Script']
+        table = []
+        for row in rows:
+            color, symbol = symbols.get(row['status'], (self.YELLOW, '⚠'))
+            if row['status'] == 'running' and row.get('warnings'):
+                color, symbol = self.YELLOW, '⚠'
+            cpu = f"{row['cpu_percent']:.1f}" if row['cpu_percent'] is not None else '-'
+            cells = [row['host'], f"{symbol} {row['name']}", str(row['pid'] or '-'),
+                     cpu, f"{row['memory_mb'] or 0.0:.1f}", str(row['restarts']),
+                     self._format_time(row['start_time'] or '', 19) if row['start_time'] else '-',
+                     os.path.basename(row['script_path'] or '')]
+            table.append((color, cells))
+        widths = [max([len(header)] + [len(cells[i]) for _, cells in table]) for i, header in enumerate(headers)]
+        
+        print(f"\n{self.BOLD}{self.CYAN}Process List:{self.RESET}")
+        print("┌" + "┬".join("─" * width for width in widths) + "┐")
+        print("│" + "│".join(f"{self.BOLD}{header:<{width}}{self.RESET}" for header, width in zip(headers, widths)) + "│")
+        print("├" + "┼".join("─" * width for width in widths) + "┤")
+        for color, cells in table:
+            padded = [f"{cell:<{width}}" for cell, width in zip(cells, widths)]
+            padded[1] = f"{color}{padded[1][0]}{self.RESET}{padded[1][1:]}"
+            print("│" + "│".join(padded) + "│")
+        print("└" + "┴".join("─" * width for width in widths) + "┘")
+        
+        running = sum(1 for row in rows if row['status'] == 'running')
+        stopped = sum(1 for row in rows if row['status'] == 'stopped')
+        print(f"\n{self.BOLD}Statistics:{self.RESET} Hosts: {self.BLUE}{reachable}/{total}{self.RESET} | "
+              f"Total: {self.BLUE}{len(rows)}{self.RESET} | {self.GREEN}Running: {running}{self.RESET} | "
+              f"{self.RED}Stopped: {stopped}{self.RESET}")
+    
+    def uninstall(self):
+        """Uninstall Pyker with confirmation"""
+        print(f"\n{self.BOLD}{self.RED}⚠ Pyker Uninstallation{self.RESET}")
+        print(f"{self.YELLOW}This will:{self.RESET}")
+        print(f"  • Stop all running processes")
+        print(f"  • Remove Pyker executable")
+        print(f"  • Remove completion scripts")
+        print(f"  • Keep logs and config (optional cleanup)")
+        
+        # Show current processes
+        if self.processes:
+            running_processes = [name for name, info in self.processes.items() 
+                               if info.get('status') == 'running']
+            if running_processes:
+                print(f"\n{self.RED}Running processes that will be stopped:{self.RESET}")
+                for name in running_processes:
+                    print(f"  • {name}")
+        
+        print(f"\n{self.BOLD}Do you want to continue? [y/N]:{self.RESET} ", end="")
+        try:
+            response = input().strip().lower()
+        except (KeyboardInterrupt, EOFError):
+            print(f"\n{self.YELLOW}[INFO]{self.RESET} Uninstallation cancelled")
+            return
+        
+        if response not in ['y', 'yes']:
+            print(f"{self.YELLOW}[INFO]{self.RESET} Uninstallation cancelled")
+            return
+        
+        # Stop all running processes
+        print(f"\n{self.YELLOW}Stopping all processes...{self.RESET}")
+        running = [name for name, info in self.processes.items() if info.get('status') == 'running']
+        stopped_count = len(running) if running and self.stop_many(running) else 0
+        
+        if stopped_count > 0:
+            print(f"{self.GREEN}✓ Stopped {stopped_count} processes{self.RESET}")
+        
+        if self._supervisor_pid():
+            self.supervisor('stop')
+        
+        # Ask about data cleanup
+        print(f"\n{self.BOLD}Remove logs and configuration? [y/N]:{self.RESET} ", end="")
+        try:
+            cleanup_response = input().strip().lower()
+        except (KeyboardInterrupt, EOFError):
+            cleanup_response = 'n'
+        
+        # Remove Pyker files
+        self._remove_pyker_files(cleanup_response in ['y', 'yes'])
+        
+        print(f"\n{self.GREEN}✓ Pyker has been uninstalled successfully{self.RESET}")
+        print(f"{self.BLUE}Thank you for using Pyker!{self.RESET}")
+    
+    def _remove_pyker_files(self, remove_data: bool):
+        """Remove Pyker installation files"""
+        import shutil
+        
+        # Find pyker executable, its modules and their cached bytecode
+        pyker_locations = []
+        for directory in [Path.home() / ".local" / "bin", Path("/usr/local/bin"), Path("/usr/bin")]:
+            pyker_locations += [directory / "pyker", directory / "pyker_core.py", directory / "pyker_bootstrap.py"]
+            pyker_locations += [Path(path) for path in glob.glob(str(directory / "__pycache__" / "pyker_*.pyc"))]
+        
+        for location in pyker_locations:
+            if location.exists():
+                try:
+                    location.unlink()
+                    print(f"{self.GREEN}✓ Removed {location}{self.RESET}")
+                except Exception as e:
+                    print(f"{self.RED}✗ Failed to remove {location}: {e}{self.RESET}")
+        
+        # Remove completion scripts
+        completion_locations = [
+            Path.home() / ".local" / "share" / "bash-completion" / "completions" / "pyker",
+            Path.home() / ".oh-my-zsh" / "completions" / "_pyker",
+            Path.home() / ".local" / "share" / "zsh" / "site-functions" / "_pyker"
+        ]
+        
+        for location in completion_locations:
+            if location.exists():
+                try:
+                    location.unlink()
+                    print(f"{self.GREEN}✓ Removed completion {location.name}{self.RESET}")
+                except Exception as e:
+                    print(f"{self.RED}✗ Failed to remove completion: {e}{self.RESET}")
+        
+        if self.systemd_unit.exists():
+            try:
+                self.systemd_unit.unlink()
+                print(f"{self.GREEN}✓ Removed systemd unit {self.systemd_unit}{self.RESET}")
+            except Exception as e:
+                print(f"{self.RED}✗ Failed to remove systemd unit: {e}{self.RESET}")
+        
+        # Remove data if requested
+        if remove_data:
+            pyker_dir = Path.home() / ".pyker"
+            if pyker_dir.exists():
+                try:
+                    shutil.rmtree(pyker_dir)
+                    print(f"{self.GREEN}✓ Removed data directory ~/.pyker{self.RESET}")
+                except Exception as e:
+                    print(f"{self.RED}✗ Failed to remove data directory: {e}{self.RESET}")
+        else:
+            print(f"{self.BLUE}ℹ Data directory ~/.pyker preserved{self.RESET}")
+            print(f"{self.BLUE}  You can manually remove it later if needed{self.RESET}")
+    
+    def _resolve_interpreter(self, venv_path: str = None):
+        """Python executable and version for a venv or the system, cached until the venv changes"""
+        if not venv_path:
+            return {'venv_path': None, 'python_exe': sys.executable, 'fingerprint': None,
+                    'version': '.'.join(map(str, sys.version_info[:3]))}
+        
+        venv_path = os.path.abspath(os.path.expanduser(venv_path))
+        fingerprint, version = _venv_fingerprint(venv_path)
+        try:
+            with open(self.interpreters_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        
+        cached = cache.get(venv_path)
+        if fingerprint and cached and cached['fingerprint'] == fingerprint:
+            return cached
+        
+        python_exe = self._get_python_executable(venv_path)
+        if not python_exe:
+            return None
+        
+        cache[venv_path] = {'venv_path': venv_path, 'python_exe': python_exe,
+                            'fingerprint': fingerprint, 'version': version}
+        tmp_file = self.interpreters_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, self.interpreters_file)
+        return cache[venv_path]
+    
+    def _get_python_executable(self, venv_path: str = None):
+        """Get Python executable from venv or system"""
+        if venv_path:
+            # Resolve venv path
+            venv_path = os.path.expanduser(venv_path)
+            if not os.path.isabs(venv_path):
+                venv_path = os.path.abspath(venv_path)
+            
+            # Check if venv directory exists
+            if not os.path.exists(venv_path):
+                print(f"{self.RED}[ERROR]{self.RESET} Virtual environment not found: {venv_path}")
+                return None
+            
+            # Try different Python executable paths in venv
+            possible_paths = [
+                os.path.join(venv_path, 'bin', 'python'),      # Linux/macOS
+                os.path.join(venv_path, 'bin', 'python3'),     # Linux/macOS
+                os.path.join(venv_path, 'Scripts', 'python.exe'),  # Windows
+                os.path.join(venv_path, 'Scripts', 'python3.exe'), # Windows
+            ]
+            
+            for python_exe in possible_paths:
+                if os.path.exists(python_exe) and os.access(python_exe, os.X_OK):
+                    print(f"{self.BLUE}[INFO]{self.RESET} Using Python from venv: {python_exe}")
+                    return python_exe
+            
+            print(f"{self.RED}[ERROR]{self.RESET} No Python executable found in venv: {venv_path}")
+            print(f"{self.YELLOW}[HINT]{self.RESET} Expected paths: bin/python or Scripts/python.exe")
+            return None
+        else:
+            # Use system Python
+            return sys.executable
+
+def _venv_fingerprint(venv_path: str):
+    """Hash of a venv's configuration, interpreter binary and site-packages, and its Python version.
+    
+    Only reads pyvenv.cfg and stats a few paths, the interpreter is never run.
+    """
+    try:
+        with open(os.path.join(venv_path, 'pyvenv.cfg'), 'rb') as f:
+            config = f.read()
+    except OSError:
+        return None, None
+    
+    version = None
+    for line in config.decode('utf-8', errors='replace').splitlines():
+        key, _, value = line.partition('=')
+        if key.strip() in ('version', 'version_info'):
+            version = value.strip()
+    
+    import hashlib
+    
+    # Installing, upgrading or removing a package changes the site-packages directory
+    parts = [hashlib.sha1(config).hexdigest()]
+    paths = [os.path.join(venv_path, 'bin', 'python'), os.path.join(venv_path, 'Scripts', 'python.exe')]
+    paths += sorted(glob.glob(os.path.join(venv_path, 'lib', 'python*', 'site-packages')))
+    paths += [os.path.join(venv_path, 'Lib', 'site-packages')]
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        parts.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}")
+    return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest(), version
+
+
+def _parse_listen(value: str):
+    """Split a --listen value of the form [HOST:]PORT, listening on all interfaces without a host"""
+    host, _, port = value.rpartition(':')
+    host = host.strip('[]') or '0.0.0.0'
+    if not port.isdigit() or not 0 < int(port) < 65536:
+        raise ValueError("port must be a number from 1 to 65535")
+    return host, int(port)
+
+
+def _pressure_stall(resource: str):
+    """Share of the last 10 seconds some tasks stalled on a resource, from Linux PSI, None if unavailable"""
+    try:
+        with open(f'/proc/pressure/{resource}', 'r') as f:
+            for line in f:
+                if line.startswith('some '):
+                    return float(line.split()[1].split('=')[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _open_listener(address: str):
+    """Listening TCP socket for a normalized --listen address"""
+    host, port = _parse_listen(address)
+    family = socket.AF_INET6 if ':' in host else socket.AF_INET
+    return socket.create_server((host, port), family=family, backlog=128)
+
+
+def _rotate_log(log_file: Path, max_files: int):
+    """Shift log.1 .. log.N up by one, dropping the oldest, and start an empty log"""
+    # Remove oldest log if max files reached
+    oldest_log = log_file.with_suffix(f'.log.{max_files}')
+    if oldest_log.exists():
+        oldest_log.unlink()
+    
+    # Shift existing log files
+    for i in range(max_files - 1, 0, -1):
+        current_log = log_file.with_suffix(f'.log.{i}')
+        next_log = log_file.with_suffix(f'.log.{i + 1}')
+        if current_log.exists():
+            current_log.rename(next_log)
+    
+    # Move current log to .1
+    first_rotated = log_file.with_suffix('.log.1')
+    log_file.rename(first_rotated)
+    
+    # Create new empty log file
+    log_file.touch()
+
+
+def _tail_lines(path: Path, count: int, block_size: int = 65536):
+    """Read the last lines of a file without reading all of it"""
+    if count <= 0:
+        return []
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        data = b''
+        while position > 0 and data.count(b'\n') <= count:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+    return data.decode('utf-8', errors='replace').splitlines()[-count:]
+
+
+def _merge_state(base: dict, ours: dict, theirs: dict):
+    """Apply the process fields changed from base to ours on top of theirs, the state saved meanwhile.
+    
+    A field changed on both sides takes our value. A process deleted on one side and only changed
+    on the other stays deleted.
+    """
+    missing = object()
+    merged = dict(theirs)
+    for name in list(base) + [name for name in ours if name not in base]:
+        if name not in ours:
+            merged.pop(name, None)
+        elif name not in base:
+            merged[name] = ours[name]
+        elif name in merged and ours[name] != base[name]:
+            entry = dict(merged[name])
+            for key in base[name].keys() | ours[name].keys():
+                value = ours[name].get(key, missing)
+                if value == base[name].get(key, missing):
+                    continue
+                if value is missing:
+                    entry.pop(key, None)
+                else:
+                    entry[key] = value
+            merged[name] = entry
+    return merged
+
+
+def _read_from(path: Path, offset: int, inode: int):
+    """Bytes of a file from an offset, None if the file is no longer the one with this inode"""
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_ino != inode:
+                return None
+            f.seek(offset)
+            return f.read()
+    except OSError:
+        return None
+
+
+def _scan_processes():
+    """Read parent PID, CPU time and RSS of every process on the host in one sweep.
+    
+    Returns {pid: (ppid, cpu_seconds, rss_bytes)}. Zombies are left out.
+    """
+    table = {}
+    if os.path.isdir('/proc/self'):
+        clock_ticks = os.sysconf('SC_CLK_TCK')
+        page_size = os.sysconf('SC_PAGE_SIZE')
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat', 'rb') as f:
+                    stat = f.read()
+            except OSError:
+                continue
+            # The command name may contain spaces and parentheses, fields start after the last ')'
+            fields = stat[stat.rfind(b')') + 2:].split()
+            if fields[0] == b'Z':
+                continue
+            table[int(entry)] = (
+                int(fields[1]),
+                (int(fields[11]) + int(fields[12])) / clock_ticks,
+                int(fields[21]) * page_size
+            )
+        return table
+    
+    for process in psutil.process_iter(['ppid', 'cpu_times', 'memory_info', 'status']):
+        info = process.info
+        if info['status'] == psutil.STATUS_ZOMBIE or not info['cpu_times'] or not info['memory_info']:
+            continue
+        table[process.pid] = (info['ppid'], info['cpu_times'].user + info['cpu_times'].system,
+                              info['memory_info'].rss)
+    return table
+
+
+def _tree_usage(roots, table):
+    """Sum CPU time and RSS over each root process and all its descendants.
+    
+    Returns {root: (cpu_seconds, rss_bytes, process_count)} for roots found in the table.
+    """
+    children = {}
+    for pid, (ppid, _, _) in table.items():
+        children.setdefault(ppid, []).append(pid)
+    
+    usage = {}
+    for root in roots:
+        if root not in table:
+            continue
+        cpu = rss = count = 0
+        stack = [root]
+        while stack:
+            pid = stack.pop()
+            _, pid_cpu, pid_rss = table[pid]
+            cpu += pid_cpu
+            rss += pid_rss
+            count += 1
+            stack.extend(children.get(pid, ()))
+        usage[root] = (cpu, rss, count)
+    return usage
+
+
+
+def _parse_cpu_list(text: str):
+    """CPUs of a kernel CPU list such as "0-3,8-11" as a set"""
+    cpus = set()
+    for part in text.strip().split(','):
+        if not part:
+            continue
+        first, _, last = part.partition('-')
+        cpus.update(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def _format_cpu_list(cpus):
+    """CPUs as a kernel CPU list, e.g. [0, 1, 2, 3, 8] becomes 0-3,8"""
+    ranges = []
+    for cpu in sorted(cpus):
+        if ranges and cpu == ranges[-1][1] + 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ','.join(str(first) if first == last else f"{first}-{last}" for first, last in ranges)
+
+
+def _cpu_topology():
+    """NUMA nodes of the CPUs pyker may use, as [(node, [[CPU and its SMT siblings], ...])] in CPU order"""
+    allowed = os.sched_getaffinity(0) if hasattr(os, 'sched_getaffinity') else set(range(os.cpu_count() or 1))
+    nodes = []
+    for path in glob.glob('/sys/devices/system/node/node[0-9]*/cpulist'):
+        try:
+            cpus = _parse_cpu_list(Path(path).read_text()) & allowed
+        except (OSError, ValueError):
+            continue
+        if cpus:
+            nodes.append((int(Path(path).parent.name[4:]), cpus))
+    # Without NUMA (or in a container hiding it) all CPUs are one node
+    if not nodes:
+        nodes = [(0, allowed)]
+    
+    topology = []
+    for node, cpus in sorted(nodes):
+        cores = {}
+        for cpu in sorted(cpus):
+            try:
+                siblings = _parse_cpu_list(
+                    Path(f'/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list').read_text())
+            except (OSError, ValueError):
+                siblings = {cpu}
+            cores.setdefault(min(siblings), []).append(cpu)
+        topology.append((node, [cores[core] for core in sorted(cores)]))
+    return topology
+
+
+def _plan_placement(topology, requests):
+    """Assign CPUs to processes, keeping current assignments that still fit.
+    
+    requests are (name, group, CPU count, current CPUs or None) in a stable order. Each process gets
+    CPUs of one node where possible, idle cores first, and processes of the same group are spread
+    over the nodes. Once processes came or went, processes are moved off shared CPUs and onto nodes
+    with fewer of their group while idle CPUs allow. Returns {name: sorted CPUs}.
+    """
+    nodes = [node for node, _ in topology]
+    node_of, core_of, order = {}, {}, []
+    for node, cores in topology:
+        for index, core in enumerate(cores):
+            for cpu in core:
+                node_of[cpu] = node
+                core_of[cpu] = (node, index)
+                order.append(cpu)
+    if not order:
+        return {}
+    
+    load = dict.fromkeys(order, 0)  # CPU -> processes pinned to it
+    members = collections.Counter()  # (group, node) -> processes of the group on the node
+    plan, groups = {}, {}
+    # How many processes have to share a CPU when more CPUs are asked for than there are
+    level = max(1, -(-sum(min(count, len(order)) for _, _, count, _ in requests) // len(order)))
+    
+    def home(cpus):
+        return collections.Counter(node_of[cpu] for cpu in cpus).most_common(1)[0][0]
+    
+    def take(name, group, cpus):
+        plan[name] = sorted(cpus)
+        groups[name] = group
+        for cpu in cpus:
+            load[cpu] += 1
+        members[(group, home(cpus))] += 1
+    
+    def release(name):
+        cpus = plan.pop(name)
+        for cpu in cpus:
+            load[cpu] -= 1
+        members[(groups[name], home(cpus))] -= 1
+        return cpus
+    
+    def choose(group, count):
+        # The node with the fewest processes of the group first, then the one with the most idle CPUs
+        idle = collections.Counter(node_of[cpu] for cpu in order if not load[cpu])
+        ranked = sorted(nodes, key=lambda node: (members[(group, node)], -idle[node]))
+        busy_cores = {core_of[cpu] for cpu in order if load[cpu]}
+        for node in ranked:
+            free = [cpu for cpu in order if node_of[cpu] == node and not load[cpu]]
+            if len(free) >= count:
+                # Whole idle cores before the SMT siblings of busy ones
+                free.sort(key=lambda cpu: core_of[cpu] in busy_cores)
+                return free[:count]
+        return sorted(order, key=lambda cpu: (load[cpu], ranked.index(node_of[cpu])))[:count]
+    
+    fresh = []
+    for name, group, count, current in requests:
+        count = min(count, len(order))
+        if current and len(current) == count and all(cpu in load and load[cpu] < level for cpu in current):
+            take(name, group, current)
+        else:
+            fresh.append((name, group, count))
+    for name, group, count in fresh:
+        take(name, group, choose(group, count))
+    
+    for _ in range(len(requests)):
+        moved = False
+        for name, group, _, _ in requests:
+            shared = any(load[cpu] > 1 for cpu in plan[name])
+            cpus = release(name)
+            target = choose(group, len(cpus))
+            if all(not load[cpu] for cpu in target) and (
+                    shared or members[(group, home(target))] < members[(group, home(cpus))]):
+                take(name, group, target)
+                moved = True
+            else:
+                take(name, group, cpus)
+        if not moved:
+            break
+    return plan
+
+
+def _set_tree_affinity(pid: int, cpus):
+    """Pin every thread of a process tree to CPUs, False if the root process could not be pinned"""
+    try:
+        root = psutil.Process(pid)
+        processes = [root] + root.children(recursive=True)
+    except psutil.Error:
+        return False
+    
+    pinned = True
+    for process in processes:
+        # The affinity is per thread, threads that are already running keep theirs
+        try:
+            threads = [int(tid) for tid in os.listdir(f'/proc/{process.pid}/task')]
+        except OSError:
+            threads = [process.pid]
+        for tid in threads:
+            try:
+                os.sched_setaffinity(tid, cpus)
+            except OSError:
+                if process.pid == pid and tid == pid:
+                    pinned = False
+    return pinned
+
+class RecordWriter:
+    """Stream records to stdout as JSON, JSON lines or CSV, one row at a time"""
+    
+    def __init__(self, output: str, fields: list):
+        self.output = output
+        self.fields = fields
+        self.count = 0
+        if output == 'csv':
+            import csv
+            self.csv = csv.writer(sys.stdout)
+            self.csv.writerow(fields)
+        elif output == 'json':
+            sys.stdout.write('[')
+    
+    @classmethod
+    def single(cls, output: str, fields: list, record: dict):
+        """Write one record, as a plain object rather than an array for JSON"""
+        if output == 'json':
+            print(json.dumps({field: record.get(field) for field in fields}, indent=2, ensure_ascii=False))
+            return
+        writer = cls(output, fields)
+        writer.write(record)
+        writer.close()
+    
+    def write(self, record: dict):
+        record = {field: record.get(field) for field in self.fields}
+        if self.output == 'csv':
+            # Nested values are kept as JSON inside the cell
+            self.csv.writerow([json.dumps(value, ensure_ascii=False) if isinstance(value, (list, dict))
+                               else '' if value is None else value for value in record.values()])
+        elif self.output == 'json':
+            sys.stdout.write((',' if self.count else '') + '\n  ' + json.dumps(record, ensure_ascii=False))
+        else:
+            sys.stdout.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.count += 1
+        sys.stdout.flush()
+    
+    def close(self):
+        if self.output == 'json':
+            sys.stdout.write('\n]\n' if self.count else ']\n')
+        sys.stdout.flush()
+
+
+class Monitor:
+    """Live terminal dashboard over the process state and the supervisor's metrics.
+    
+    Data files are only re-read when their mtime changes and only screen lines whose
+    content changed are rewritten, so an idle dashboard costs next to nothing.
+    """
+    
+    SORT_KEYS = {ord('c'): 'cpu', ord('m'): 'memory', ord('r'): 'restarts', ord('n'): 'name'}
+    COLUMNS = "{:<24} {:<10} {:>8} {:>7} {:>9} {:>8} {:>9}"
+    LOG_BYTES = 64 * 1024
+    
+    def __init__(self, pyker: Pyker):
+        self.pyker = pyker
+        self.sort = 'cpu'
+        self.filter = ''
+        self.editing_filter = False
+        self.selected = None
+        self.offset = 0
+        self.rows = []
+        self.data_mtimes = None
+        self.log_state = None
+        self.log_lines = []
+        self.drawn = {}  # screen line -> (text, attribute) currently on screen
+    
+    def run(self):
+        import curses
+        self.curses = curses
+        curses.wrapper(self._main)
+    
+    def _main(self, screen):
+        curses = self.curses
+        self.screen = screen
+        curses.curs_set(0)
+        curses.use_default_colors()
+        for pair, color in enumerate((curses.COLOR_GREEN, curses.COLOR_RED, curses.COLOR_CYAN,
+                                      curses.COLOR_YELLOW), start=1):
+            curses.init_pair(pair, color, -1)
+        screen.timeout(500)
+        
+        dirty = True
+        while True:
+            if self._load_data():
+                dirty = True
+            if self._load_log():
+                dirty = True
+            if dirty:
+                self._draw()
+                dirty = False
+            
+            key = screen.getch()
+            if key == -1:
+                continue
+            if key == curses.KEY_RESIZE:
+                self.drawn.clear()
+                screen.erase()
+            elif self.editing_filter:
+                self._edit_filter(key)
+            elif key in (ord('q'), 27):
+                return
+            elif key in self.SORT_KEYS:
+                self.sort = self.SORT_KEYS[key]
+            elif key == ord('/'):
+                self.editing_filter = True
+            elif key in (curses.KEY_UP, ord('k')):
+                self._move(-1)
+            elif key in (curses.KEY_DOWN, ord('j')):
+                self._move(1)
+            elif key == curses.KEY_PPAGE:
+                self._move(-self._table_height())
+            elif key == curses.KEY_NPAGE:
+                self._move(self._table_height())
+            self._build_rows()
+            dirty = True
+    
+    def _edit_filter(self, key: int):
+        if key in (10, 13, self.curses.KEY_ENTER):
+            self.editing_filter = False
+        elif key == 27:
+            self.editing_filter = False
+            self.filter = ''
+        elif key in (8, 127, self.curses.KEY_BACKSPACE):
+            self.filter = self.filter[:-1]
+        elif 32 <= key < 127:
+            self.filter += chr(key)
+    
+    def _load_data(self):
+        """Reload state and metrics if either file changed since the last read"""
+        mtimes = []
+        for path in (self.pyker.state_file, self.pyker.status_file):
+            try:
+                mtimes.append(path.stat().st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        if mtimes == self.data_mtimes:
+            return False
+        self.data_mtimes = mtimes
+        
+        self.pyker.processes = self.pyker._load_state()
+        self.metrics = self.pyker._load_supervisor_status()
+        self._build_rows()
+        return True
+    
+    def _build_rows(self):
+        rows = []
+        for name, info in self.pyker.processes.items():
+            if self.filter and self.filter.lower() not in name.lower():
+                continue
+            metrics = self.metrics.get(name)
+            live = metrics is not None and metrics['pid'] == info.get('pid')
+            rows.append({
+                'name': name,
+                'status': info.get('status', 'stopped') if not live else 'running',
+                'pid': info.get('pid'),
+                'cpu': metrics['cpu_percent'] if live else 0.0,
+                'memory': metrics['memory_mb'] if live else 0.0,
+                'restarts': info.get('restarts', 0),
+                'started': info.get('start_time') if info.get('pid') else None,
+                'warning': bool(live and metrics.get('anomalies')),
+                'log_file': info.get('log_file')
+            })
+        
+        if self.sort == 'name':
+            rows.sort(key=lambda row: row['name'])
+        else:
+            rows.sort(key=lambda row: (-row[self.sort], row['name']))
+        self.rows = rows
+        
+        names = [row['name'] for row in rows]
+        if self.selected not in names:
+            self.selected = names[0] if names else None
+    
+    def _move(self, delta: int):
+        names = [row['name'] for row in self.rows]
+        if not names:
+            return
+        index = names.index(self.selected) if self.selected in names else 0
+        self.selected = names[max(0, min(len(names) - 1, index + delta))]
+    
+    def _load_log(self):
+        """Read the end of the selected process log when it changes"""
+        row = next((row for row in self.rows if row['name'] == self.selected), None)
+        log_file = row['log_file'] if row else None
+        try:
+            stat = os.stat(log_file) if log_file else None
+            state = (log_file, stat.st_size, stat.st_mtime_ns) if stat else None
+        except OSError:
+            state = (log_file, None, None)
+        if state == self.log_state:
+            return False
+        self.log_state = state
+        
+        self.log_lines = []
+        if stat:
+            with open(log_file, 'rb') as f:
+                f.seek(max(0, stat.st_size - self.LOG_BYTES))
+                self.log_lines = f.read().decode('utf-8', errors='replace').splitlines()[-200:]
+        return True
+    
+    def _table_height(self):
+        height, _ = self.screen.getmaxyx()
+        return max(1, (height - 4) * 2 // 3 - 1)
+    
+    @staticmethod
+    def _uptime(started: str):
+        if not started:
+            return '-'
+        try:
+            seconds = int(time.time() - datetime.strptime(started, "%Y-%m-%d %H:%M:%S").timestamp())
+        except ValueError:
+            return '-'
+        if seconds >= 86400:
+            return f"{seconds // 86400}d{seconds % 86400 // 3600}h"
+        if seconds >= 3600:
+            return f"{seconds // 3600}h{seconds % 3600 // 60}m"
+        return f"{seconds // 60}m"
+    
+    def _put(self, y: int, text: str, attribute: int = 0):
+        """Write a screen line unless it already shows the same content"""
+        if self.drawn.get(y) == (text, attribute):
+            return
+        _, width = self.screen.getmaxyx()
+        try:
+            self.screen.addnstr(y, 0, text.ljust(width - 1), width - 1, attribute)
+        except self.curses.error:
+            pass
+        self.drawn[y] = (text, attribute)
+    
+    def _draw(self):
+        curses = self.curses
+        height, _ = self.screen.getmaxyx()
+        table_height = self._table_height()
+        
+        running = sum(1 for row in self.rows if row['status'] == 'running')
+        filter_display = f" | filter: {self.filter}{'_' if self.editing_filter else ''}" if self.filter or self.editing_filter else ""
+        supervisor = "" if self.metrics else " | supervisor not running, no live metrics"
+        self._put(0, f"Pyker Monitor | {len(self.rows)} processes, {running} running | sort: {self.sort}"
+                     f"{filter_display}{supervisor}", curses.A_BOLD)
+        self._put(1, self.COLUMNS.format('Name', 'Status', 'PID', 'CPU%', 'RAM MB', 'Restarts', 'Uptime'),
+                  curses.A_BOLD | curses.A_UNDERLINE)
+        
+        # Keep the selected row visible
+        names = [row['name'] for row in self.rows]
+        index = names.index(self.selected) if self.selected in names else 0
+        if index < self.offset:
+            self.offset = index
+        elif index >= self.offset + table_height:
+            self.offset = index - table_height + 1
+        self.offset = max(0, min(self.offset, max(0, len(self.rows) - table_height)))
+        
+        colors = {'running': 1, 'stopped': 2, 'scheduled': 3, 'standby': 3, 'queued': 4}
+        for line in range(table_height):
+            position = self.offset + line
+            if position >= len(self.rows):
+                self._put(2 + line, '')
+                continue
+            row = self.rows[position]
+            text = self.COLUMNS.format(
+                ('⚠ ' if row['warning'] else '') + row['name'][:22], row['status'], row['pid'] or '-',
+                f"{row['cpu']:.1f}", f"{row['memory']:.1f}", row['restarts'], self._uptime(row['started']))
+            attribute = curses.color_pair(4 if row['warning'] else colors.get(row['status'], 4))
+            if row['name'] == self.selected:
+                attribute |= curses.A_REVERSE
+            self._put(2 + line, text, attribute)
+        
+        log_top = 2 + table_height
+        self._put(log_top, f"── Logs: {self.selected or '-'} " + "─" * 40, curses.A_BOLD)
+        log_height = height - log_top - 2
+        lines = self.log_lines[-log_height:] if log_height > 0 else []
+        for line in range(max(0, log_height)):
+            self._put(log_top + 1 + line, lines[line] if line < len(lines) else '')
+        
+        self._put(height - 1, "↑/↓ select  c/m/r/n sort by cpu/memory/restarts/name  / filter  q quit", curses.A_DIM)
+        self.screen.refresh()
+
+
+class TrendDetector:
+    """Exponentially weighted linear regression over a stream of (x, y) samples.
+    
+    Every update is O(1) in time and memory, so a detector can be kept for each
+    managed process and fed on every supervisor tick.
+    """
+    
+    def __init__(self, window: int):
+        self.alpha = 2.0 / (window + 1)
+        self.count = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.var_x = 0.0
+        self.var_y = 0.0
+        self.cov = 0.0
+    
+    def add(self, x: float, y: float):
+        """Add a sample"""
+        self.count += 1
+        if self.count == 1:
+            self.mean_x = x
+            self.mean_y = y
+            return
+        
+        alpha = self.alpha
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += alpha * dx
+        self.mean_y += alpha * dy
+        self.var_x = (1 - alpha) * (self.var_x + alpha * dx * dx)
+        self.var_y = (1 - alpha) * (self.var_y + alpha * dy * dy)
+        self.cov = (1 - alpha) * (self.cov + alpha * dx * dy)
+    
+    @property
+    def slope(self):
+        """Growth of y per unit of x"""
+        return self.cov / self.var_x if self.var_x > 0 else 0.0
+    
+    @property
+    def correlation(self):
+        """How well the samples fit a straight line (-1..1)"""
+        if self.var_x <= 0 or self.var_y <= 0:
+            return 0.0
+        return self.cov / math.sqrt(self.var_x * self.var_y)
+
+
+class FileWatcher:
+    """Watches directory trees for changes using a single inotify instance.
+    
+    Where inotify is not available, the trees are polled for mtime changes instead.
+    """
+    
+    # inotify event flags
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    
+    # Directories that never contain the sources of a managed script
+    SKIP_DIRS = {'.git', '.hg', '.svn', '__pycache__', 'node_modules', '.tox', '.nox',
+                 '.mypy_cache', '.pytest_cache', '.ruff_cache'}
+    
+    def __init__(self):
+        self.fd = None
+        self.roots = set()
+        self.wds = {}  # watch descriptor -> directory
+        self.dirs = {}  # directory -> watch descriptor
+        self.snapshots = {}  # root -> {path: mtime} when polling
+        
+        try:
+            import ctypes
+            self.libc = ctypes.CDLL(None, use_errno=True)
+            fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd >= 0:
+                self.fd = fd
+        except (OSError, AttributeError):
+            pass
+    
+    def set_roots(self, roots):
+        """Watch exactly the given files and directories"""
+        roots = set(roots)
+        for root in self.roots - roots:
+            self._remove_root(root, roots)
+        for root in roots - self.roots:
+            self._add_root(root)
+        self.roots = roots
+    
+    def _walk(self, root: str):
+        """Yield directories under root, skipping caches, VCS data and virtual environments"""
+        if os.path.isfile(root):
+            yield os.path.dirname(root)
+            return
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in self.SKIP_DIRS
+                           and not os.path.exists(os.path.join(dirpath, d, 'pyvenv.cfg'))]
+            yield dirpath
+    
+    def _add_root(self, root: str):
+        if self.fd is None:
+            self.snapshots[root] = self._scan(root)
+            return
+        for directory in self._walk(root):
+            self._add_watch(directory)
+    
+    def _remove_root(self, root: str, remaining):
+        if self.fd is None:
+            self.snapshots.pop(root, None)
+            return
+        def needs(root, directory):
+            # A file root is watched through its directory
+            return self.covers(root, directory) or directory == os.path.dirname(root)
+        
+        for directory in list(self.dirs):
+            if needs(root, directory) and not any(needs(other, directory) for other in remaining):
+                self.libc.inotify_rm_watch(self.fd, self.dirs.pop(directory))
+    
+    def _add_watch(self, directory: str):
+        if directory in self.dirs:
+            return
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), self.WATCH_MASK)
+        if wd >= 0:
+            self.wds[wd] = directory
+            self.dirs[directory] = wd
+    
+    @staticmethod
+    def covers(root: str, path: str):
+        """Check whether path is root or inside it"""
+        return path == root or path.startswith(root.rstrip(os.sep) + os.sep)
+    
+    def read_changes(self):
+        """Read pending inotify events and return the changed paths"""
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except (BlockingIOError, InterruptedError):
+                break
+            
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = struct.unpack_from('iIII', data, offset)
+                name = data[offset + 16:offset + 16 + length].rstrip(b'\0')
+                offset += 16 + length
+                
+                if mask & self.IN_Q_OVERFLOW:
+                    # Events were lost, treat every root as changed
+                    changed.update(self.roots)
+                    continue
+                if mask & self.IN_IGNORED:
+                    directory = self.wds.pop(wd, None)
+                    self.dirs.pop(directory, None)
+                    continue
+                
+                directory = self.wds.get(wd)
+                if directory is None:
+                    continue
+                path = os.path.join(directory, os.fsdecode(name))
+                if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    if os.path.basename(path) not in self.SKIP_DIRS:
+                        for subdirectory in self._walk(path):
+                            self._add_watch(subdirectory)
+                changed.add(path)
+        return changed
+    
+    def _scan(self, root: str):
+        """Get modification times of all files under root"""
+        mtimes = {}
+        for directory in self._walk(root):
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            mtimes[entry.path] = entry.stat().st_mtime
+                    except OSError:
+                        pass
+        return mtimes
+    
+    def poll(self):
+        """Rescan polled roots and return the changed paths"""
+        changed = set()
+        for root, previous in self.snapshots.items():
+            current = self._scan(root)
+            changed.update(path for path in current.keys() | previous.keys()
+                           if current.get(path) != previous.get(path))
+            self.snapshots[root] = current
+        return changed
+    
+    @staticmethod
+    def is_ignored(path: str, root: str, patterns):
+        """Match the path relative to root, and each of its trailing parts, against glob patterns"""
+        parts = os.path.relpath(path, os.path.dirname(root) if os.path.isfile(root) else root).split(os.sep)
+        for i in range(len(parts)):
+            candidate = '/'.join(parts[i:])
+            if any(fnmatch.fnmatch(candidate, pattern) for pattern in patterns):
+                return True
+        return False
+
+
+class CronSchedule:
+    """Standard five-field cron expression: minute hour day-of-month month day-of-week"""
+    
+    FIELDS = [('minute', 0, 59), ('hour', 0, 23), ('day of month', 1, 31), ('month', 1, 12), ('day of week', 0, 7)]
+    ALIASES = {
+        '@hourly': '0 * * * *',
+        '@daily': '0 0 * * *',
+        '@weekly': '0 0 * * 0',
+        '@monthly': '0 0 1 * *',
+        '@yearly': '0 0 1 1 *'
+    }
+    
+    def __init__(self, expression: str):
+        fields = self.ALIASES.get(expression.strip(), expression).split()
+        if len(fields) != 5:
+            raise ValueError("expected 5 fields: minute hour day-of-month month day-of-week")
+        
+        self.minutes, self.hours, self.days, self.months, self.weekdays = [
+            self._parse(field, *spec) for field, spec in zip(fields, self.FIELDS)
+        ]
+        # Both 0 and 7 mean Sunday
+        if 7 in self.weekdays:
+            self.weekdays = (self.weekdays - {7}) | {0}
+        
+        # Day of month and day of week are OR-ed when both are restricted; like cron, a field
+        # starting with '*' (e.g. */2) counts as unrestricted
+        self.any_day = fields[2].startswith('*')
+        self.any_weekday = fields[4].startswith('*')
+    
+    @staticmethod
+    def _parse(field: str, name: str, low: int, high: int):
+        values = set()
+        for part in field.split(','):
+            value_range, _, step = part.partition('/')
+            try:
+                step = int(step) if step else 1
+                if value_range == '*':
+                    start, end = low, high
+                elif '-' in value_range:
+                    start, end = (int(value) for value in value_range.split('-', 1))
+                else:
+                    start = int(value_range)
+                    end = high if step > 1 else start
+            except ValueError:
+                raise ValueError(f"invalid {name} field '{field}'")
+            if step < 1 or start < low or end > high or start > end:
+                raise ValueError(f"{name} field '{field}' is out of range {low}-{high}")
+            values.update(range(start, end + 1, step))
+        return values
+    
+    def _day_matches(self, dt: datetime):
+        day = dt.day in self.days
+        weekday = (dt.weekday() + 1) % 7 in self.weekdays
+        if self.any_day or self.any_weekday:
+            return day and weekday
+        return day or weekday
+    
+    def next_after(self, after: datetime):
+        """Get the first matching minute strictly after the given time"""
+        dt = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = dt + timedelta(days=366 * 4)
+        
+        while dt < limit:
+            if dt.month not in self.months:
+                dt = (dt.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(dt):
+                dt = dt.replace(hour=0, minute=0) + timedelta(days=1)
+            elif dt.hour not in self.hours:
+                dt = dt.replace(minute=0) + timedelta(hours=1)
+            elif dt.minute not in self.minutes:
+                dt += timedelta(minutes=1)
+            else:
+                return dt
+        raise ValueError("expression never matches")
+
+
+class TimerQueue:
+    """Single queue of the supervisor's timers ordered by deadline.
+    
+    Timers are identified by a key; scheduling a key again replaces its previous
+    deadline, and the stale heap entry is dropped lazily when it reaches the top.
+    """
+    
+    def __init__(self):
+        self.heap = []
+        self.deadlines = {}
+        self.counter = 0
+    
+    def __contains__(self, key):
+        return key in self.deadlines
+    
+    def schedule(self, key, when: float, callback):
+        """Run callback at the given time.time()"""
+        self.deadlines[key] = when
+        self.counter += 1
+        heapq.heappush(self.heap, (when, self.counter, key, callback))
+    
+    def cancel(self, key):
+        self.deadlines.pop(key, None)
+    
+    def _drop_stale(self):
+        while self.heap and self.deadlines.get(self.heap[0][2]) != self.heap[0][0]:
+            heapq.heappop(self.heap)
+    
+    def next_deadline(self):
+        """Get the earliest deadline or None"""
+        self._drop_stale()
+        return self.heap[0][0] if self.heap else None
+    
+    def run_due(self):
+        """Run callbacks of all expired timers"""
+        self._drop_stale()
+        while self.heap and self.heap[0][0] <= time.time():
+            when, _, key, callback = heapq.heappop(self.heap)
+            del self.deadlines[key]
+            callback()
+            self._drop_stale()
+
+
+class StatusTable:
+    """Status of every process in a fixed layout, memory-mapped so the CLI reads it without the supervisor.
+    
+    The header holds a sequence number that is odd while the supervisor writes the slots. Readers
+    copy the table and retry when the sequence was odd or changed meanwhile, so they never see a
+    half-written table and never make the supervisor wait.
+    """
+    
+    MAGIC = b'PYKT'
+    VERSION = 1
+    # magic, version, sequence, updated, slot capacity, slots used
+    HEADER = struct.Struct('<4sIQdII')
+    SEQUENCE = struct.Struct('<Q')
+    SEQUENCE_OFFSET = 8
+    # name, pid, state, anomaly flags, CPU %, memory MB, restarts, start time, processes in the tree
+    SLOT = struct.Struct('<64sIBBxxffIdI')
+    NAME_SIZE = 64
+    STATES = ('stopped', 'running', 'scheduled', 'stopping', 'standby', 'queued')
+    ANOMALIES = ('memory_leak', 'cpu_spin')
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self.map = None
+        self.capacity = 0
+        self.sequence = 0
+    
+    def write(self, rows: list, now: float):
+        """Publish dicts with name, pid, status, anomalies, cpu_percent, memory_mb, restarts, started and processes"""
+        # Longer names do not fit a slot, readers check those processes themselves
+        rows = [row for row in rows if len(row['name'].encode('utf-8')) <= self.NAME_SIZE]
+        if self.map is None or len(rows) > self.capacity:
+            self._create(max(64, 1 << max(len(rows) - 1, 0).bit_length()))
+        
+        slots = b''.join(self.SLOT.pack(
+            row['name'].encode('utf-8'), row['pid'] or 0, self.STATES.index(row['status']),
+            sum(1 << self.ANOMALIES.index(kind) for kind in row['anomalies'] if kind in self.ANOMALIES),
+            row['cpu_percent'], row['memory_mb'], row['restarts'], row['started'], row['processes']
+        ) for row in rows)
+        
+        self.sequence += 1
+        self.SEQUENCE.pack_into(self.map, self.SEQUENCE_OFFSET, self.sequence)
+        self.map[self.HEADER.size:self.HEADER.size + len(slots)] = slots
+        self.sequence += 1
+        self.HEADER.pack_into(self.map, 0, self.MAGIC, self.VERSION, self.sequence, now, self.capacity, len(rows))
+    
+    def _create(self, capacity: int):
+        """Replace the file with an empty one of the given number of slots"""
+        size = self.HEADER.size + capacity * self.SLOT.size
+        tmp_file = self.path.with_suffix('.table.tmp')
+        with open(tmp_file, 'wb+') as f:
+            f.truncate(size)
+            mapped = mmap.mmap(f.fileno(), size)
+        self.HEADER.pack_into(mapped, 0, self.MAGIC, self.VERSION, self.sequence, 0.0, capacity, 0)
+        # Readers of the old file keep a consistent, if older, copy
+        os.replace(tmp_file, self.path)
+        self.close()
+        self.map, self.capacity = mapped, capacity
+    
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+    
+    @classmethod
+    def read(cls, path: Path, attempts: int = 100):
+        """Consistent copy of the table as (updated, {name: row}), None if there is no valid table"""
+        try:
+            with open(path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        
+        with mapped:
+            if len(mapped) < cls.HEADER.size:
+                return None
+            for _ in range(attempts):
+                magic, version, sequence, updated, capacity, count = cls.HEADER.unpack_from(mapped)
+                if magic != cls.MAGIC or version != cls.VERSION:
+                    return None
+                if sequence % 2 or count > capacity:
+                    continue
+                slots = mapped[cls.HEADER.size:cls.HEADER.size + count * cls.SLOT.size]
+                if cls.SEQUENCE.unpack_from(mapped, cls.SEQUENCE_OFFSET)[0] == sequence and len(slots) == count * cls.SLOT.size:
+                    break
+            else:
+                return None
+        
+        rows = {}
+        for name, pid, state, flags, cpu, memory, restarts, started, processes in cls.SLOT.iter_unpack(slots):
+            name = name.rstrip(b'\0').decode('utf-8', errors='replace')
+            rows[name] = {
+                'pid': pid or None,
+                'status': cls.STATES[state] if state < len(cls.STATES) else 'stopped',
+                'anomalies': [kind for bit, kind in enumerate(cls.ANOMALIES) if flags & 1 << bit],
+                'cpu_percent': round(cpu, 1),
+                'memory_mb': round(memory, 1),
+                'restarts': restarts,
+                'started': started,
+                'processes': processes
+            }
+        return updated, rows
+
+
+class Supervisor:
+    """Background loop that samples all managed processes and reacts to anomalies"""
+    
+    EXIT_GRACE = 5  # seconds, longer than stop waits for a process tree to end
+    STOP_POLL = 0.25  # seconds between checks of a draining process
+    IDLE_CPU_PERCENT = 1.0  # on-demand processes using less CPU without connections are idle
+    ADMIT_INTERVAL = 2.0  # seconds between starts of queued processes, so pressure can show up
+    
+    AGENT_PROTOCOL = 1
+    AGENT_AUTH_TIMEOUT = 10  # seconds
+    AGENT_IDLE_TIMEOUT = 300  # seconds
+    AGENT_SEND_TIMEOUT = 10  # seconds
+    AGENT_MAX_CLIENTS = 64
+    AGENT_MAX_LINE = 64 * 1024
+    AGENT_MAX_LOG_LINES = 10000
+    AGENT_READ_COMMANDS = ('list', 'info', 'logs')  # answered by workers, off the event loop
+    AGENT_POLL = 0.05  # seconds between checks of a request a worker is answering
+    
+    def __init__(self, pyker: Pyker, resurrect: bool = False):
+        self.pyker = pyker
+        self.resurrect = resurrect
+        self.running = False
+        self.tracked = {}  # name -> sampling state of the current PID
+        self.telemetry = {}  # PID -> latest statistics sent by the process
+        self.watcher = None
+        self.watched = {}  # watched path -> {name: ignore patterns}
+        self.timers = TimerQueue()
+        self.jobs = {}  # name -> cron expression of scheduled jobs
+        self.job_runs = {}  # PID -> running job started by the supervisor
+        self.queued_jobs = set()  # jobs to run again as soon as the current run ends
+        self.over_log_quota = False
+        self.venv_fingerprints = {}  # venv path -> fingerprint seen on the last tick
+        self.agent_address = None  # (bind, port) of the agent config
+        self.agent_listener = None
+        self.agent_error = None
+        self.agent_clients = {}  # socket -> connection state of remote CLIs
+        from concurrent.futures import ThreadPoolExecutor
+        self.agent_workers = ThreadPoolExecutor(max_workers=4)  # answers list, info and logs requests
+        self.hooks = ThreadPoolExecutor(max_workers=4)  # runs pre-stop hooks off the event loop
+        self.pre_stops = {}  # name -> pre-stop hooks of a stop in progress
+        self.table = StatusTable(pyker.status_table)
+        self.listeners = {}  # name -> (address, socket) held for on-demand processes
+        self.last_active = {}  # name -> (PID, time) an on-demand process last had connections or used CPU
+        self.started_at = time.time()
+        self.gone = {}  # (name, PID) -> (time it was first missed, whether the exit is news)
+        self.exit_codes = {}  # PID -> exit code of children reaped by the supervisor
+        self.auto_restarts = {}  # name -> times of recent automatic restarts
+        self.dispatcher = None
+        self.events_position = (None, 0)  # (inode, offset) of the events file read by hooks
+    
+    def run(self):
+        """Sample processes every check interval until SIGTERM"""
+        self.running = True
+        self.selector = selectors.DefaultSelector()
+        
+        # Wake the event loop up immediately on signals
+        wakeup_read, wakeup_write = os.pipe()
+        os.set_blocking(wakeup_read, False)
+        os.set_blocking(wakeup_write, False)
+        signal.set_wakeup_fd(wakeup_write)
+        self.selector.register(wakeup_read, selectors.EVENT_READ, lambda: os.read(wakeup_read, 512))
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        if hasattr(signal, 'SIGCHLD'):
+            # Only needed to wake the loop up when a child exits
+            signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+        
+        self._open_telemetry_socket()
+        self.watcher = FileWatcher()
+        if self.watcher.fd is not None:
+            self.selector.register(self.watcher.fd, selectors.EVENT_READ,
+                                   lambda: self._on_file_changes(self.watcher.read_changes()))
+        self.pyker.supervisor_pid_file.write_text(str(os.getpid()))
+        self._log(f"Supervisor started (PID: {os.getpid()})")
+        # Hooks get the events from now on
+        self.dispatcher = HookDispatcher(self.pyker.config['hook_dispatch'], self._log)
+        try:
+            stat = self.pyker.events_file.stat()
+            self.events_position = (stat.st_ino, stat.st_size)
+        except OSError:
+            pass
+        if self.resurrect and self.pyker.dump_file.exists():
+            self.pyker.resurrect()
+        
+        next_tick = time.monotonic()
+        try:
+            while self.running:
+                timeout = next_tick - time.monotonic()
+                next_deadline = self.timers.next_deadline()
+                if next_deadline is not None:
+                    timeout = min(timeout, next_deadline - time.time())
+                for key, _ in self.selector.select(max(0.0, timeout)):
+                    key.data()
+                
+                self._reap_children()
+                self.timers.run_due()
+                if time.monotonic() >= next_tick:
+                    try:
+                        self.tick()
+                    except Exception as e:
+                        self._log(f"Tick failed: {e}")
+                    next_tick = time.monotonic() + self.pyker.config['process_check_interval']
+                self._dispatch_events()
+        finally:
+            self._close_agent()
+            self.agent_workers.shutdown(wait=False)
+            for name in list(self.listeners):
+                self._close_listener(name)
+            self.hooks.shutdown(wait=False)
+            self.dispatcher.close()
+            self.table.close()
+            for path in (self.pyker.supervisor_pid_file, self.pyker.status_file, self.pyker.status_table,
+                         self.pyker.telemetry_socket):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._log("Supervisor stopped")
+    
+    def _open_telemetry_socket(self):
+        """Listen for statistics sent by processes started with --telemetry"""
+        if not hasattr(socket, 'AF_UNIX'):
+            return
+        
+        try:
+            self.pyker.telemetry_socket.unlink()
+        except OSError:
+            pass
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(str(self.pyker.telemetry_socket))
+        sock.setblocking(False)
+        self.selector.register(sock, selectors.EVENT_READ, lambda: self._receive_telemetry(sock))
+    
+    def _receive_telemetry(self, sock):
+        """Store the latest statistics of each process by PID"""
+        while True:
+            try:
+                data = sock.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                return
+            try:
+                telemetry = json.loads(data.decode('utf-8'))
+                self.telemetry[telemetry['pid']] = telemetry
+            except (ValueError, KeyError, TypeError):
+                continue
+    
+    def _handle_stop(self, signum, frame):
+        self.running = False
+    
+    def _log(self, message: str):
+        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}", flush=True)
+    
+    def _reap_children(self):
+        """Collect exit status of processes the supervisor started so they do not linger as zombies"""
+        for pid, run in list(self.job_runs.items()):
+            exit_code = run['process'].poll()
+            if exit_code is not None:
+                self._finish_job(pid, exit_code)
+        
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            exit_code = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+            if pid in self.job_runs:
+                self._finish_job(pid, exit_code)
+            else:
+                # Processes (re)started by the supervisor, for the exited event
+                self.exit_codes[pid] = exit_code
+                while len(self.exit_codes) > 256:
+                    del self.exit_codes[next(iter(self.exit_codes))]
+    
+    def _sync_jobs(self):
+        """Schedule enabled jobs and drop timers of jobs that were stopped, changed or deleted"""
+        enabled = {name: info['cron'] for name, info in self.pyker.processes.items()
+                   if info.get('cron') and info.get('cron_enabled')}
+        
+        for name, cron in list(self.jobs.items()):
+            if enabled.get(name) != cron:
+                del self.jobs[name]
+                self.timers.cancel(('cron', name))
+        for name, cron in enabled.items():
+            if name not in self.jobs:
+                self.jobs[name] = cron
+                self._schedule_job(name)
+        
+        # Clear runs that ended while no supervisor was watching them
+        changed = False
+        own_pids = set(self.job_runs)
+        for name, info in self.pyker.processes.items():
+            pid = info.get('pid')
+            if info.get('cron') and pid and pid not in own_pids and not psutil.pid_exists(pid):
+                info['pid'] = None
+                info['status'] = Pyker._idle_status(info)
+                changed = True
+        if changed:
+            self.pyker._save_state()
+    
+    def _schedule_job(self, name: str):
+        """Set the timer of a job to its next run"""
+        try:
+            next_run = CronSchedule(self.jobs[name]).next_after(datetime.now())
+        except ValueError as e:
+            self._log(f"Job '{name}' has an invalid schedule: {e}")
+            return
+        self.timers.schedule(('cron', name), next_run.timestamp(), lambda: self._fire_job(name))
+    
+    def _fire_job(self, name: str):
+        """Start a scheduled run, applying the overlap policy if the previous run is still active"""
+        self.pyker.processes = self.pyker._load_state()
+        info = self.pyker.processes.get(name)
+        if not info or not info.get('cron_enabled') or info.get('cron') != self.jobs.get(name):
+            self.jobs.pop(name, None)
+            return
+        self._schedule_job(name)
+        
+        previous = info.get('pid')
+        if previous and psutil.pid_exists(previous):
+            overlap = info.get('overlap', 'skip')
+            if overlap == 'queue':
+                self._log(f"Job '{name}' is still running, next run queued")
+                self.queued_jobs.add(name)
+                return
+            if overlap == 'skip':
+                self._log(f"Job '{name}' is still running, run skipped")
+                self._record_run(info, {'started': datetime.now().strftime("%Y-%m-%d %H:%M:%S"), 'skipped': True})
+                self.pyker._save_state()
+                self.pyker._record_event(name, 'run_skipped', 'previous run still active', pid=previous)
+                return
+            
+            self._log(f"Job '{name}' is still running, stopping previous run")
+            self._kill_job(previous, info)
+            info = self.pyker.processes.get(name)
+            if not info:
+                return
+        
+        self._start_job(name, info)
+    
+    def _start_job(self, name: str, info: dict):
+        try:
+            process = self.pyker._spawn(name, info)
+        except Exception as e:
+            self._log(f"Failed to start job '{name}': {e}")
+            return
+        
+        self.job_runs[process.pid] = {'name': name, 'process': process, 'started': time.time()}
+        info['pid'] = process.pid
+        info['status'] = 'running'
+        info['start_time'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.pyker._save_state()
+        self.pyker._record_event(name, 'run_started', pid=process.pid)
+        self._log(f"Job '{name}' started (PID: {process.pid})")
+    
+    def _kill_job(self, pid: int, info: dict):
+        """Stop a job run, recording its result if the supervisor started it"""
+        try:
+            stop_signal, kill_timeout = self.pyker._stop_policy(info)
+            exit_code = self.pyker._terminate_tree(pid, info.get('process_group', False), kill_timeout,
+                                                   getattr(signal, stop_signal))
+        except psutil.NoSuchProcess:
+            return
+        if pid in self.job_runs:
+            self._finish_job(pid, exit_code)
+    
+    def _finish_job(self, pid: int, exit_code: int):
+        """Record the result of a finished run"""
+        run = self.job_runs.pop(pid, None)
+        if not run:
+            return
+        name = run['name']
+        
+        self.pyker.processes = self.pyker._load_state()
+        info = self.pyker.processes.get(name)
+        if info is None:
+            self.queued_jobs.discard(name)
+            return
+        
+        duration = time.time() - run['started']
+        self._record_run(info, {
+            'started': datetime.fromtimestamp(run['started']).strftime("%Y-%m-%d %H:%M:%S"),
+            'duration': round(duration, 3),
+            'exit_code': exit_code
+        })
+        if info.get('pid') == pid:
+            info['pid'] = None
+            info['status'] = Pyker._idle_status(info)
+            info['stop_time'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.pyker._save_state()
+        self.pyker._record_event(name, 'run_finished', f"took {duration:.1f}s", pid=pid, exit_code=exit_code)
+        self._log(f"Job '{name}' finished with exit code {exit_code} in {duration:.1f}s")
+        
+        if name in self.queued_jobs:
+            self.queued_jobs.discard(name)
+            if info.get('cron_enabled'):
+                self._start_job(name, info)
+    
+    def _record_run(self, info: dict, run: dict):
+        runs = info.setdefault('runs', [])
+        runs.append(run)
+        del runs[:-self.pyker.config['cron']['history']]
+    
+    def _admit_queued(self):
+        """Start the first queued process once the host has room, and try the next one shortly after"""
+        # Under the state lock a resurrect or start cannot start the same process in between
+        with self.pyker._state_lock():
+            self.pyker.processes = self.pyker._load_state()
+            queue = self.pyker._start_queue()
+            if not queue:
+                return
+            
+            pressure = self.pyker._host_pressure() if self.pyker.config['admission']['enabled'] else None
+            if pressure:
+                for name in queue:
+                    self.pyker.processes[name]['queued']['reason'] = pressure
+                self.pyker._save_state()
+                return
+            
+            name = queue[0]
+            info = self.pyker.processes[name]
+            restarts = info.get('restarts', 0)
+            since = info.pop('queued')['since']
+            # start() writes a new record, waiting in the queue does not count as a restart
+            if self.pyker._start_with_options(name, queue=False):
+                self.pyker.processes[name]['restarts'] = restarts
+                self._log(f"Started '{name}', queued since {since}")
+            self.pyker._save_state()
+        if len(queue) > 1:
+            self.timers.schedule(('admit',), time.time() + self.ADMIT_INTERVAL, self._admit_queued)
+    
+    def _sync_listeners(self):
+        """Hold the sockets of on-demand processes, waiting for connections while a process is not running"""
+        enabled = {name: info['listen'] for name, info in self.pyker.processes.items()
+                   if info.get('listen') and info.get('listen_enabled')}
+        for name, (address, _) in list(self.listeners.items()):
+            if enabled.get(name) != address:
+                self._close_listener(name)
+        
+        changed = False
+        for name, address in enabled.items():
+            if name not in self.listeners:
+                try:
+                    # Left blocking: the process accepts on the same open file, the supervisor only polls it
+                    self.listeners[name] = (address, _open_listener(address))
+                except (OSError, ValueError) as e:
+                    self._log(f"Cannot listen on {address} for '{name}': {e}")
+                    continue
+                self._log(f"Listening on {address} for '{name}'")
+            
+            # Clear processes that ended while no stop was watching them
+            info = self.pyker.processes[name]
+            if info.get('pid') and not info.get('stopping') and not self._tree_alive(info['pid'], False):
+                info['pid'] = None
+                info['status'] = Pyker._idle_status(info)
+                info['stop_time'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                changed = True
+            
+            sock = self.listeners[name][1]
+            waiting = not info.get('pid')
+            registered = sock in self.selector.get_map()
+            if waiting and not registered:
+                self.selector.register(sock, selectors.EVENT_READ, lambda name=name: self._activate(name))
+            elif registered and not waiting:
+                self.selector.unregister(sock)
+        if changed:
+            self.pyker._save_state()
+    
+    def _close_listener(self, name: str):
+        address, sock = self.listeners.pop(name)
+        try:
+            self.selector.unregister(sock)
+        except KeyError:
+            pass
+        sock.close()
+        self.last_active.pop(name, None)
+        self._log(f"Stopped listening on {address} for '{name}'")
+    
+    def _activate(self, name: str):
+        """Start an on-demand process for the connection waiting on its socket"""
+        sock = self.listeners[name][1]
+        # The process accepts from now on; the socket is polled again once it stopped
+        self.selector.unregister(sock)
+        
+        self.pyker.processes = self.pyker._load_state()
+        info = self.pyker.processes.get(name)
+        if not info or not info.get('listen_enabled') or info.get('pid'):
+            return
+        try:
+            process = self.pyker._spawn(name, info, listen_fd=sock.fileno())
+        except Exception as e:
+            self._log(f"Failed to start '{name}': {e}")
+            return
+        
+        info['pid'] = process.pid
+        info['status'] = 'running'
+        info['start_time'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        info.pop('stop_time', None)
+        self.pyker._save_state()
+        self.last_active[name] = (process.pid, time.time())
+        self.pyker._record_event(name, 'activated', f"connection on {info['listen']}", pid=process.pid)
+        self._log(f"Started '{name}' (PID: {process.pid}) for a connection on {info['listen']}")
+    
+    def _stop_idle(self, status: dict, now: float):
+        """Stop on-demand processes that had no connections and used next to no CPU for their idle timeout"""
+        for name, info in list(self.pyker.processes.items()):
+            metrics = status.get(name)
+            if not info.get('listen_enabled') or not metrics or info.get('stopping') or name in self.pre_stops:
+                continue
+            pid, active = self.last_active.get(name, (None, now))
+            if (pid != metrics['pid'] or metrics['cpu_percent'] >= self.IDLE_CPU_PERCENT
+                    or self._has_connections(metrics['pid'])):
+                self.last_active[name] = (metrics['pid'], now)
+                continue
+            idle_timeout = self.pyker._idle_timeout(info)
+            if now - active >= idle_timeout:
+                self._log(f"Process '{name}' idle for {now - active:.0f}s, stopping it until the next connection")
+                self.pyker._record_event(name, 'idle', f"no connections for {now - active:.0f}s", pid=metrics['pid'])
+                self._stop_async(name)
+    
+    @staticmethod
+    def _has_connections(pid: int):
+        """Whether any process of a tree has a connected TCP or UDP socket"""
+        try:
+            root = psutil.Process(pid)
+            for process in [root] + root.children(recursive=True):
+                connections = getattr(process, 'net_connections', None) or process.connections
+                if any(connection.raddr for connection in connections(kind='inet')):
+                    return True
+        except psutil.Error:
+            pass
+        return False
+    
+    def _sync_watches(self):
+        """Watch the paths of running processes started with --watch"""
+        watched = {}
+        for name, info in self.pyker.processes.items():
+            if info.get('watch') and info.get('pid'):
+                ignore = self.pyker.config['watch']['ignore'] + (info.get('watch_ignore') or [])
+                for path in info['watch']:
+                    watched.setdefault(path, {})[name] = ignore
+        
+        if watched.keys() != self.watched.keys():
+            self.watcher.set_roots(watched)
+        self.watched = watched
+        
+        if self.watcher.fd is None:
+            self._on_file_changes(self.watcher.poll())
+    
+    def _on_file_changes(self, paths):
+        """Schedule a debounced restart for every process whose watched files changed"""
+        restart_at = time.time() + self.pyker.config['watch']['debounce']
+        for path in paths:
+            for root, names in self.watched.items():
+                if not FileWatcher.covers(root, path):
+                    continue
+                for name, ignore in names.items():
+                    if not FileWatcher.is_ignored(path, root, ignore):
+                        if ('restart', name) not in self.timers:
+                            self._log(f"Change detected in '{name}': {path}")
+                        self.timers.schedule(('restart', name), restart_at,
+                                             lambda name=name: self._restart_changed(name))
+    
+    def _restart_changed(self, name: str):
+        """Restart a watched process once its files have not changed for the debounce period"""
+        self.pyker.processes = self.pyker._load_state()
+        info = self.pyker.processes.get(name)
+        if info and info.get('watch') and info.get('pid'):
+            self._log(f"Restarting '{name}' after source change")
+            self._stop_async(name, restart=True)
+    
+    def tick(self):
+        """Take one sample of every running process and publish the results"""
+        self.pyker.config = self.pyker._load_config()
+        self.pyker.processes = self.pyker._load_state()
+        self._sync_watches()
+        self._sync_jobs()
+        self._enforce_log_quota()
+        self._check_interpreters()
+        self._sync_stops()
+        self._sync_agent()
+        self._sync_listeners()
+        self._admit_queued()
+        now = time.time()
+        status = {}
+        
+        # One sweep of the process table covers every managed process tree
+        roots = [info['pid'] for info in self.pyker.processes.values() if info.get('pid')]
+        usage = _tree_usage(roots, _scan_processes()) if roots else {}
+        
+        for name in list(self.pyker.processes):
+            info = self.pyker.processes.get(name)
+            if not info or info.get('pid') not in usage:
+                continue
+            metrics = self._sample(name, info, usage[info['pid']], now)
+            if metrics:
+                status[name] = metrics
+        self._stop_idle(status, now)
+        self._handle_exits(usage, now)
+        self._sync_placement(usage)
+        
+        # Forget processes that are stopped or deleted
+        for name in list(self.tracked):
+            if name not in status:
+                del self.tracked[name]
+        live_pids = {metrics['pid'] for metrics in status.values()}
+        for pid in list(self.telemetry):
+            if pid not in live_pids:
+                del self.telemetry[pid]
+        
+        self._publish(status, now)
+        self._publish_table(status, now)
+    
+    def _handle_exits(self, usage: dict, now: float):
+        """Record processes that ended without a stop through pyker and restart those with auto restart"""
+        gone = {}
+        exits = []
+        stale = False
+        for name, info in self.pyker.processes.items():
+            if info.get('cron') or info.get('stopping'):
+                continue
+            pid = info.get('pid')
+            if pid and pid not in usage:
+                # Still recorded with the same PID after a stop would have saved the new state:
+                # it was not stopped through pyker
+                since, news = self.gone.get((name, pid)) or (now, self._exit_is_news(name, info, pid))
+                gone[(name, pid)] = (since, news)
+                if now - since < self.EXIT_GRACE:
+                    continue
+                info['status'] = Pyker._idle_status({**info, 'pid': None})
+                info['pid'] = None
+                info['stop_time'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            elif info.get('exited_pid') and not pid:
+                # The CLI noticed the exit first and cleared the PID; the process may already be untracked
+                # when the supervisor saw it gone before, so whether the exit is news is taken from then
+                pid = info['exited_pid']
+                news = (self.gone.get((name, pid)) or (now, self._exit_is_news(name, info, pid)))[1]
+            elif info.pop('exited_pid', None):
+                # Left over from a run that was replaced by a new start, not an exit of the running process
+                stale = True
+                continue
+            else:
+                continue
+            info.pop('exited_pid', None)
+            exits.append((name, pid, news))
+        self.gone = gone
+        if not exits and not stale:
+            return
+        
+        self.pyker._save_state()
+        for name, pid, news in exits:
+            # Exits of processes from before the supervisor started (e.g. a reboot) are not acted on
+            if not news:
+                continue
+            exit_code = self.exit_codes.pop(pid, None)
+            self.pyker._record_event(name, 'exited', 'process ended on its own', pid=pid, exit_code=exit_code)
+            details = f" with code {exit_code}" if exit_code is not None else ""
+            self._log(f"Process '{name}' (PID: {pid}) exited{details}")
+            info = self.pyker.processes[name]
+            # On-demand processes start again on the next connection
+            if info.get('auto_restart') and not info.get('listen_enabled'):
+                self._auto_restart(name, now)
+    
+    def _sync_placement(self, usage: dict):
+        """Move pinned processes to the CPUs the placement engine assigns now that processes came or went"""
+        running = {name: info for name, info in self.pyker.processes.items()
+                   if info.get('pid') in usage and not info.get('stopping')}
+        plan = self.pyker._placement(running)
+        changed = False
+        for name, info in running.items():
+            cpus = plan.get(name)
+            if cpus == info.get('cpus') or (cpus is None and not info.get('cpus')):
+                continue
+            if cpus is None:
+                # No longer pinned (placement turned off): give the process every CPU back
+                _set_tree_affinity(info['pid'], os.sched_getaffinity(0))
+                self._log(f"Unpinned '{name}' from CPUs {_format_cpu_list(info['cpus'])}")
+                del info['cpus']
+            elif _set_tree_affinity(info['pid'], cpus):
+                self._log(f"Pinned '{name}' to CPUs {_format_cpu_list(cpus)}")
+                info['cpus'] = cpus
+            else:
+                continue
+            changed = True
+        if changed:
+            self.pyker._save_state()
+    
+    def _exit_is_news(self, name: str, info: dict, pid: int):
+        """Whether this supervisor saw the process run or it was started while the supervisor ran"""
+        if self.tracked.get(name, {}).get('pid') == pid:
+            return True
+        try:
+            return datetime.strptime(info['start_time'], "%Y-%m-%d %H:%M:%S").timestamp() >= self.started_at - 1
+        except (KeyError, TypeError, ValueError):
+            return False
+    
+    def _auto_restart(self, name: str, now: float):
+        """Start a process that exited again, unless it keeps exiting"""
+        limit = self.pyker.config['crash_loop']
+        restarts = self.auto_restarts.setdefault(name, collections.deque())
+        while restarts and now - restarts[0] > limit['window']:
+            restarts.popleft()
+        if len(restarts) >= limit['max_restarts']:
+            restarts.clear()
+            message = f"{limit['max_restarts']} restarts in {limit['window']:g}s, not restarting it again"
+            self._log(f"Process '{name}' is crash looping: {message}")
+            self.pyker._record_event(name, 'crash_loop', message)
+            return
+        restarts.append(now)
+        self._log(f"Restarting '{name}' after it exited")
+        self.pyker._start_again(name)
+    
+    def _dispatch_events(self):
+        """Hand lifecycle events written since the last call to the hooks that subscribe to them"""
+        path = self.pyker.events_file
+        try:
+            stat = path.stat()
+        except OSError:
+            return
+        inode, offset = self.events_position
+        if (stat.st_ino, stat.st_size) == (inode, offset):
+            return
+        
+        data = b''
+        if stat.st_ino != inode:
+            # Rotated since the last call: finish the old file first
+            if inode is not None:
+                data = _read_from(path.with_suffix('.jsonl.1'), offset, inode) or b''
+            offset = 0
+        elif stat.st_size < offset:
+            offset = 0
+        new = _read_from(path, offset, stat.st_ino)
+        if new is None:
+            return
+        # A line without its newline is still being written
+        end = new.rfind(b'\n') + 1
+        self.events_position = (stat.st_ino, offset + end)
+        data += new[:end]
+        
+        hooks = self.pyker.config['hooks']
+        if not hooks:
+            return
+        for line in data.split(b'\n')[:-1]:
+            try:
+                record = json.loads(line)
+                name, event = record['name'], record['event']
+            except (ValueError, KeyError, TypeError):
+                continue
+            for hook in hooks:
+                if (any(fnmatch.fnmatch(event, pattern) for pattern in hook.get('events', ['*']))
+                        and any(fnmatch.fnmatch(name, pattern) for pattern in hook.get('processes', ['*']))):
+                    self.dispatcher.submit(hook, record)
+    
+    def _check_interpreters(self):
+        """Schedule a restart of processes whose venv changed, once it stopped changing"""
+        if not self.pyker.config['interpreters']['restart_on_change']:
+            return
+        settle = self.pyker.config['interpreters']['settle_seconds']
+        
+        fingerprints = {}
+        for name, info in self.pyker.processes.items():
+            venv_path = info.get('venv_path')
+            if not venv_path or not info.get('venv_fingerprint') or not info.get('pid') or info.get('cron'):
+                continue
+            if venv_path not in fingerprints:
+                fingerprints[venv_path] = _venv_fingerprint(venv_path)[0]
+            current = fingerprints[venv_path]
+            
+            if current is None or current == info['venv_fingerprint']:
+                self.timers.cancel(('venv', name))
+            elif self.venv_fingerprints.get(venv_path) != current or ('venv', name) not in self.timers:
+                # Still changing (e.g. pip install running): push the restart back
+                if ('venv', name) not in self.timers:
+                    self._log(f"Virtual env of '{name}' changed, restarting once it settles")
+                self.timers.schedule(('venv', name), time.time() + settle,
+                                     lambda name=name: self._restart_for_venv(name))
+        self.venv_fingerprints = fingerprints
+    
+    def _restart_for_venv(self, name: str):
+        self.pyker.processes = self.pyker._load_state()
+        info = self.pyker.processes.get(name)
+        if not info or not info.get('pid') or not info.get('venv_path'):
+            return
+        if _venv_fingerprint(info['venv_path'])[0] not in (None, info.get('venv_fingerprint')):
+            self._log(f"Restarting '{name}' after virtual env change")
+            self._stop_async(name, restart=True)
+    
+    def _enforce_log_quota(self):
+        """Delete the oldest rotated logs while the logs directory is over its quota"""
+        quota = self.pyker.config['log_limits']['quota_mb'] * 1024 * 1024
+        if not quota:
+            return
+        
+        total = 0
+        rotated = []
+        for entry in os.scandir(self.pyker.logs_dir):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            total += stat.st_size
+            if entry.name.rpartition('.')[2].isdigit():
+                rotated.append((stat.st_mtime, stat.st_size, entry.path))
+        
+        rotated.sort()
+        for _, size, path in rotated:
+            if total <= quota:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            self._log(f"Log quota exceeded, removed {os.path.basename(path)}")
+        
+        # Current logs are never deleted, say so once instead of on every tick
+        over_quota = total > quota
+        if over_quota and not self.over_log_quota:
+            self._log(f"Current logs alone use {total / 1024 / 1024:.1f} MB, over the {quota / 1024 / 1024:g} MB quota")
+        self.over_log_quota = over_quota
+    
+    def _stop_async(self, name: str, restart: bool = False):
+        """Stop (and start again) a process without blocking the loop while its hooks run and it drains"""
+        info = self.pyker.processes.get(name)
+        if not info:
+            return False
+        if not info.get('pid'):
+            if restart:
+                return self.pyker._start_again(name)
+            # Nothing runs, but a job can still be unscheduled, a queued start dropped or a socket closed
+            pending = info.get('cron_enabled') or info.get('queued') or info.get('listen_enabled')
+            self.pyker.stop_many([name])
+            return bool(pending)
+        if info.get('stopping') or name in self.pre_stops:
+            print(f"{self.pyker.YELLOW}[WARNING]{self.pyker.RESET} Process '{name}' is already stopping")
+            return True
+        
+        stop_signal, kill_timeout = self.pyker._stop_policy(info)
+        then = ", then starting it again" if restart else ""
+        print(f"{self.pyker.BLUE}[INFO]{self.pyker.RESET} Stopping process '{name}' with {stop_signal} "
+              f"(killed after {kill_timeout:g}s){then}")
+        self.pre_stops[name] = self.hooks.submit(self.pyker._run_pre_stop, name, dict(info))
+        self._poll_pre_stop(name, restart)
+        return True
+    
+    def _poll_pre_stop(self, name: str, restart: bool):
+        """Send the stop signal once the pre-stop hooks are done"""
+        hook = self.pre_stops[name]
+        if not hook.done():
+            self.timers.schedule(('pre_stop', name), time.time() + self.STOP_POLL,
+                                 lambda: self._poll_pre_stop(name, restart))
+            return
+        del self.pre_stops[name]
+        if hook.result():
+            self._log(f"Pre-stop hook of '{name}': {hook.result()}")
+        
+        self.pyker.processes = self.pyker._load_state()
+        info = self.pyker.processes.get(name)
+        if not info or not info.get('pid') or info.get('stopping'):
+            return
+        try:
+            self.pyker._begin_stop(name, restart=restart)
+        except psutil.NoSuchProcess:
+            pass
+        except Exception as e:
+            info.pop('stopping', None)
+            self._log(f"Failed to stop '{name}': {e}")
+        self.pyker._save_state()
+        self._poll_stop(name)
+    
+    def _sync_stops(self):
+        """Take over stops whose CLI went away before the process was gone"""
+        for name, info in self.pyker.processes.items():
+            if info.get('stopping') and ('stop', name) not in self.timers:
+                self._poll_stop(name)
+    
+    def _poll_stop(self, name: str):
+        """Finish a stop once the process tree is gone, killing it at its deadline"""
+        self.pyker.processes = self.pyker._load_state()
+        info = self.pyker.processes.get(name)
+        stopping = info.get('stopping') if info else None
+        if not stopping:
+            return
+        waiter = stopping.get('waiter')
+        if waiter and waiter != os.getpid() and psutil.pid_exists(waiter):
+            # The CLI that sent the signal is still waiting for the process
+            self.timers.schedule(('stop', name), stopping['deadline'] + self.EXIT_GRACE, lambda: self._poll_stop(name))
+            return
+        
+        pid = stopping['pid']
+        process_group = info.get('process_group', False)
+        message = ''
+        if self._tree_alive(pid, process_group):
+            if time.time() < stopping['deadline']:
+                self.timers.schedule(('stop', name), min(stopping['deadline'], time.time() + self.STOP_POLL),
+                                     lambda: self._poll_stop(name))
+                return
+            try:
+                root = psutil.Process(pid)
+                processes = [root] + root.children(recursive=True)
+            except psutil.NoSuchProcess:
+                processes = []
+            self.pyker._kill_tree(pid, process_group, processes)
+            message = f"killed after {stopping['kill_timeout']:g}s"
+        
+        self.pyker._finish_stop(name, message=message)
+        if stopping.get('restart'):
+            self.pyker._start_again(name)
+        # An on-demand process waits for its next connection right away
+        self._sync_listeners()
+    
+    @staticmethod
+    def _tree_alive(pid: int, process_group: bool):
+        """Whether a process or any process of its group is still running"""
+        try:
+            if psutil.Process(pid).status() != psutil.STATUS_ZOMBIE:
+                return True
+        except psutil.NoSuchProcess:
+            pass
+        if process_group and hasattr(os, 'killpg'):
+            try:
+                os.killpg(pid, 0)
+                return True
+            except OSError:
+                pass
+        return False
+    
+    def _sync_agent(self):
+        """Listen on the address of the agent config, or stop listening once it is disabled"""
+        config = self.pyker.config['agent']
+        address = (config.get('bind', '127.0.0.1'), int(config.get('port', 7070))) if config.get('enabled') else None
+        if address == self.agent_address:
+            return
+        self._close_agent()
+        self.agent_address = address
+        if address is None:
+            return
+        
+        try:
+            family = socket.AF_INET6 if ':' in address[0] else socket.AF_INET
+            listener = socket.create_server(address, family=family)
+            listener.setblocking(False)
+        except (OSError, OverflowError) as e:
+            self.agent_error = str(e)
+            self._log(f"Agent failed to listen on {address[0]}:{address[1]}: {e}")
+            return
+        self.agent_listener = listener
+        self.selector.register(listener, selectors.EVENT_READ, self._accept_agent)
+        self._log(f"Agent listening on {address[0]}:{address[1]}")
+    
+    def _close_agent(self):
+        for conn in list(self.agent_clients):
+            self._drop_agent_client(conn)
+        if self.agent_listener:
+            self.selector.unregister(self.agent_listener)
+            self.agent_listener.close()
+            self.agent_listener = None
+        self.agent_error = None
+    
+    def _accept_agent(self):
+        """Greet new connections with the nonce they have to sign with the token"""
+        import secrets
+        
+        while True:
+            try:
+                conn, peer = self.agent_listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                self._log(f"Agent failed to accept a connection: {e}")
+                return
+            if len(self.agent_clients) >= self.AGENT_MAX_CLIENTS:
+                conn.close()
+                continue
+            conn.setblocking(False)
+            self.agent_clients[conn] = {'peer': f"{peer[0]}:{peer[1]}", 'buffer': b'',
+                                        'nonce': secrets.token_hex(16), 'authenticated': False,
+                                        'request': None}
+            self.selector.register(conn, selectors.EVENT_READ, lambda conn=conn: self._read_agent(conn))
+            self.timers.schedule(('agent', id(conn)), time.time() + self.AGENT_AUTH_TIMEOUT,
+                                 lambda conn=conn: self._drop_agent_client(conn))
+            self._send_agent(conn, {'pyker': self.AGENT_PROTOCOL, 'nonce': self.agent_clients[conn]['nonce']})
+    
+    def _drop_agent_client(self, conn):
+        if self.agent_clients.pop(conn, None) is None:
+            return
+        self.timers.cancel(('agent', id(conn)))
+        self.selector.unregister(conn)
+        conn.close()
+    
+    def _read_agent(self, conn):
+        """Handle the complete request lines received from a client"""
+        client = self.agent_clients.get(conn)
+        if client is None:
+            return
+        try:
+            data = conn.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b''
+        if not data:
+            self._drop_agent_client(conn)
+            return
+        
+        client['buffer'] += data
+        self._agent_lines(conn, client)
+        if conn in self.agent_clients and len(client['buffer']) > self.AGENT_MAX_LINE:
+            self._drop_agent_client(conn)
+    
+    def _agent_lines(self, conn, client: dict):
+        """Handle the buffered request lines in order, waiting while a worker answers one"""
+        while conn in self.agent_clients and client['request'] is None:
+            line, newline, rest = client['buffer'].partition(b'\n')
+            if not newline:
+                break
+            client['buffer'] = rest
+            self._agent_message(conn, client, line)
+    
+    def _agent_message(self, conn, client: dict, line: bytes):
+        try:
+            message = json.loads(line)
+            if not isinstance(message, dict):
+                raise ValueError('not an object')
+        except ValueError:
+            self._send_agent(conn, {'ok': False, 'error': 'invalid request'})
+            self._drop_agent_client(conn)
+            return
+        
+        if not client['authenticated']:
+            import hmac
+            import hashlib
+            expected = hmac.new(self.pyker._agent_token().encode(), client['nonce'].encode(), hashlib.sha256)
+            if not hmac.compare_digest(str(message.get('auth', '')).encode(), expected.hexdigest().encode()):
+                self._log(f"Agent: authentication failed from {client['peer']}")
+                self._send_agent(conn, {'ok': False, 'error': 'authentication failed'})
+                self._drop_agent_client(conn)
+                return
+            client['authenticated'] = True
+            self._send_agent(conn, {'ok': True})
+        elif message.get('command') in self.AGENT_READ_COMMANDS:
+            # Reading the state and logs of many processes takes a while, the loop keeps supervising meanwhile
+            client['request'] = self.agent_workers.submit(self._agent_read, message)
+            self._poll_agent_request(conn)
+            return
+        else:
+            try:
+                response = self._agent_request(message)
+            except Exception as e:
+                response = {'ok': False, 'error': str(e)}
+            self._send_agent(conn, response)
+        
+        if conn in self.agent_clients:
+            self.timers.schedule(('agent', id(conn)), time.time() + self.AGENT_IDLE_TIMEOUT,
+                                 lambda: self._drop_agent_client(conn))
+    
+    def _poll_agent_request(self, conn):
+        """Send the answer of a worker once it is ready, then go on with the client's next requests"""
+        client = self.agent_clients.get(conn)
+        if client is None:
+            return
+        request = client['request']
+        # The poll takes the place of the idle timeout while the client waits
+        if not request.done():
+            self.timers.schedule(('agent', id(conn)), time.time() + self.AGENT_POLL,
+                                 lambda: self._poll_agent_request(conn))
+            return
+        client['request'] = None
+        try:
+            response = request.result()
+        except Exception as e:
+            response = {'ok': False, 'error': str(e)}
+        self._send_agent(conn, response)
+        if conn not in self.agent_clients:
+            return
+        self.timers.schedule(('agent', id(conn)), time.time() + self.AGENT_IDLE_TIMEOUT,
+                             lambda: self._drop_agent_client(conn))
+        self._agent_lines(conn, client)
+    
+    def _agent_read(self, request: dict):
+        """Answer a list, info or logs request in a worker thread, with its own copy of the state"""
+        pyker = Pyker()
+        command = request.get('command')
+        name = request.get('name')
+        
+        if command == 'list':
+            pyker._refresh_processes()
+            return {'ok': True, 'result': [pyker._process_record(name, info) for name, info in pyker.processes.items()]}
+        if name not in pyker.processes:
+            return {'ok': False, 'error': f"Process '{name}' not found"}
+        
+        if command == 'info':
+            pyker._update_process_status(name)
+            pyker._update_tree_usage()
+            return {'ok': True, 'result': pyker._info_record(name)}
+        if command == 'logs':
+            info = pyker.processes[name]
+            lines = min(int(request.get('lines', 50)), self.AGENT_MAX_LOG_LINES)
+            result, complete = pyker._recent_output(name, lines)
+            if not complete:
+                try:
+                    result = _tail_lines(Path(info.get('log_file', '')), lines)
+                except OSError:
+                    result = []
+            return {'ok': True, 'result': result, 'log_format': info.get('log_format', 'raw')}
+    
+    def _agent_request(self, request: dict):
+        """Run a restart or stop of a remote `pyker --hosts` CLI"""
+        pyker = self.pyker
+        pyker.processes = pyker._load_state()
+        command = request.get('command')
+        name = request.get('name')
+        
+        if command not in ('restart', 'stop'):
+            return {'ok': False, 'error': f"Unsupported command '{command}'"}
+        if name not in pyker.processes:
+            return {'ok': False, 'error': f"Process '{name}' not found"}
+        
+        # Same messages as the local command, the stop itself finishes in the background
+        self._log(f"Agent: {command} '{name}'")
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            ok = self._stop_async(name, restart=(command == 'restart'))
+        return {'ok': bool(ok), 'output': ANSI_ESCAPE.sub('', output.getvalue())}
+    
+    def _send_agent(self, conn, message: dict):
+        """Send one JSON line, dropping clients that do not read their responses"""
+        try:
+            conn.settimeout(self.AGENT_SEND_TIMEOUT)
+            conn.sendall(json.dumps(message, ensure_ascii=False).encode('utf-8') + b'\n')
+            conn.setblocking(False)
+        except OSError:
+            self._drop_agent_client(conn)
+    
+    def _sample(self, name: str, info: dict, usage: tuple, now: float):
+        """Record one sample of a process tree and run anomaly detection on it"""
+        pid = info['pid']
+        cpu_seconds, rss, count = usage
+        memory_mb = rss / 1024 / 1024
+        
+        tracked = self.tracked.get(name)
+        if not tracked or tracked['pid'] != pid:
+            window = self.pyker.config['anomaly_detection']['trend_window']
+            tracked = {
+                'pid': pid,
+                'started': now,
+                'cpu_seconds': cpu_seconds,
+                'sampled': now,
+                'memory_trend': TrendDetector(window),
+                'spin_since': None,
+                'handled': set()
+            }
+            self.tracked[name] = tracked
+        
+        # CPU time of exited descendants disappears from the sum, never report negative usage
+        elapsed = now - tracked['sampled']
+        cpu = max(0.0, (cpu_seconds - tracked['cpu_seconds']) / elapsed * 100) if elapsed > 0 else 0.0
+        tracked['cpu_seconds'] = cpu_seconds
+        tracked['sampled'] = now
+        
+        anomalies = self._detect(tracked, cpu, memory_mb, now)
+        self._act(name, info, tracked, anomalies)
+        
+        trend = tracked['memory_trend']
+        return {
+            'pid': pid,
+            'cpu_percent': round(cpu, 1),
+            'memory_mb': round(memory_mb, 1),
+            'processes': count,
+            'memory_trend_mb_per_hour': round(trend.slope * 3600, 2) if trend.count > 1 else None,
+            'anomalies': anomalies,
+            'telemetry': self.telemetry.get(pid)
+        }
+    
+    def _detect(self, tracked: dict, cpu: float, memory_mb: float, now: float):
+        """Update detectors with a new sample and return current anomalies"""
+        settings = self.pyker.config['anomaly_detection']
+        if not settings['enabled']:
+            return []
+        
+        anomalies = []
+        
+        # Steady memory growth: a positive slope that fits the samples well
+        trend = tracked['memory_trend']
+        trend.add(now - tracked['started'], memory_mb)
+        growth_per_hour = trend.slope * 3600
+        if (trend.count >= settings['trend_window']
+                and growth_per_hour >= settings['memory_growth_mb_per_hour']
+                and trend.correlation >= settings['min_correlation']):
+            anomalies.append({
+                'kind': 'memory_leak',
+                'message': f"memory growing {growth_per_hour:.1f} MB/h (r={trend.correlation:.2f})"
+            })
+        
+        # Sustained CPU spin
+        if cpu >= settings['cpu_spin_percent']:
+            if tracked['spin_since'] is None:
+                tracked['spin_since'] = now
+            spinning_for = now - tracked['spin_since']
+            if spinning_for >= settings['cpu_spin_seconds']:
+                anomalies.append({
+                    'kind': 'cpu_spin',
+                    'message': f"CPU at {cpu:.0f}% for {int(spinning_for)}s"
+                })
+        else:
+            tracked['spin_since'] = None
+        
+        # Allow a new action once an anomaly has cleared
+        tracked['handled'] &= {anomaly['kind'] for anomaly in anomalies}
+        return anomalies
+    
+    def _act(self, name: str, info: dict, tracked: dict, anomalies: list):
+        """Run the configured action for newly detected anomalies"""
+        action = info.get('anomaly_action') or self.pyker.config['anomaly_detection']['action']
+        
+        for anomaly in anomalies:
+            if anomaly['kind'] in tracked['handled']:
+                continue
+            tracked['handled'].add(anomaly['kind'])
+            self._log(f"Process '{name}': {anomaly['message']} (action: {action})")
+            self.pyker._record_event(name, 'anomaly', f"{anomaly['message']} (action: {action})", pid=tracked['pid'])
+            
+            if action == 'dump':
+                # Only processes started through the bootstrap handle SIGUSR1, others would be killed
+                if info.get('bootstrap') and hasattr(signal, 'SIGUSR1'):
+                    try:
+                        os.kill(tracked['pid'], signal.SIGUSR1)
+                    except OSError as e:
+                        self._log(f"Failed to dump stack of '{name}': {e}")
+                else:
+                    self._log(f"Process '{name}' cannot dump its stack, restart it to enable (or use --inspect)")
+            elif action == 'restart':
+                self._stop_async(name, restart=True)
+                return
+    
+    def _agent_status(self):
+        if self.agent_address is None:
+            return None
+        return {'address': f"{self.agent_address[0]}:{self.agent_address[1]}",
+                'listening': self.agent_listener is not None, 'error': self.agent_error,
+                'clients': len(self.agent_clients)}
+    
+    def _publish(self, status: dict, now: float):
+        """Atomically write the latest metrics for the CLI"""
+        status_file = self.pyker.status_file
+        tmp_file = status_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'updated': now, 'processes': status, 'agent': self._agent_status()}, f, ensure_ascii=False)
+        os.replace(tmp_file, status_file)
+    
+    def _publish_table(self, status: dict, now: float):
+        """Write the state of every process, running or not, to the shared status table"""
+        rows = []
+        for name, info in self.pyker.processes.items():
+            metrics = status.get(name) or {}
+            if info.get('stopping'):
+                state = 'stopping'
+            elif metrics:
+                state = 'running'
+            else:
+                state = self.pyker._idle_status(info)
+            try:
+                started = datetime.strptime(info.get('start_time') or '', "%Y-%m-%d %H:%M:%S").timestamp()
+            except ValueError:
+                started = 0.0
+            rows.append({
+                'name': name,
+                'pid': metrics.get('pid') or info.get('pid'),
+                'status': state,
+                'anomalies': [anomaly['kind'] for anomaly in metrics.get('anomalies', [])],
+                'cpu_percent': metrics.get('cpu_percent', 0.0),
+                'memory_mb': metrics.get('memory_mb', 0.0),
+                'restarts': info.get('restarts', 0),
+                'started': started,
+                'processes': metrics.get('processes', 0)
+            })
+        self.table.write(rows, now)
+
+
+class RemoteHost:
+    """Connection to the agent of a pyker host, reused for all requests of one command"""
+    
+    DEFAULT_PORT = 7070
+    
+    def __init__(self, address: str, token: str, timeout: float):
+        self.address = address
+        self.host, self.port = address, self.DEFAULT_PORT
+        if address.startswith('['):
+            # [IPv6 address]:port
+            self.host, _, port = address[1:].partition(']')
+            if port:
+                self.port = int(port.lstrip(':'))
+        elif address.count(':') == 1:
+            self.host, port = address.split(':')
+            self.port = int(port)
+        self.token = token
+        self.timeout = timeout
+        self.sock = None
+        self.file = None
+    
+    def call(self, command: str, **arguments):
+        """Send one request and wait for its response"""
+        if self.sock is None:
+            self._connect()
+        self._send(dict(arguments, command=command))
+        return self._receive()
+    
+    def _connect(self):
+        """Open the connection and answer the challenge of the agent"""
+        import hmac
+        import hashlib
+        
+        self.sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self.file = self.sock.makefile('rwb')
+        hello = self._receive()
+        signature = hmac.new(self.token.encode(), str(hello.get('nonce', '')).encode(), hashlib.sha256)
+        self._send({'auth': signature.hexdigest()})
+        response = self._receive()
+        if not response.get('ok'):
+            raise PermissionError(response.get('error', 'authentication failed'))
+    
+    def _send(self, message: dict):
+        self.file.write(json.dumps(message).encode('utf-8') + b'\n')
+        self.file.flush()
+    
+    def _receive(self):
+        line = self.file.readline()
+        if not line:
+            raise ConnectionError('connection closed by agent')
+        return json.loads(line)
+    
+    def close(self):
+        if self.sock is None:
+            return
+        try:
+            self.file.close()
+            self.sock.close()
+        except OSError:
+            pass
+        self.sock = None
+
+
+CAPTURE_CHUNK = 65536
+CAPTURE_MAX_LINE = 65536
+IMPORT_TIME_PREFIX = b'import time:'
+IMPORT_TIME_MARKER = 'import time: -- script --'  # printed by pyker_bootstrap before the script runs
+STARTUP_HISTORY = 10
+
+
+def _record_startup(path: str, first_output: float):
+    """Add the time to first output of a start to the history of a process"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            starts = json.load(f)
+    except (OSError, ValueError):
+        starts = []
+    starts.append({'time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"), 'first_output': round(first_output, 3)})
+    tmp_file = f"{path}.tmp"
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(starts[-STARTUP_HISTORY:], f)
+        os.replace(tmp_file, path)
+    except OSError:
+        pass
+
+
+def _parse_import_times(path: Path):
+    """Read -X importtime output as (pyker's imports, the script's imports), each a list of
+    (module, self microseconds, cumulative microseconds, nesting depth)"""
+    sections = ([], [])
+    section = 0
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                line = line.rstrip('\n')
+                if line == IMPORT_TIME_MARKER:
+                    section = 1
+                    continue
+                fields = line[len('import time:'):].split('|')
+                if len(fields) != 3 or not fields[0].strip().isdigit():
+                    continue
+                module = fields[2][1:]
+                depth = (len(module) - len(module.lstrip(' '))) // 2
+                sections[section].append((module.strip(), int(fields[0]), int(fields[1]), depth))
+    except OSError:
+        pass
+    return sections
+
+
+class LogRing:
+    """The most recent log output in a bytearray allocated once, overwritten from the start when full"""
+    
+    def __init__(self, size: int, history: bool):
+        self.buffer = bytearray(size)
+        self.size = size
+        self.end = 0  # bytes written in total
+        self.history = history  # the log already had older lines when the ring started
+    
+    def write(self, data: bytes):
+        if len(data) > self.size:
+            self.end += len(data) - self.size
+            data = data[-self.size:]
+        start = self.end % self.size
+        first = min(len(data), self.size - start)
+        self.buffer[start:start + first] = data[:first]
+        self.buffer[:len(data) - first] = data[first:]
+        self.end += len(data)
+    
+    def tail(self, count: int):
+        """Last count lines, and whether the ring held all of them"""
+        if self.end <= self.size:
+            data = bytes(self.buffer[:self.end])
+        else:
+            start = self.end % self.size
+            data = bytes(self.buffer[start:] + self.buffer[:start])
+            # The oldest line was partly overwritten
+            data = data[data.find(b'\n') + 1:]
+        lines = data.split(b'\n')[:-1][-count:] if count > 0 else []
+        return lines, len(lines) == count or (self.end <= self.size and not self.history)
+
+
+class LogLimiter:
+    """Token buckets for lines and bytes per second, counting the lines they drop"""
+    
+    def __init__(self, lines_per_second: float, bytes_per_second: float, burst_seconds: float):
+        self.lines_rate = lines_per_second
+        self.bytes_rate = bytes_per_second
+        self.lines_capacity = lines_per_second * burst_seconds
+        self.bytes_capacity = bytes_per_second * burst_seconds
+        self.lines = self.lines_capacity
+        self.bytes = self.bytes_capacity
+        self.updated = time.monotonic()
+        self.reported = self.updated
+        self.suppressed_lines = 0
+        self.suppressed_bytes = 0
+    
+    @property
+    def active(self):
+        return bool(self.lines_rate or self.bytes_rate)
+    
+    def admit(self, lines, now: float):
+        """Return the lines that fit in the buckets and count the rest as suppressed"""
+        elapsed = now - self.updated
+        self.updated = now
+        if self.lines_rate:
+            self.lines = min(self.lines_capacity, self.lines + elapsed * self.lines_rate)
+        if self.bytes_rate:
+            self.bytes = min(self.bytes_capacity, self.bytes + elapsed * self.bytes_rate)
+        
+        # Drop a whole chunk at once while the line bucket is empty
+        if self.lines_rate and self.lines < 1:
+            self.suppressed_lines += len(lines)
+            self.suppressed_bytes += sum(map(len, lines)) + len(lines)
+            return []
+        
+        admitted = []
+        for line in lines:
+            size = len(line) + 1
+            # A full bucket lets a line through even if it is longer than the bucket
+            if ((not self.lines_rate or self.lines >= 1)
+                    and (not self.bytes_rate or self.bytes >= min(size, self.bytes_capacity))):
+                if self.lines_rate:
+                    self.lines -= 1
+                if self.bytes_rate:
+                    self.bytes -= size
+                admitted.append(line)
+            else:
+                self.suppressed_lines += 1
+                self.suppressed_bytes += size
+        return admitted
+    
+    def report(self, now: float, final: bool = False):
+        """Summary of the lines dropped since the last one, at most once a second"""
+        if not self.suppressed_lines or (not final and now - self.reported < 1):
+            return None
+        message = (f"suppressed {self.suppressed_lines} lines ({self.suppressed_bytes / 1024:.1f} KB) "
+                   f"over the log rate limit")
+        self.reported = now
+        self.suppressed_lines = 0
+        self.suppressed_bytes = 0
+        return message.encode()
+
+
+class LogSink(threading.Thread):
+    """Forward captured lines to one collector in batches from a background thread.
+    
+    The capture loop never waits for the collector: when the queue is full or the collector
+    is unreachable, lines are spilled to a file and sent once it is back.
+    """
+    
+    DEFAULT_ADDRESSES = {'syslog': '/dev/log', 'journald': '/run/systemd/journal/socket'}
+    
+    def __init__(self, config: dict, process_name: str, spool_file: Path):
+        super().__init__(daemon=True)
+        self.kind = config['type']
+        self.address = config.get('address') or self.DEFAULT_ADDRESSES.get(self.kind)
+        if self.kind not in ('syslog', 'journald', 'tcp', 'unix') or not self.address:
+            raise ValueError(f"invalid log sink {config}")
+        self.batch_lines = config.get('batch_lines', 500)
+        self.flush_interval = config.get('flush_interval', 1.0)
+        self.queue_lines = config.get('queue_lines', 10000)
+        self.spool_bytes = config.get('spool_mb', 100) * 1024 * 1024
+        self.process_name = process_name
+        self.hostname = socket.gethostname()
+        self.spool_file = spool_file
+        self.queue = collections.deque()  # (time, stream, line) records
+        self.condition = threading.Condition()
+        self.spilling = spool_file.exists()  # a previous run left lines to send first
+        self.closing = False
+        self.sock = None
+        self.retry_at = 0
+        self.retry_delay = 1
+    
+    def submit(self, records):
+        """Queue records for sending, spilling them to disk if the queue is full or already spilling"""
+        with self.condition:
+            if self.spilling or len(self.queue) + len(records) > self.queue_lines:
+                self._spill(records)
+            else:
+                self.queue.extend(records)
+                if len(self.queue) >= self.batch_lines:
+                    self.condition.notify()
+    
+    def close(self, timeout: float = 5):
+        """Send what is queued if the collector allows, spill the rest"""
+        with self.condition:
+            self.closing = True
+            self.condition.notify()
+        self.join(timeout)
+        with self.condition:
+            self._spill(list(self.queue))
+            self.queue.clear()
+    
+    def _spill(self, records):
+        # Called with the condition held
+        if not records:
+            return
+        self.spilling = True
+        try:
+            if self.spool_file.exists() and self.spool_file.stat().st_size > self.spool_bytes:
+                return
+            self.spool_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.spool_file, 'a', encoding='utf-8') as f:
+                f.writelines(self._spool_line(record) for record in records)
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _spool_line(record):
+        now, stream, line = record
+        return json.dumps({'time': now, 'stream': stream, 'line': line.decode('utf-8', errors='replace')}) + '\n'
+    
+    def run(self):
+        while True:
+            with self.condition:
+                if not self.closing and len(self.queue) < self.batch_lines and not self.spilling:
+                    self.condition.wait(self.flush_interval)
+                closing = self.closing
+                if time.monotonic() < self.retry_at:
+                    if closing:
+                        return
+                    self.condition.wait(self.retry_at - time.monotonic())
+                    continue
+                batch = [self.queue.popleft() for _ in range(min(self.batch_lines, len(self.queue)))]
+            
+            # Spilled lines are older than anything queued, send them first
+            if self.spilling and not self._send_spool():
+                with self.condition:
+                    self._spill(batch)
+                if closing:
+                    return
+                continue
+            if batch and not self._send(batch):
+                with self.condition:
+                    # Keep the order: everything queued behind the batch goes to disk too
+                    self._spill(batch + list(self.queue))
+                    self.queue.clear()
+            
+            if closing:
+                with self.condition:
+                    if not self.queue:
+                        return
+    
+    def _send_spool(self):
+        """Send spilled lines; True once nothing is left on disk"""
+        sending = self.spool_file.with_suffix('.sending')
+        while True:
+            with self.condition:
+                if not sending.exists():
+                    if not self.spool_file.exists():
+                        self.spilling = False
+                        return True
+                    os.replace(self.spool_file, sending)
+            
+            records = []
+            with open(sending, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        records.append((record['time'], record['stream'], record['line'].encode('utf-8')))
+                    except (ValueError, KeyError):
+                        continue
+            for start in range(0, len(records), self.batch_lines):
+                if not self._send(records[start:start + self.batch_lines]):
+                    # Keep what was not sent for the next attempt
+                    with open(sending, 'w', encoding='utf-8') as f:
+                        f.writelines(self._spool_line(record) for record in records[start:])
+                    return False
+            os.unlink(sending)
+    
+    def _connect(self):
+        if self.kind == 'tcp':
+            host, _, port = self.address.rpartition(':')
+            return socket.create_connection((host, int(port)), timeout=5)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM if self.kind == 'unix' else socket.SOCK_DGRAM)
+        sock.settimeout(5)
+        sock.connect(self.address)
+        return sock
+    
+    def _send(self, records):
+        """Send one batch; on failure drop the connection and back off"""
+        try:
+            if self.sock is None:
+                self.sock = self._connect()
+            if self.kind in ('tcp', 'unix'):
+                self.sock.sendall(b''.join(self._json_line(record) for record in records))
+            else:
+                encode = self._syslog_message if self.kind == 'syslog' else self._journald_message
+                for record in records:
+                    self.sock.send(encode(record))
+        except OSError:
+            if self.sock is not None:
+                self.sock.close()
+                self.sock = None
+            self.retry_at = time.monotonic() + self.retry_delay
+            self.retry_delay = min(self.retry_delay * 2, 30)
+            return False
+        self.retry_delay = 1
+        return True
+    
+    def _json_line(self, record):
+        now, stream, line = record
+        return (json.dumps({
+            'time': datetime.fromtimestamp(now).isoformat(),
+            'host': self.hostname,
+            'name': self.process_name,
+            'stream': stream,
+            'line': line.decode('utf-8', errors='replace')
+        }, ensure_ascii=False) + '\n').encode('utf-8')
+    
+    def _syslog_message(self, record):
+        # Facility user, severity err for stderr and info otherwise
+        now, stream, line = record
+        priority = 11 if stream == 'stderr' else 14
+        stamp = datetime.fromtimestamp(now).strftime('%b %d %H:%M:%S')
+        return f"<{priority}>{stamp} pyker/{self.process_name}: ".encode('utf-8') + line
+    
+    def _journald_message(self, record):
+        _, stream, line = record
+        return (f"PRIORITY={3 if stream == 'stderr' else 6}\n"
+                f"SYSLOG_IDENTIFIER=pyker/{self.process_name}\n"
+                f"PYKER_PROCESS={self.process_name}\n"
+                f"PYKER_STREAM={stream}\n").encode('utf-8') + b'MESSAGE=' + line + b'\n'
+
+
+class HookDispatcher:
+    """Deliver lifecycle events to hooks from worker threads, so a slow hook never holds up the supervisor.
+    
+    Events wait in a bounded queue. A new event replaces one of the same kind, process and hook that is
+    still waiting and counts as one more occurrence; when the queue is full the oldest event is dropped.
+    Failed deliveries are retried with a growing delay.
+    """
+    
+    # Calls a `module:function` hook with the event read from stdin
+    PYTHON_HOOK = ("import importlib, json, sys; module, _, function = sys.argv[1].partition(':'); "
+                   "getattr(importlib.import_module(module), function)(json.load(sys.stdin))")
+    
+    def __init__(self, settings: dict, log):
+        self.queue_size = settings.get('queue_size', 256)
+        self.retries = settings.get('retries', 3)
+        self.timeout = settings.get('timeout', 10)
+        self.log = log
+        self.pending = collections.OrderedDict()  # (hook, name, event) -> delivery waiting for a worker
+        self.condition = threading.Condition()
+        self.closing = False
+        for _ in range(max(1, settings.get('workers', 4))):
+            threading.Thread(target=self._work, daemon=True).start()
+    
+    def submit(self, hook: dict, record: dict):
+        """Queue an event for one hook without waiting for it to be delivered"""
+        key = (json.dumps(hook, sort_keys=True), record['name'], record['event'])
+        with self.condition:
+            delivery = self.pending.get(key)
+            if delivery:
+                delivery['record'] = record
+                delivery['count'] += 1
+                return
+            if len(self.pending) >= self.queue_size:
+                _, dropped = self.pending.popitem(last=False)
+                self.log(f"Hook queue full, dropped {dropped['record']['event']} event of '{dropped['record']['name']}'")
+            self.pending[key] = {'key': key, 'hook': hook, 'record': record, 'count': 1, 'attempt': 0, 'due': 0}
+            self.condition.notify()
+    
+    def close(self):
+        """Stop the workers, events still waiting are dropped"""
+        with self.condition:
+            self.closing = True
+            self.condition.notify_all()
+    
+    def _work(self):
+        while True:
+            with self.condition:
+                delivery = self._next_due()
+                if delivery is None:
+                    return
+            
+            record = dict(delivery['record'], count=delivery['count'])
+            try:
+                self._deliver(delivery['hook'], record)
+                continue
+            except Exception as e:
+                problem = e
+            
+            delivery['attempt'] += 1
+            target = delivery['hook'].get('command') or delivery['hook'].get('url') or delivery['hook'].get('python')
+            if delivery['attempt'] > self.retries:
+                self.log(f"Hook {target} failed for {record['event']} event of '{record['name']}': {problem}")
+                continue
+            with self.condition:
+                # Events that came in meanwhile are sent together with the one being retried
+                newer = self.pending.get(delivery['key'])
+                if newer:
+                    newer['count'] += delivery['count']
+                    newer['attempt'] = delivery['attempt']
+                    newer['due'] = max(newer['due'], time.monotonic() + 2 ** delivery['attempt'])
+                else:
+                    delivery['due'] = time.monotonic() + 2 ** delivery['attempt']
+                    self.pending[delivery['key']] = delivery
+                self.condition.notify()
+    
+    def _next_due(self):
+        # Called with the condition held, waits until a delivery is due or the dispatcher closes
+        while not self.closing:
+            now = time.monotonic()
+            for key, delivery in self.pending.items():
+                if delivery['due'] <= now:
+                    return self.pending.pop(key)
+            waits = [delivery['due'] - now for delivery in self.pending.values()]
+            self.condition.wait(min(waits) if waits else None)
+        return None
+    
+    def _deliver(self, hook: dict, record: dict):
+        """Run a shell command, POST to a URL or call a Python function with one event"""
+        if hook.get('command'):
+            env = dict(os.environ, PYKER_EVENT=record['event'], PYKER_NAME=record['name'],
+                       PYKER_PID=str(record.get('pid') or ''),
+                       PYKER_EXIT_CODE='' if record.get('exit_code') is None else str(record['exit_code']),
+                       PYKER_MESSAGE=record.get('message') or '', PYKER_COUNT=str(record['count']))
+            try:
+                result = subprocess.run(hook['command'], shell=True, env=env, timeout=self.timeout,
+                                        input=json.dumps(record), capture_output=True, text=True, errors='replace')
+            except subprocess.TimeoutExpired:
+                raise RuntimeError(f"command did not finish in {self.timeout}s")
+            if result.returncode:
+                output = (result.stderr or result.stdout).strip().splitlines()
+                raise RuntimeError(f"command exited with code {result.returncode}"
+                                   + (f": {output[-1]}" if output else ""))
+        elif hook.get('url'):
+            import urllib.request
+            headers = dict(hook.get('headers', {}), **{'Content-Type': 'application/json'})
+            request = urllib.request.Request(hook['url'], data=json.dumps(record).encode('utf-8'),
+                                             method='POST', headers=headers)
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                response.read()
+        elif hook.get('python'):
+            # A call cannot be interrupted, so it runs in its own interpreter that is killed at the timeout;
+            # the module must be importable with the supervisor's environment (PYTHONPATH)
+            try:
+                result = subprocess.run([sys.executable, '-c', self.PYTHON_HOOK, hook['python']],
+                                        timeout=self.timeout, input=json.dumps(record),
+                                        capture_output=True, text=True, errors='replace')
+            except subprocess.TimeoutExpired:
+                raise RuntimeError(f"function did not return in {self.timeout}s")
+            if result.returncode:
+                output = result.stderr.strip().splitlines()
+                raise RuntimeError("function failed" + (f": {output[-1]}" if output else ""))
+        else:
+            raise ValueError("hook needs a command, url or python entry point")
+
+
+def _format_captured(lines, stream: str, log_format: str, now: float):
+    """Render complete lines read in one chunk, all stamped with the time of the read"""
+    if log_format == 'raw':
+        prefix = b'[pyker] ' if stream == 'pyker' else b''
+        return b''.join(prefix + line + b'\n' for line in lines)
+    
+    stamp = datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S.%f")
+    if log_format == 'jsonl':
+        head = f'{{"time": "{stamp}", "stream": "{stream}", "line": '.encode()
+        return b''.join(head + json.dumps(line.decode('utf-8', errors='replace'), ensure_ascii=False).encode('utf-8')
+                        + b'}\n' for line in lines)
+    prefix = f"{stamp} [{stream}] ".encode()
+    return b''.join(prefix + line + b'\n' for line in lines)
+
+
+def _capture(argv):
+    """Copy the stdout and stderr pipes of a managed script into its log until both are closed"""
+    argv = list(argv)
+    options = {}
+    while argv and argv[0].startswith('--'):
+        options[argv[0][2:]] = argv[1]
+        argv = argv[2:]
+    log_path = argv[0]
+    log_format = options['format']
+    max_bytes = int(options['max-bytes'])
+    limiter = LogLimiter(float(options['lines-per-second']), float(options['bytes-per-second']),
+                         float(options['burst']))
+    
+    sinks = []
+    for index, config in enumerate(json.loads(options['sinks'])):
+        spool_file = Path(options['spool-dir']) / f"{options['name']}.{index}.jsonl"
+        try:
+            sinks.append(LogSink(config, options['name'], spool_file))
+        except (ValueError, KeyError):
+            continue
+    for sink in sinks:
+        sink.start()
+    
+    streams = {int(options['stdout-fd']): 'stdout', int(options['stderr-fd']): 'stderr'}
+    pending = {fd: b'' for fd in streams}
+    selector = selectors.DefaultSelector()
+    for fd in streams:
+        selector.register(fd, selectors.EVENT_READ)
+    
+    log = open(log_path, 'ab')
+    import_times = open(options['import-times'], 'wb') if options.get('import-times') else None
+    started = float(options['started'])
+    first_output = None
+    ring = listener = None
+    if int(options['ring-size']) > 0 and hasattr(socket, 'AF_UNIX'):
+        ring = LogRing(int(options['ring-size']), history=log.tell() > 0)
+        listener = _listen_ring(options['ring-socket'])
+        if listener:
+            selector.register(listener, selectors.EVENT_READ)
+            bound = os.stat(options['ring-socket']).st_ino
+    
+    def write(data):
+        log.write(data)
+        if ring:
+            ring.write(data)
+    
+    try:
+        while streams:
+            # Wake up to report suppressed lines even when the script went quiet
+            events = selector.select(1 if limiter.suppressed_lines else None)
+            now = time.time()
+            for key, _ in events:
+                if key.fileobj is listener:
+                    _serve_ring(listener, ring)
+                    continue
+                fd = key.fd
+                chunk = os.read(fd, CAPTURE_CHUNK)
+                if chunk:
+                    lines = (pending[fd] + chunk).split(b'\n')
+                    pending[fd] = lines.pop()
+                    # Never hold more than one line's worth of output without a newline
+                    if len(pending[fd]) >= CAPTURE_MAX_LINE:
+                        lines.append(pending[fd])
+                        pending[fd] = b''
+                else:
+                    lines = [pending[fd]] if pending[fd] else []
+                    selector.unregister(fd)
+                    os.close(fd)
+                
+                # -X importtime reports go to their own file, not the log
+                if import_times and streams[fd] == 'stderr' and lines:
+                    timings = [line for line in lines if line.startswith(IMPORT_TIME_PREFIX)]
+                    if timings:
+                        import_times.write(b'\n'.join(timings) + b'\n')
+                        import_times.flush()
+                        lines = [line for line in lines if not line.startswith(IMPORT_TIME_PREFIX)]
+                if lines and first_output is None:
+                    first_output = now
+                    _record_startup(options['startup-file'], first_output - started)
+                
+                if lines and limiter.active:
+                    lines = limiter.admit(lines, time.monotonic())
+                if lines:
+                    write(_format_captured(lines, streams[fd], log_format, now))
+                    if sinks:
+                        records = [(now, streams[fd], line) for line in lines]
+                        for sink in sinks:
+                            sink.submit(records)
+                if not chunk:
+                    del streams[fd]
+            
+            report = limiter.report(time.monotonic(), final=not streams)
+            if report:
+                write(_format_captured([report], 'pyker', log_format, now))
+            log.flush()
+            
+            if max_bytes and log.tell() >= max_bytes:
+                log.close()
+                _rotate_log(Path(log_path), int(options['max-files']))
+                log = open(log_path, 'ab')
+    finally:
+        log.close()
+        if import_times:
+            import_times.close()
+        if listener:
+            _close_ring(listener, options['ring-socket'], bound)
+        for sink in sinks:
+            sink.close()
+
+
+def _listen_ring(path: str):
+    """Listen for requests of the CLI for recent output, None if the socket cannot be created"""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+    try:
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(path)
+        listener.listen(8)
+        listener.setblocking(False)
+    except OSError:
+        return None
+    return listener
+
+
+def _serve_ring(listener, ring: LogRing):
+    """Send the last lines asked for, after a line telling whether the ring held all of them"""
+    try:
+        conn, _ = listener.accept()
+    except (BlockingIOError, InterruptedError):
+        return
+    with conn:
+        try:
+            conn.settimeout(1)
+            lines, complete = ring.tail(int(conn.recv(64).strip() or 0))
+            conn.sendall((b'complete\n' if complete else b'partial\n') + b''.join(line + b'\n' for line in lines))
+        except (OSError, ValueError):
+            pass
+
+
+def _close_ring(listener, path: str, inode: int):
+    # A restarted process may already have a new capture process listening on the same path
+    try:
+        if os.stat(path).st_ino == inode:
+            os.unlink(path)
+    except OSError:
+        pass
+    listener.close()
+
+
+def main():
+    try:
+        _main()
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader went away (pyker list | head), the rest of the output has nowhere to go.
+        # Point stdout at devnull so flushing it at exit does not fail again
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
+
+
+def _main():
+    # Internal entry point capturing the output of managed scripts
+    if len(sys.argv) > 2 and sys.argv[1] == '_capture':
+        _capture(sys.argv[2:])
+        return
+    
+    # No escape codes when the output goes to a file or another program
+    if not sys.stdout.isatty():
+        for color in ('RESET', 'BOLD', 'GREEN', 'RED', 'YELLOW', 'CYAN', 'BLUE'):
+            setattr(Pyker, color, '')
+    
+    if psutil is None:
+        print(f"{Pyker.RED}[ERROR]{Pyker.RESET} psutil is required: pip3 install --user psutil")
+        sys.exit(1)
+    
+    parser = argparse.ArgumentParser(
+        description='Pyker - Simple Python Process Manager',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        add_help=False  # We'll handle help ourselves
+    )
+    parser.add_argument('--hosts', metavar='FILE',
+                        help='Run list, info, logs, restart or stop on every host of an inventory file')
+    parser.add_argument('--timeout', type=float, default=10.0, help='Per-host timeout in seconds for --hosts')
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    
+    # Start command
+    start_parser = subparsers.add_parser('start', help='Start a new process')
+    start_parser.add_argument('name', help='Process name')
+    start_parser.add_argument('script', help='Python script path')
+    start_parser.add_argument('--auto-restart', action='store_true', help='Auto restart on failure')
+    start_parser.add_argument('--venv', help='Virtual environment path (e.g., ./venv or /path/to/venv)')
+    start_parser.add_argument('--telemetry', action='store_true',
+                              help='Stream GC, thread and event loop statistics to the supervisor')
+    start_parser.add_argument('--watch', nargs='*', metavar='PATH',
+                              help='Restart on file changes (default: script directory)')
+    start_parser.add_argument('--ignore', nargs='+', metavar='GLOB', help='Files to ignore in watch mode')
+    start_parser.add_argument('--cron', metavar='EXPR', help='Run on a schedule, e.g. "*/5 * * * *"')
+    start_parser.add_argument('--overlap', choices=['skip', 'queue', 'kill-previous'], default='skip',
+                              help='What to do when a scheduled run is due while the previous one is active')
+    start_parser.add_argument('--anomaly-action', choices=['warn', 'restart', 'dump'],
+                              help='Action on memory leak or CPU spin (default from config)')
+    start_parser.add_argument('--priority', type=int, default=0,
+                              help='Resurrect order, higher priorities start first (default: 0)')
+    start_parser.add_argument('--log-lines-per-sec', type=float, metavar='N',
+                              help='Drop log lines over this rate (default from config, 0 for no limit)')
+    start_parser.add_argument('--log-bytes-per-sec', type=float, metavar='N',
+                              help='Drop log output over this many bytes per second (default from config)')
+    start_parser.add_argument('--log-format', choices=['raw', 'text', 'jsonl'], default='raw',
+                              help='Capture stdout and stderr separately with a timestamp per line '
+                                   '(text) or as JSON records (jsonl)')
+    start_parser.add_argument('--stop-signal', metavar='SIGNAL',
+                              help='Signal sent on stop, e.g. SIGINT (default from config: SIGTERM)')
+    start_parser.add_argument('--kill-timeout', type=float, metavar='SECONDS',
+                              help='Time to exit after the stop signal before SIGKILL (default from config)')
+    start_parser.add_argument('--pre-stop', metavar='COMMAND', help='Shell command run before the stop signal')
+    start_parser.add_argument('--pre-stop-url', metavar='URL', help='URL that gets a POST before the stop signal')
+    start_parser.add_argument('--class', dest='priority_class', choices=['critical', 'normal', 'best-effort'],
+                              default='normal',
+                              help='critical processes skip the start queue and are killed last on low memory, '
+                                   'best-effort ones first (default: normal)')
+    start_parser.add_argument('--precompile', action='store_true',
+                              help='Compile the script directory and venv packages to bytecode before starting')
+    start_parser.add_argument('--importtime', action='store_true',
+                              help='Record import times on every start for the slowest imports in info')
+    start_parser.add_argument('--inspect', action='store_true',
+                              help='Accept pyker profile, info --allocations and stack dumps')
+    start_parser.add_argument('--cpus', type=int, metavar='N',
+                              help='Pin to N CPUs chosen by the placement engine, 0 to never pin '
+                                   '(default from config)')
+    start_parser.add_argument('--listen', metavar='[HOST:]PORT',
+                              help='Listen on the port and start the script on the first connection')
+    start_parser.add_argument('--idle-timeout', type=float, metavar='SECONDS',
+                              help='Stop an on-demand process after this long without connections (default from config)')
+    
+    # Stop command
+    stop_parser = subparsers.add_parser('stop', help='Stop a process')
+    stop_parser.add_argument('name', nargs='+', help='Process name')
+    stop_parser.add_argument('--no-wait', action='store_true',
+                             help='Return after sending the stop signal, the supervisor finishes the stop')
+    
+    # Restart command
+    restart_parser = subparsers.add_parser('restart', help='Restart a process')
+    restart_parser.add_argument('name', nargs='+', help='Process name')
+    
+    # Delete command
+    delete_parser = subparsers.add_parser('delete', help='Delete a process')
+    delete_parser.add_argument('name', help='Process name')
+    
+    # List command
+    list_parser = subparsers.add_parser('list', help='List all processes')
+    list_parser.add_argument('-o', '--output', choices=['text', 'json', 'jsonl', 'csv'], default='text',
+                             help='Output format')
+    
+    # Logs command
+    logs_parser = subparsers.add_parser('logs', help='Show process logs')
+    logs_parser.add_argument('name', help='Process name')
+    logs_parser.add_argument('-n', '--lines', type=int, default=50, help='Number of lines to show')
+    logs_parser.add_argument('-f', '--follow', action='store_true', help='Follow log output')
+    
+    # Info command
+    info_parser = subparsers.add_parser('info', help='Show process information')
+    info_parser.add_argument('name', nargs='?', help='Process name (optional, shows system info if not provided)')
+    info_parser.add_argument('--allocations', action='store_true', help='Show top memory allocators (tracemalloc)')
+    info_parser.add_argument('-d', '--duration', type=int, default=10, help='Allocation tracing duration in seconds')
+    info_parser.add_argument('-o', '--output', choices=['text', 'json', 'jsonl', 'csv'], default='text',
+                             help='Output format')
+    
+    # Events command
+    events_parser = subparsers.add_parser('events', help='Show process lifecycle events')
+    events_parser.add_argument('name', nargs='?', help='Only show events of this process')
+    events_parser.add_argument('-n', '--lines', type=int, default=20, help='Number of past events to show')
+    events_parser.add_argument('-f', '--follow', action='store_true', help='Wait for new events')
+    events_parser.add_argument('-o', '--output', choices=['text', 'json', 'jsonl', 'csv'], default='text',
+                               help='Output format')
+    
+    # Monit command
+    monit_parser = subparsers.add_parser('monit', help='Live dashboard')
+    
+    # Profile command
+    profile_parser = subparsers.add_parser('profile', help='Profile a running process')
+    profile_parser.add_argument('name', help='Process name')
+    profile_parser.add_argument('-d', '--duration', type=int, default=30, help='Profiling duration in seconds')
+    profile_parser.add_argument('-r', '--rate', type=int, default=100, help='Samples per second')
+    
+    # Supervisor command
+    supervisor_parser = subparsers.add_parser('supervisor', help='Manage the background supervisor')
+    supervisor_parser.add_argument('action', nargs='?', default='status',
+                                   choices=['start', 'stop', 'status', 'run'],
+                                   help='Supervisor action (run stays in foreground)')
+    supervisor_parser.add_argument('--resurrect', action='store_true',
+                                   help='With run: start the saved processes first')
+    
+    # Save command
+    save_parser = subparsers.add_parser('save', help='Save running processes for resurrect')
+    
+    # Resurrect command
+    resurrect_parser = subparsers.add_parser('resurrect', help='Start the saved processes')
+    resurrect_parser.add_argument('-c', '--concurrency', type=int,
+                                  help='Processes started at the same time (default from config)')
+    
+    # Startup command
+    startup_parser = subparsers.add_parser('startup', help='Generate a systemd user unit')
+    
+    # Agent command
+    agent_parser = subparsers.add_parser('agent', help='Accept commands from other hosts')
+    agent_parser.add_argument('action', nargs='?', default='status', choices=['enable', 'disable', 'status', 'token'],
+                              help='Agent action (token prints the shared secret for inventory files)')
+    agent_parser.add_argument('--bind', help='Address to listen on (default from config)')
+    agent_parser.add_argument('--port', type=int, help='TCP port to listen on (default from config)')
+    
+    # Uninstall command
+    uninstall_parser = subparsers.add_parser('uninstall', help='Uninstall Pyker completely')
+    
+    # Handle help manually
+    if len(sys.argv) == 1 or (len(sys.argv) == 2 and sys.argv[1] in ['-h', '--help', 'help']):
+        print(f"{Pyker.BOLD}{Pyker.CYAN}Pyker - Simple Python Process Manager{Pyker.RESET}")
+        print(f"\n{Pyker.BOLD}Usage:{Pyker.RESET} pyker <command> [options]")
+        print(f"\n{Pyker.BOLD}Available commands:{Pyker.RESET}")
+        print(f"  {Pyker.GREEN}start{Pyker.RESET}   <name> <script>  - Start a new process [--venv PATH]")
+        print(f"  {Pyker.GREEN}stop{Pyker.RESET}    <name>...       - Stop processes")  
+        print(f"  {Pyker.GREEN}restart{Pyker.RESET} <name>...       - Restart processes")
+        print(f"  {Pyker.GREEN}delete{Pyker.RESET}  <name>          - Delete a process")
+        print(f"  {Pyker.GREEN}list{Pyker.RESET}                    - List all processes")
+        print(f"  {Pyker.GREEN}logs{Pyker.RESET}    <name>          - Show process logs")
+        print(f"  {Pyker.GREEN}info{Pyker.RESET}    [name]          - Show process/system information")
+        print(f"  {Pyker.GREEN}events{Pyker.RESET}  [name]          - Show process lifecycle events")
+        print(f"  {Pyker.GREEN}monit{Pyker.RESET}                   - Live dashboard")
+        print(f"  {Pyker.GREEN}profile{Pyker.RESET} <name>          - Profile a running process")
+        print(f"  {Pyker.GREEN}supervisor{Pyker.RESET} [action]     - Start/stop the background supervisor")
+        print(f"  {Pyker.GREEN}save{Pyker.RESET}                    - Save running processes")
+        print(f"  {Pyker.GREEN}resurrect{Pyker.RESET}               - Start the saved processes")
+        print(f"  {Pyker.GREEN}startup{Pyker.RESET}                 - Generate a systemd user unit")
+        print(f"  {Pyker.GREEN}agent{Pyker.RESET}   [action]        - Accept commands from other hosts")
+        print(f"  {Pyker.GREEN}uninstall{Pyker.RESET}               - Uninstall Pyker completely")
+        print(f"\n{Pyker.BOLD}Examples:{Pyker.RESET}")
+        print(f"  pyker start bot script.py")
+        print(f"  pyker start webapp app.py --venv ./venv")
+        print(f"  pyker start report report.py --cron \"*/5 * * * *\"")
+        print(f"  pyker list")
+        print(f"  pyker logs bot -f")
+        print(f"  pyker info bot")
+        print(f"  pyker list --output json")
+        print(f"  pyker --hosts inventory.txt list")
+        print(f"\nUse '{Pyker.CYAN}pyker <command> --help{Pyker.RESET}' for more information on a command.")
+        return
+    
+    try:
+        args = parser.parse_args()
+    except SystemExit:
+        print(f"\n{Pyker.RED}[ERROR]{Pyker.RESET} Invalid command or arguments")
+        print(f"Use '{Pyker.CYAN}pyker --help{Pyker.RESET}' to see available commands.")
+        return
+    
+    if not args.command:
+        print(f"{Pyker.RED}[ERROR]{Pyker.RESET} No command specified")
+        print(f"\n{Pyker.BOLD}Available commands:{Pyker.RESET}")
+        print(f"  {Pyker.GREEN}start{Pyker.RESET}   <name> <script>  - Start a new process")
+        print(f"  {Pyker.GREEN}stop{Pyker.RESET}    <name>...       - Stop processes")  
+        print(f"  {Pyker.GREEN}restart{Pyker.RESET} <name>...       - Restart processes")
+        print(f"  {Pyker.GREEN}delete{Pyker.RESET}  <name>          - Delete a process")
+        print(f"  {Pyker.GREEN}list{Pyker.RESET}                    - List all processes")
+        print(f"  {Pyker.GREEN}logs{Pyker.RESET}    <name>          - Show process logs")
+        print(f"  {Pyker.GREEN}info{Pyker.RESET}    [name]          - Show process/system information")
+        print(f"  {Pyker.GREEN}events{Pyker.RESET}  [name]          - Show process lifecycle events")
+        print(f"  {Pyker.GREEN}monit{Pyker.RESET}                   - Live dashboard")
+        print(f"  {Pyker.GREEN}profile{Pyker.RESET} <name>          - Profile a running process")
+        print(f"  {Pyker.GREEN}supervisor{Pyker.RESET} [action]     - Start/stop the background supervisor")
+        print(f"  {Pyker.GREEN}save{Pyker.RESET}                    - Save running processes")
+        print(f"  {Pyker.GREEN}resurrect{Pyker.RESET}               - Start the saved processes")
+        print(f"  {Pyker.GREEN}startup{Pyker.RESET}                 - Generate a systemd user unit")
+        print(f"  {Pyker.GREEN}agent{Pyker.RESET}   [action]        - Accept commands from other hosts")
+        print(f"  {Pyker.GREEN}uninstall{Pyker.RESET}               - Uninstall Pyker completely")
+        print(f"\nUse '{Pyker.CYAN}pyker <command> --help{Pyker.RESET}' for more information on a command.")
+        return
+    
+    pyker = Pyker()
+    
+    if args.hosts:
+        if args.command not in ('list', 'info', 'logs', 'restart', 'stop'):
+            print(f"{Pyker.RED}[ERROR]{Pyker.RESET} Only list, info, logs, restart and stop can run with --hosts")
+        elif args.command == 'info' and (not args.name or args.allocations):
+            print(f"{Pyker.RED}[ERROR]{Pyker.RESET} info with --hosts needs a process name and no --allocations")
+        elif args.command == 'logs' and args.follow:
+            print(f"{Pyker.RED}[ERROR]{Pyker.RESET} Following logs is not supported with --hosts")
+        else:
+            names = args.name if isinstance(getattr(args, 'name', None), list) else [getattr(args, 'name', None)]
+            pyker.remote(args.hosts, args.command, names, getattr(args, 'lines', 50),
+                         getattr(args, 'output', 'text'), args.timeout)
+        return
+    
+    if args.command == 'start':
+        pyker.start(args.name, args.script, args.auto_restart, args.venv,
+                    anomaly_action=args.anomaly_action, telemetry=args.telemetry,
+                    watch=args.watch, watch_ignore=args.ignore, cron=args.cron, overlap=args.overlap,
+                    priority=args.priority, log_format=args.log_format,
+                    log_lines_per_sec=args.log_lines_per_sec, log_bytes_per_sec=args.log_bytes_per_sec,
+                    stop_signal=args.stop_signal, kill_timeout=args.kill_timeout,
+                    pre_stop=args.pre_stop, pre_stop_url=args.pre_stop_url,
+                    listen=args.listen, idle_timeout=args.idle_timeout, priority_class=args.priority_class,
+                    importtime=args.importtime, precompile=args.precompile, cpus=args.cpus,
+                    inspect=args.inspect)
+    elif args.command == 'stop':
+        pyker.stop_many(args.name, wait=not args.no_wait)
+    elif args.command == 'restart':
+        for name in args.name:
+            pyker.restart(name)
+    elif args.command == 'delete':
+        pyker.delete(args.name)
+    elif args.command == 'list':
+        pyker.list_processes(args.output)
+    elif args.command == 'logs':
+        pyker.logs(args.name, args.lines, args.follow)
+    elif args.command == 'info':
+        if args.allocations and not args.name:
+            print(f"{Pyker.RED}[ERROR]{Pyker.RESET} Process name is required for --allocations")
+        elif args.allocations:
+            pyker.allocations(args.name, args.duration)
+        else:
+            pyker.info(args.name, args.output)
+    elif args.command == 'events':
+        pyker.events(args.lines, args.follow, args.name, args.output)
+    elif args.command == 'monit':
+        pyker.monit()
+    elif args.command == 'profile':
+        pyker.profile(args.name, args.duration, args.rate)
+    elif args.command == 'supervisor':
+        pyker.supervisor(args.action, args.resurrect)
+    elif args.command == 'save':
+        pyker.save()
+    elif args.command == 'resurrect':
+        pyker.resurrect(args.concurrency)
+    elif args.command == 'startup':
+        pyker.startup()
+    elif args.command == 'agent':
+        pyker.agent(args.action, args.bind, args.port)
+    elif args.command == 'uninstall':
+        pyker.uninstall()
+
+if __name__ == '__main__':
+    main() 
\ No newline at end of file
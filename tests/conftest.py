@@ -0,0 +1,48 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pyker_core as pyker  # noqa: E402
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """A throwaway HOME, so ~/.pyker is never the real one"""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def manager(home):
+    manager = pyker.Pyker()
+    # Tests that need a supervisor start their own, no start may leave one behind
+    manager.config['supervisor']['autostart'] = False
+    manager._save_config(manager.config)
+    return manager
+
+
+@pytest.fixture
+def supervisor(home):
+    """Start a supervisor in the throwaway HOME, after the test has written its config"""
+    processes = []
+
+    def start():
+        pid_file = pyker.Pyker().supervisor_pid_file
+        process = subprocess.Popen([sys.executable, pyker.PYKER_FILE, 'supervisor', 'run'],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        processes.append(process)
+        deadline = time.monotonic() + 10
+        while not pid_file.exists():
+            assert time.monotonic() < deadline, 'supervisor did not start'
+            time.sleep(0.05)
+        return process
+
+    yield start
+    for process in processes:
+        process.terminate()
+        process.wait(10)
@@ -0,0 +1,86 @@
+import socket
+import time
+
+import pytest
+
+import pyker_core as pyker
+
+
+@pytest.fixture
+def agent(manager, supervisor, tmp_path):
+    """A supervisor with the agent on a free local port, and a connected client"""
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+    manager.config['agent'].update(enabled=True, port=port)
+    manager._save_config(manager.config)
+    supervisor()
+
+    host = pyker.RemoteHost(f"127.0.0.1:{port}", manager._agent_token(), 10)
+    deadline = time.monotonic() + 10
+    while True:
+        try:
+            host._connect()
+            break
+        except OSError:
+            assert time.monotonic() < deadline, 'agent did not listen'
+            time.sleep(0.1)
+    yield host
+    host.close()
+
+
+@pytest.fixture
+def script(tmp_path):
+    path = tmp_path / 'loop.py'
+    path.write_text('import time\nprint("ready", flush=True)\nwhile True:\n    time.sleep(1)\n')
+    return str(path)
+
+
+def test_listens_on_localhost_by_default(manager):
+    assert manager.config['agent']['bind'] == '127.0.0.1'
+
+
+def test_reads(agent, manager, script):
+    manager.start('bot', script)
+    try:
+        listed = agent.call('list')
+        assert listed['ok']
+        assert [record['name'] for record in listed['result']] == ['bot']
+        info = agent.call('info', name='bot')
+        assert info['ok'] and info['result']['pid'] == manager.processes['bot']['pid']
+        time.sleep(0.5)
+        logs = agent.call('logs', name='bot', lines=5)
+        assert logs['ok'] and logs['result'][-1].endswith('ready')
+        assert agent.call('info', name='missing') == {'ok': False, 'error': "Process 'missing' not found"}
+    finally:
+        manager.stop('bot')
+
+
+def test_pipelined_requests_are_answered_in_order(agent, manager, script):
+    manager.start('bot', script)
+    manager.stop('bot')
+    agent._send({'command': 'info', 'name': 'bot'})
+    agent._send({'command': 'info', 'name': 'missing'})
+    agent._send({'command': 'list'})
+    assert agent._receive()['result']['name'] == 'bot'
+    assert agent._receive()['error'] == "Process 'missing' not found"
+    assert agent._receive()['result'][0]['name'] == 'bot'
+
+
+def test_stop_and_restart_report_the_outcome(agent, manager, script):
+    manager.start('bot', script)
+    manager.stop('bot')
+
+    stopped = agent.call('stop', name='bot')
+    assert not stopped['ok']
+    assert 'already stopped' in stopped['output']
+
+    restarted = agent.call('restart', name='bot')
+    try:
+        assert restarted['ok']
+        manager.processes = manager._load_state()
+        assert manager.processes['bot']['pid']
+        assert agent.call('stop', name='bot')['ok']
+    finally:
+        manager.processes = manager._load_state()
+        manager.stop('bot')
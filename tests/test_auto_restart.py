@@ -0,0 +1,107 @@
+import json
+import time
+
+import pytest
+
+import pyker_core as pyker
+
+
+@pytest.fixture
+def supervisor(manager, monkeypatch):
+    """A supervisor that is not running its loop, recording the processes it would start again"""
+    supervisor = pyker.Supervisor(manager)
+    supervisor.restarted = []
+    monkeypatch.setattr(manager, '_start_again', supervisor.restarted.append)
+    return supervisor
+
+
+def add_process(manager, pid, started_before_supervisor=True):
+    start_time = time.time() - (3600 if started_before_supervisor else 0)
+    manager.processes['bot'] = {'status': 'running', 'pid': pid, 'auto_restart': True, 'restarts': 0,
+                                'script_path': '/tmp/bot.py',
+                                'start_time': time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(start_time))}
+    manager._save_state()
+    return manager.processes['bot']
+
+
+def events(manager):
+    if not manager.events_file.exists():
+        return []
+    return [json.loads(line)['event'] for line in manager.events_file.read_text().splitlines()]
+
+
+def test_exit_seen_by_supervisor_is_restarted(manager, supervisor):
+    info = add_process(manager, 999999)
+    supervisor.tracked['bot'] = {'pid': 999999}
+    now = time.time()
+    supervisor._handle_exits({}, now)
+    assert supervisor.restarted == []
+
+    supervisor._handle_exits({}, now + supervisor.EXIT_GRACE)
+    assert supervisor.restarted == ['bot']
+    assert info['pid'] is None
+    assert events(manager) == ['exited']
+
+
+def test_exit_noticed_by_the_cli_after_the_supervisor_is_restarted(manager, supervisor):
+    info = add_process(manager, 999999)
+    supervisor.tracked['bot'] = {'pid': 999999}
+    now = time.time()
+    supervisor._handle_exits({}, now)
+    # The tick drops the sampling state of processes that are gone
+    supervisor.tracked.clear()
+    manager._mark_exited(info)
+
+    supervisor._handle_exits({}, now + 1)
+    assert supervisor.restarted == ['bot']
+    assert 'exited_pid' not in info
+
+
+def test_exit_noticed_by_the_cli_first_is_restarted(manager, supervisor):
+    info = add_process(manager, 999999)
+    supervisor.tracked['bot'] = {'pid': 999999}
+    manager._mark_exited(info)
+
+    supervisor._handle_exits({}, time.time())
+    assert supervisor.restarted == ['bot']
+
+
+def test_exit_from_before_the_supervisor_is_not_acted_on(manager, supervisor):
+    info = add_process(manager, 999999)
+    manager._mark_exited(info)
+
+    supervisor._handle_exits({}, time.time())
+    assert supervisor.restarted == []
+    assert events(manager) == []
+
+
+def test_stale_exited_pid_of_a_replaced_run_is_dropped(manager, supervisor):
+    info = add_process(manager, 1234, started_before_supervisor=False)
+    info['exited_pid'] = 999999
+
+    supervisor._handle_exits({1234: (0.0, 0, 1)}, time.time())
+    assert supervisor.restarted == []
+    assert info['pid'] == 1234
+    assert 'exited_pid' not in json.loads(manager.state_file.read_text())['bot']
+
+
+def test_crash_loop_stops_restarting(manager, supervisor):
+    manager.config['crash_loop'] = {'max_restarts': 3, 'window': 60}
+    now = time.time()
+    for attempt in range(4):
+        supervisor._auto_restart('bot', now + attempt)
+    assert supervisor.restarted == ['bot'] * 3
+    assert events(manager) == ['crash_loop']
+
+    # Started again by hand, it gets the full number of restarts back
+    supervisor._auto_restart('bot', now + 10)
+    assert supervisor.restarted == ['bot'] * 4
+
+
+def test_restarts_older_than_the_window_do_not_count(manager, supervisor):
+    manager.config['crash_loop'] = {'max_restarts': 2, 'window': 60}
+    now = time.time()
+    for attempt in range(5):
+        supervisor._auto_restart('bot', now + attempt * 40)
+    assert supervisor.restarted == ['bot'] * 5
+    assert events(manager) == []
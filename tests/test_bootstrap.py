@@ -0,0 +1,44 @@
+import subprocess
+import sys
+import time
+
+import psutil
+
+import pyker_core as pyker
+
+
+def _command_of(manager, name):
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        try:
+            return psutil.Process(manager.processes[name]['pid']).cmdline()
+        except psutil.Error:
+            time.sleep(0.05)
+    raise AssertionError(f"{name} did not start")
+
+
+def test_plain_script_runs_without_bootstrap(manager, tmp_path):
+    script = tmp_path / 'loop.py'
+    script.write_text('import time\nwhile True:\n    time.sleep(1)\n')
+
+    try:
+        assert manager.start('plain', str(script))
+        assert manager.start('inspected', str(script), inspect=True)
+        assert _command_of(manager, 'plain')[-2:] == ['-u', str(script)]
+        assert pyker.BOOTSTRAP_FILE in _command_of(manager, 'inspected')
+        assert not manager.processes['plain']['bootstrap']
+        assert manager.processes['inspected']['bootstrap']
+    finally:
+        manager.stop('plain')
+        manager.stop('inspected')
+
+
+def test_bootstrap_runs_script_as_main(tmp_path):
+    script = tmp_path / 'show.py'
+    script.write_text('import sys\nprint(__name__, sys.argv[1:], sys.path[0])\n'
+                      'print("pyker" in sys.modules or "pyker_core" in sys.modules)\n')
+
+    result = subprocess.run([sys.executable, pyker.BOOTSTRAP_FILE, '--inspect', '1', str(script), 'a', 'b'],
+                            capture_output=True, text=True, check=True)
+
+    assert result.stdout.splitlines() == [f"__main__ ['a', 'b'] {tmp_path}", 'False']
@@ -0,0 +1,71 @@
+from datetime import datetime
+
+import pytest
+
+import pyker_core as pyker
+
+
+def runs(expression, after, count=3):
+    schedule = pyker.CronSchedule(expression)
+    times = []
+    for _ in range(count):
+        after = schedule.next_after(after)
+        times.append(after)
+    return times
+
+
+def test_next_is_strictly_after():
+    assert runs('30 12 * * *', datetime(2026, 3, 2, 12, 30, 15), 1) == [datetime(2026, 3, 3, 12, 30)]
+
+
+def test_steps():
+    assert runs('*/20 * * * *', datetime(2026, 3, 2, 12, 41)) == [
+        datetime(2026, 3, 2, 13, 0), datetime(2026, 3, 2, 13, 20), datetime(2026, 3, 2, 13, 40)]
+    assert runs('5/30 * * * *', datetime(2026, 3, 2, 12, 0)) == [
+        datetime(2026, 3, 2, 12, 5), datetime(2026, 3, 2, 12, 35), datetime(2026, 3, 2, 13, 5)]
+
+
+def test_ranges_and_lists():
+    assert runs('0 9-17/4 * * *', datetime(2026, 3, 2, 10, 0)) == [
+        datetime(2026, 3, 2, 13, 0), datetime(2026, 3, 2, 17, 0), datetime(2026, 3, 3, 9, 0)]
+    assert runs('15,45 8 * 1,6 *', datetime(2026, 3, 2)) == [
+        datetime(2026, 6, 1, 8, 15), datetime(2026, 6, 1, 8, 45), datetime(2026, 6, 2, 8, 15)]
+
+
+def test_weekdays_seven_is_sunday():
+    # 2026-03-02 is a Monday
+    assert runs('0 0 * * 7', datetime(2026, 3, 2), 1) == [datetime(2026, 3, 8)]
+    assert runs('0 0 * * 1-5', datetime(2026, 3, 6, 1), 1) == [datetime(2026, 3, 9)]
+
+
+def test_day_of_month_or_day_of_week():
+    # Both restricted: the 13th or any Friday
+    assert runs('0 0 13 * 5', datetime(2026, 3, 1)) == [
+        datetime(2026, 3, 6), datetime(2026, 3, 13), datetime(2026, 3, 20)]
+    # Only one restricted: both must match
+    assert runs('0 0 13 * *', datetime(2026, 3, 1), 1) == [datetime(2026, 3, 13)]
+    assert runs('0 0 * 3 5', datetime(2026, 3, 1), 1) == [datetime(2026, 3, 6)]
+
+
+def test_starred_step_is_unrestricted():
+    # */2 in day of month still ANDs with day of week: odd days that are Mondays
+    assert runs('0 0 */2 * 1', datetime(2026, 3, 1)) == [
+        datetime(2026, 3, 9), datetime(2026, 3, 23), datetime(2026, 4, 13)]
+    # */7 is 0 and 7, both Sunday: the next 1st of a month that is a Sunday
+    assert runs('0 0 1 * */7', datetime(2026, 3, 2), 1) == [datetime(2026, 11, 1)]
+
+
+def test_aliases_and_month_rollover():
+    assert runs('@monthly', datetime(2026, 12, 31, 23, 59), 1) == [datetime(2027, 1, 1)]
+    assert runs('0 0 29 2 *', datetime(2026, 3, 1), 1) == [datetime(2028, 2, 29)]
+
+
+@pytest.mark.parametrize('expression', ['* * * *', '60 * * * *', '5-1 * * * *', 'a * * * *', '*/0 * * * *'])
+def test_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        pyker.CronSchedule(expression)
+
+
+def test_never_matching_expression():
+    with pytest.raises(ValueError):
+        pyker.CronSchedule('0 0 31 2 *').next_after(datetime(2026, 1, 1))
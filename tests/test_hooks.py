@@ -0,0 +1,150 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+import pyker_core as pyker
+
+
+@pytest.fixture
+def listener():
+    """A local HTTP server recording the events POSTed to it"""
+    received = []
+    gate = threading.Event()
+    gate.set()
+    failures = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers['Content-Length']))
+            gate.wait(10)
+            if failures:
+                failures.pop()
+                self.send_response(500)
+            else:
+                received.append((dict(self.headers), json.loads(body)))
+                self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server.url = f"http://127.0.0.1:{server.server_port}/hook"
+    server.received, server.gate, server.failures = received, gate, failures
+    yield server
+    gate.set()
+    server.shutdown()
+    server.server_close()
+
+
+def dispatcher(**settings):
+    logged = []
+    hooks = pyker.HookDispatcher(dict({'workers': 1, 'retries': 0, 'timeout': 5}, **settings), logged.append)
+    hooks.logged = logged
+    return hooks
+
+
+def wait_for(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out'
+        time.sleep(0.02)
+
+
+def event(name='bot', kind='exited', **fields):
+    return dict({'time': '2026-01-01 00:00:00', 'name': name, 'event': kind, 'pid': 10}, **fields)
+
+
+def test_url_hook_posts_the_event(listener):
+    hooks = dispatcher()
+    hooks.submit({'url': listener.url, 'headers': {'Authorization': 'Bearer secret'}}, event(exit_code=1))
+    wait_for(lambda: listener.received)
+    hooks.close()
+
+    headers, body = listener.received[0]
+    assert headers['Authorization'] == 'Bearer secret'
+    assert headers['Content-Type'] == 'application/json'
+    assert body == event(exit_code=1, count=1)
+
+
+def test_repeated_events_are_coalesced_while_waiting(listener):
+    hooks = dispatcher()
+    hook = {'url': listener.url}
+    listener.gate.clear()
+    hooks.submit(hook, event())
+    wait_for(lambda: not hooks.pending)
+    # The only worker is busy, these wait and are merged into one delivery
+    for _ in range(3):
+        hooks.submit(hook, event())
+    hooks.submit(hook, event(kind='started'))
+    listener.gate.set()
+    wait_for(lambda: len(listener.received) == 3)
+    hooks.close()
+
+    assert [(body['event'], body['count']) for _, body in listener.received] == [
+        ('exited', 1), ('exited', 3), ('started', 1)]
+
+
+def test_full_queue_drops_the_oldest_event(listener):
+    hooks = dispatcher(queue_size=2)
+    hook = {'url': listener.url}
+    listener.gate.clear()
+    hooks.submit(hook, event('busy'))
+    wait_for(lambda: not hooks.pending)
+    for name in ('a', 'b', 'c'):
+        hooks.submit(hook, event(name))
+    listener.gate.set()
+    wait_for(lambda: len(listener.received) == 3)
+    hooks.close()
+
+    assert [body['name'] for _, body in listener.received] == ['busy', 'b', 'c']
+    assert hooks.logged == ["Hook queue full, dropped exited event of 'a'"]
+
+
+def test_failed_delivery_is_retried(listener):
+    hooks = dispatcher(retries=1)
+    listener.failures.append(True)
+    hooks.submit({'url': listener.url}, event())
+    wait_for(lambda: listener.received, timeout=15)
+    hooks.close()
+
+    assert listener.received[0][1]['count'] == 1
+    assert hooks.logged == []
+
+
+def test_unreachable_url_is_logged_after_the_retries(listener):
+    hooks = dispatcher()
+    url = listener.url
+    listener.shutdown()
+    listener.server_close()
+    hooks.submit({'url': url}, event())
+    wait_for(lambda: hooks.logged)
+    hooks.close()
+
+    assert hooks.logged[0].startswith(f"Hook {url} failed for exited event of 'bot'")
+
+
+def test_python_hook(tmp_path, monkeypatch):
+    (tmp_path / 'myhooks.py').write_text(
+        "import json, time\n"
+        "def record(event):\n"
+        f"    open({str(tmp_path / 'events.jsonl')!r}, 'a').write(json.dumps(event) + '\\n')\n"
+        "def hang(event):\n"
+        "    time.sleep(60)\n")
+    monkeypatch.setenv('PYTHONPATH', str(tmp_path))
+    hooks = dispatcher(timeout=1, workers=2)
+    hooks.submit({'python': 'myhooks:record'}, event())
+    hooks.submit({'python': 'myhooks:hang'}, event())
+    hooks.submit({'python': 'myhooks:missing'}, event())
+    wait_for(lambda: len(hooks.logged) == 2)
+    hooks.close()
+
+    assert json.loads((tmp_path / 'events.jsonl').read_text()) == event(count=1)
+    assert sorted(hooks.logged) == [
+        "Hook myhooks:hang failed for exited event of 'bot': function did not return in 1s",
+        "Hook myhooks:missing failed for exited event of 'bot': function failed: "
+        "AttributeError: module 'myhooks' has no attribute 'missing'"]
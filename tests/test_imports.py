@@ -0,0 +1,19 @@
+import os
+import subprocess
+import sys
+
+import pyker_core as pyker
+
+
+def test_cli_does_not_import_what_few_commands_use():
+    modules = ('urllib.request', 'http.client', 'ssl', 'concurrent.futures', 'hmac', 'csv')
+    code = f"import sys, pyker_core; print(sorted(m for m in {modules} if m in sys.modules))"
+    result = subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(pyker.PYKER_FILE),
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == '[]'
+
+
+def test_cli_runs_through_launcher():
+    assert os.path.basename(pyker.PYKER_FILE) == 'pyker.py'
+    result = subprocess.run([sys.executable, pyker.PYKER_FILE, '--help'], capture_output=True, text=True, check=True)
+    assert 'Usage: pyker' in result.stdout
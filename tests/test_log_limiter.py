@@ -0,0 +1,59 @@
+import pyker_core as pyker
+
+
+def lines(count, size=9):
+    return [b'x' * size] * count
+
+
+def test_inactive_without_rates():
+    limiter = pyker.LogLimiter(0, 0, 2)
+    assert not limiter.active
+    assert limiter.admit(lines(1000), limiter.updated) == lines(1000)
+
+
+def test_burst_then_rate():
+    limiter = pyker.LogLimiter(10, 0, 2)
+    now = limiter.updated
+    # The bucket starts full with two seconds of lines
+    assert len(limiter.admit(lines(50), now)) == 20
+    assert limiter.suppressed_lines == 30
+    # Half a second refills five lines
+    assert len(limiter.admit(lines(50), now + 0.5)) == 5
+    assert len(limiter.admit(lines(50), now + 0.5)) == 0
+
+
+def test_refill_is_capped_at_the_burst():
+    limiter = pyker.LogLimiter(10, 0, 2)
+    now = limiter.updated
+    limiter.admit(lines(20), now)
+    assert len(limiter.admit(lines(100), now + 60)) == 20
+
+
+def test_bytes_bucket():
+    limiter = pyker.LogLimiter(0, 100, 1)
+    now = limiter.updated
+    # Every line costs its length plus the newline
+    assert len(limiter.admit(lines(20), now)) == 10
+    assert limiter.suppressed_bytes == 100
+    assert len(limiter.admit(lines(20), now + 0.25)) == 2
+
+
+def test_full_bucket_admits_a_line_longer_than_itself():
+    limiter = pyker.LogLimiter(0, 100, 1)
+    now = limiter.updated
+    assert limiter.admit([b'x' * 500], now) == [b'x' * 500]
+    assert limiter.admit([b'x' * 500], now + 0.5) == []
+    # The long line is paid back at the byte rate before the bucket is full again
+    assert limiter.admit([b'x' * 500], now + 5) == []
+    assert limiter.admit([b'x' * 500], now + 6) == [b'x' * 500]
+
+
+def test_report_once_a_second():
+    limiter = pyker.LogLimiter(1, 0, 1)
+    now = limiter.updated
+    limiter.admit(lines(3), now)
+    assert limiter.report(now + 0.5) is None
+    assert limiter.report(now + 1) == b"suppressed 2 lines (0.0 KB) over the log rate limit"
+    assert limiter.report(now + 3) is None
+    limiter.admit(lines(2), now + 3)
+    assert limiter.report(now + 3.1, final=True).startswith(b"suppressed 1 lines")
@@ -0,0 +1,45 @@
+import pyker_core as pyker
+
+
+def test_tail_before_wrapping():
+    ring = pyker.LogRing(64, history=False)
+    ring.write(b'one\ntwo\n')
+    ring.write(b'three\npartial')
+    assert ring.tail(2) == ([b'two', b'three'], True)
+    # A fresh log has no lines beyond what the ring holds
+    assert ring.tail(10) == ([b'one', b'two', b'three'], True)
+    assert ring.tail(0) == ([], True)
+
+
+def test_older_log_lines_are_not_in_the_ring():
+    ring = pyker.LogRing(64, history=True)
+    ring.write(b'one\ntwo\n')
+    assert ring.tail(2) == ([b'one', b'two'], True)
+    assert ring.tail(3) == ([b'one', b'two'], False)
+
+
+def test_wrap_around():
+    ring = pyker.LogRing(16, history=False)
+    for number in range(10):
+        ring.write(f"line{number}\n".encode())
+    assert ring.end == 60
+    # 16 bytes hold 2 whole lines and the end of an overwritten one, which is dropped
+    assert ring.tail(2) == ([b'line8', b'line9'], True)
+    assert ring.tail(3) == ([b'line8', b'line9'], False)
+
+
+def test_write_across_the_end_of_the_buffer():
+    ring = pyker.LogRing(10, history=False)
+    ring.write(b'abcdefg\n')
+    ring.write(b'hij\nkl\n')
+    assert bytes(ring.buffer) == b'j\nkl\nfg\nhi'
+    assert ring.tail(5) == ([b'hij', b'kl'], False)
+
+
+def test_write_larger_than_the_ring():
+    ring = pyker.LogRing(8, history=False)
+    ring.write(b'first\n' + b'x' * 20 + b'\nab\ncd\n')
+    assert ring.end == 33
+    assert ring.tail(2) == ([b'ab', b'cd'], True)
+    ring.write(b'ef\n')
+    assert ring.tail(2) == ([b'cd', b'ef'], True)
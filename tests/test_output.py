@@ -0,0 +1,21 @@
+import subprocess
+import sys
+
+import pyker_core as pyker
+
+
+def run_into_closed_pipe(*args):
+    process = subprocess.Popen([sys.executable, pyker.PYKER_FILE] + list(args),
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    # The reader is gone before pyker writes anything, like `pyker ... | head` once head has exited
+    process.stdout.close()
+    stderr = process.stderr.read().decode()
+    process.wait(timeout=30)
+    return process.returncode, stderr
+
+
+def test_closed_stdout_exits_quietly(manager):
+    for args in (['--help'], ['list', '--output', 'json'], ['events']):
+        returncode, stderr = run_into_closed_pipe(*args)
+        assert returncode == 1
+        assert 'Traceback' not in stderr and 'Exception ignored' not in stderr
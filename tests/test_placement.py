@@ -0,0 +1,104 @@
+import fnmatch
+from pathlib import Path
+
+import pytest
+
+import pyker_core as pyker
+
+# Two NUMA nodes with two cores each, every core with two SMT threads
+TOPOLOGY = [(0, [[0, 4], [1, 5]]), (1, [[2, 6], [3, 7]])]
+
+
+def core_of(cpu):
+    return next(core for _, cores in TOPOLOGY for core in cores if cpu in core)
+
+
+def node_of(cpu):
+    return next(node for node, cores in TOPOLOGY for core in cores if cpu in core)
+
+
+@pytest.mark.parametrize('text, cpus', [('0', {0}), ('0-3,8-11\n', {0, 1, 2, 3, 8, 9, 10, 11}), ('', set())])
+def test_cpu_lists(text, cpus):
+    assert pyker._parse_cpu_list(text) == cpus
+    assert pyker._format_cpu_list(cpus) == text.strip()
+
+
+def test_replicas_are_spread_over_nodes():
+    plan = pyker._plan_placement(TOPOLOGY, [('web-1', 'app.py', 1, None), ('web-2', 'app.py', 1, None)])
+    assert {node_of(plan['web-1'][0]), node_of(plan['web-2'][0])} == {0, 1}
+
+
+def test_whole_idle_cores_before_siblings():
+    requests = [(f"p{n}", f"script{n}.py", 1, None) for n in range(4)]
+    plan = pyker._plan_placement(TOPOLOGY, requests)
+    assert sorted(tuple(core_of(cpus[0])) for cpus in plan.values()) == [(0, 4), (1, 5), (2, 6), (3, 7)]
+
+
+def test_process_stays_on_one_node():
+    plan = pyker._plan_placement(TOPOLOGY, [('big', 'big.py', 4, None), ('small', 'small.py', 2, None)])
+    assert plan['big'] in ([0, 1, 4, 5], [2, 3, 6, 7])
+    assert len({node_of(cpu) for cpu in plan['small']}) == 1
+    assert not set(plan['big']) & set(plan['small'])
+
+
+def test_current_cpus_are_kept():
+    plan = pyker._plan_placement(TOPOLOGY, [('a', 'a.py', 1, [5]), ('b', 'b.py', 2, [2, 6])])
+    assert plan == {'a': [5], 'b': [2, 6]}
+
+
+def test_shared_cpus_are_spread_once_free():
+    plan = pyker._plan_placement(TOPOLOGY, [('a', 'a.py', 1, [0]), ('b', 'b.py', 1, [0])])
+    assert plan['a'] != plan['b']
+
+
+def test_replicas_move_to_a_node_without_one():
+    plan = pyker._plan_placement(TOPOLOGY, [('web-1', 'app.py', 1, [0]), ('web-2', 'app.py', 1, [1])])
+    assert {node_of(plan['web-1'][0]), node_of(plan['web-2'][0])} == {0, 1}
+
+
+def test_more_processes_than_cpus_share_evenly():
+    requests = [(f"p{n}", 'app.py', 1, None) for n in range(12)]
+    plan = pyker._plan_placement(TOPOLOGY, requests)
+    load = [sum(cpu in cpus for cpus in plan.values()) for cpu in range(8)]
+    assert sorted(load) == [1, 1, 1, 1, 2, 2, 2, 2]
+    # Asking for more CPUs than there are gets all of them
+    assert pyker._plan_placement(TOPOLOGY, [('huge', 'huge.py', 64, None)]) == {'huge': list(range(8))}
+
+
+def test_no_cpus():
+    assert pyker._plan_placement([], [('a', 'a.py', 1, None)]) == {}
+
+
+@pytest.fixture
+def sysfs(monkeypatch):
+    """Serve _cpu_topology a fake /sys from a dict of file contents"""
+    files = {}
+
+    class FakePath(type(Path())):
+        def read_text(self):
+            try:
+                return files[str(self)]
+            except KeyError:
+                raise FileNotFoundError(str(self))
+
+    monkeypatch.setattr(pyker, 'Path', FakePath)
+    monkeypatch.setattr(pyker.glob, 'glob', lambda pattern: sorted(fnmatch.filter(files, pattern)))
+    return files
+
+
+def test_topology_from_sysfs(sysfs, monkeypatch):
+    sysfs['/sys/devices/system/node/node0/cpulist'] = '0-1,4-5\n'
+    sysfs['/sys/devices/system/node/node1/cpulist'] = '2-3,6-7\n'
+    for cpu in range(8):
+        sysfs[f'/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list'] = f"{cpu % 4},{cpu % 4 + 4}\n"
+    monkeypatch.setattr(pyker.os, 'sched_getaffinity', lambda pid: set(range(8)))
+    assert pyker._cpu_topology() == TOPOLOGY
+
+    # CPUs pyker may not use are left out, and so are nodes without any
+    monkeypatch.setattr(pyker.os, 'sched_getaffinity', lambda pid: {0, 1, 4})
+    assert pyker._cpu_topology() == [(0, [[0, 4], [1]])]
+
+
+def test_topology_without_numa(sysfs, monkeypatch):
+    monkeypatch.setattr(pyker.os, 'sched_getaffinity', lambda pid: {0, 1, 2})
+    assert pyker._cpu_topology() == [(0, [[0], [1], [2]])]
@@ -0,0 +1,35 @@
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime
+
+import pyker_core as pyker
+
+
+def _entry(pid):
+    return {'status': 'running', 'pid': pid, 'script_path': '/tmp/bot.py',
+            'start_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+
+
+def test_refresh_writes_nothing_while_processes_run(manager):
+    manager.processes = {'bot': _entry(os.getpid())}
+    manager._save_state()
+    written = manager.state_file.stat().st_mtime_ns
+
+    pyker.Pyker()._refresh_processes()
+
+    assert manager.state_file.stat().st_mtime_ns == written
+
+
+def test_refresh_saves_processes_found_gone(manager):
+    exited = subprocess.Popen([sys.executable, '-c', 'pass'])
+    exited.wait()
+    manager.processes = {'bot': _entry(exited.pid), 'self': _entry(os.getpid())}
+    manager._save_state()
+
+    pyker.Pyker()._refresh_processes()
+
+    saved = json.loads(manager.state_file.read_text())
+    assert saved['bot']['pid'] is None and saved['bot']['exited_pid'] == exited.pid
+    assert saved['self']['pid'] == os.getpid()
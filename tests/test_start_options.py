@@ -0,0 +1,32 @@
+import json
+
+import pyker_core as pyker
+
+
+def test_save_and_resurrect_keep_start_options(manager, tmp_path):
+    script = tmp_path / 'job.py'
+    script.write_text('print("run")\n')
+    assert manager.start('job', str(script), auto_restart=True, cron='*/5 * * * *', overlap='queue',
+                         priority=3, stop_signal='INT', kill_timeout=7, cpus=2, inspect=True, importtime=True)
+    options = manager.processes['job']['options']
+    assert options['stop_signal'] == 'SIGINT'
+    assert options['cpus'] == 2
+
+    assert manager.save()
+    saved = json.loads(manager.dump_file.read_text())['processes']
+    assert saved == [dict(name='job', **options)]
+
+    manager.processes = {}
+    manager._save_state()
+    assert manager.resurrect()
+    assert manager.processes['job']['options'] == options
+    assert manager.processes['job']['placement_cpus'] == 2
+
+
+def test_records_without_options_are_started_with_their_fields(manager):
+    info = {'script_path': '/tmp/bot.py', 'auto_restart': True, 'venv_path': None, 'placement_cpus': 2,
+            'log_format': 'json', 'status': 'stopped', 'pid': None, 'restarts': 4}
+    options = manager._start_options(info)
+    assert options == {'script_path': '/tmp/bot.py', 'auto_restart': True, 'venv_path': None,
+                       'log_format': 'json', 'cpus': 2}
+    assert not set(options) & set(pyker.Pyker.ONE_TIME_START_ARGS)
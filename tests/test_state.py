@@ -0,0 +1,124 @@
+import json
+
+import pyker_core as pyker
+
+
+def test_saves_keep_changes_of_other_commands(home):
+    first = pyker.Pyker()
+    first.processes = {'bot': {'status': 'running', 'pid': 10, 'restarts': 0}}
+    first._save_state()
+
+    cli = pyker.Pyker()
+    supervisor = pyker.Pyker()
+    cli.processes['bot']['restarts'] = 1
+    cli.processes['web'] = {'status': 'running', 'pid': 20}
+    supervisor.processes['bot']['cpus'] = [0]
+    cli._save_state()
+    supervisor._save_state()
+
+    saved = json.loads(first.state_file.read_text())
+    assert saved == {'bot': {'status': 'running', 'pid': 10, 'restarts': 1, 'cpus': [0]},
+                     'web': {'status': 'running', 'pid': 20}}
+    # The last to save now also sees the other's changes
+    assert supervisor.processes == saved
+
+
+def test_deleted_process_stays_deleted(home):
+    first = pyker.Pyker()
+    first.processes = {'bot': {'pid': 10}, 'web': {'pid': 20}}
+    first._save_state()
+
+    cli = pyker.Pyker()
+    supervisor = pyker.Pyker()
+    del cli.processes['bot']
+    cli._save_state()
+    supervisor.processes['bot']['pid'] = None
+    supervisor.processes['web']['pid'] = None
+    supervisor._save_state()
+
+    assert json.loads(first.state_file.read_text()) == {'web': {'pid': None}}
+
+
+def test_removed_field_is_removed(home):
+    first = pyker.Pyker()
+    first.processes = {'bot': {'pid': 10, 'stopping': {'pid': 10}}}
+    first._save_state()
+
+    cli = pyker.Pyker()
+    other = pyker.Pyker()
+    del cli.processes['bot']['stopping']
+    cli._save_state()
+    other.processes['bot']['restarts'] = 2
+    other._save_state()
+
+    assert json.loads(first.state_file.read_text()) == {'bot': {'pid': 10, 'restarts': 2}}
+
+
+def test_caller_references_stay_valid(home):
+    manager = pyker.Pyker()
+    manager.processes = {'bot': {'pid': 10}}
+    manager._save_state()
+    info = manager.processes['bot']
+    info['pid'] = 11
+    manager._save_state()
+    assert manager.processes['bot'] is info
+    assert json.loads(manager.state_file.read_text())['bot']['pid'] == 11
+
+
+def _count_up(key):
+    for i in range(50):
+        manager = pyker.Pyker()
+        manager.processes['bot'][key] = i
+        manager._save_state()
+
+
+def test_concurrent_saves_lose_nothing(home):
+    import multiprocessing
+    manager = pyker.Pyker()
+    manager.processes = {'bot': {}}
+    manager._save_state()
+
+    workers = [multiprocessing.get_context('fork').Process(target=_count_up, args=(f'k{n}',)) for n in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert json.loads(manager.state_file.read_text()) == {'bot': {f'k{n}': 49 for n in range(4)}}
+
+
+def test_lock_holder_can_save(manager):
+    import threading
+    done = threading.Event()
+
+    def save_while_locked():
+        with manager._state_lock():
+            manager.processes['bot'] = {'pid': 10}
+            manager._save_state()
+        done.set()
+
+    threading.Thread(target=save_while_locked, daemon=True).start()
+    assert done.wait(5)
+
+
+def _save_bot(pid):
+    manager = pyker.Pyker()
+    manager.processes['bot'] = {'pid': pid}
+    manager._save_state()
+
+
+def test_lock_keeps_other_commands_out(manager):
+    import multiprocessing
+    import time
+    with manager._state_lock():
+        manager.processes = manager._load_state()
+        other = multiprocessing.get_context('fork').Process(target=_save_bot, args=(20,))
+        other.start()
+        time.sleep(0.3)
+        # Nothing can be started in between the check and the start of the lock holder
+        assert other.is_alive()
+        manager.processes['bot'] = {'pid': 10}
+        manager._save_state()
+    other.join(5)
+
+    assert json.loads(manager.state_file.read_text()) == {'bot': {'pid': 20}}
@@ -0,0 +1,54 @@
+import pyker_core as pyker
+
+
+def row(name, **fields):
+    values = {'name': name, 'pid': 1234, 'status': 'running', 'anomalies': [], 'cpu_percent': 12.5,
+              'memory_mb': 48.5, 'restarts': 2, 'started': 1700000000.5, 'processes': 3}
+    values.update(fields)
+    return values
+
+
+def test_written_rows_are_read_back(tmp_path):
+    table = pyker.StatusTable(tmp_path / 'status.table')
+    rows = [row('bot'), row('job', pid=None, status='scheduled', anomalies=['cpu_spin', 'memory_leak'])]
+    table.write(rows, 1700000100.0)
+
+    updated, read = pyker.StatusTable.read(tmp_path / 'status.table')
+    assert updated == 1700000100.0
+    assert read['bot'] == {key: value for key, value in rows[0].items() if key != 'name'}
+    assert read['job']['pid'] is None
+    assert read['job']['status'] == 'scheduled'
+    assert read['job']['anomalies'] == ['memory_leak', 'cpu_spin']
+    table.close()
+
+
+def test_table_grows_and_skips_names_that_do_not_fit(tmp_path):
+    table = pyker.StatusTable(tmp_path / 'status.table')
+    table.write([row('bot')], 1.0)
+    table.write([row(f"p{index}") for index in range(100)] + [row('x' * 65)], 2.0)
+
+    updated, read = pyker.StatusTable.read(tmp_path / 'status.table')
+    assert updated == 2.0
+    assert len(read) == 100 and 'x' * 65 not in read
+    assert table.capacity == 128
+    table.close()
+
+
+def test_torn_read_is_rejected(tmp_path):
+    table = pyker.StatusTable(tmp_path / 'status.table')
+    table.write([row('bot')], 1.0)
+
+    # The supervisor bumps the sequence to an odd number while it rewrites the slots
+    pyker.StatusTable.SEQUENCE.pack_into(table.map, pyker.StatusTable.SEQUENCE_OFFSET, table.sequence + 1)
+    assert pyker.StatusTable.read(tmp_path / 'status.table', attempts=3) is None
+
+    table.write([row('bot', restarts=3)], 2.0)
+    updated, read = pyker.StatusTable.read(tmp_path / 'status.table')
+    assert (updated, read['bot']['restarts']) == (2.0, 3)
+    table.close()
+
+
+def test_missing_or_foreign_file_is_not_a_table(tmp_path):
+    assert pyker.StatusTable.read(tmp_path / 'status.table') is None
+    (tmp_path / 'status.table').write_bytes(b'not a table at all, but long enough to hold a header')
+    assert pyker.StatusTable.read(tmp_path / 'status.table') is None
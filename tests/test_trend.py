@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+import pyker_core as pyker
+
+INTERVAL = 5  # seconds between supervisor samples
+
+
+@pytest.fixture
+def supervisor(manager):
+    """A supervisor that is not running its loop, fed with samples by the tests"""
+    return pyker.Supervisor(manager)
+
+
+def feed(supervisor, memory_mb, cpu_percent=None):
+    """Sample a process once per interval, returns the anomalies of every sample"""
+    info = {'pid': 4242, 'anomaly_action': 'warn'}
+    cpu_percent = cpu_percent or [0.0] * len(memory_mb)
+    cpu_seconds = 0.0
+    results = []
+    for index, (mb, cpu) in enumerate(zip(memory_mb, cpu_percent)):
+        if index:
+            cpu_seconds += cpu / 100 * INTERVAL
+        status = supervisor._sample('bot', info, (cpu_seconds, mb * 1024 * 1024, 1), 1000.0 + index * INTERVAL)
+        results.append([anomaly['kind'] for anomaly in status['anomalies']])
+    return results
+
+
+def test_trend_detector_fits_a_line():
+    trend = pyker.TrendDetector(50)
+    for x in range(200):
+        trend.add(x, 3.0 * x + 7)
+    assert trend.slope == pytest.approx(3.0)
+    assert trend.correlation == pytest.approx(1.0)
+
+
+def test_steady_memory_growth_is_flagged(supervisor):
+    window = supervisor.pyker.config['anomaly_detection']['trend_window']
+    # 40 MB/h, twice the default threshold
+    growth = 40 / 3600 * INTERVAL
+    results = feed(supervisor, [100 + index * growth for index in range(window + 10)])
+
+    assert all('memory_leak' not in kinds for kinds in results[:window - 1])
+    assert all('memory_leak' in kinds for kinds in results[window:])
+
+
+def test_flat_memory_is_not_flagged(supervisor):
+    window = supervisor.pyker.config['anomaly_detection']['trend_window']
+    results = feed(supervisor, [100.0] * (window * 3))
+    assert not any(results)
+
+
+def test_noisy_memory_is_not_flagged(supervisor):
+    window = supervisor.pyker.config['anomaly_detection']['trend_window']
+    rng = random.Random(7)
+    results = feed(supervisor, [100 + rng.uniform(-5, 5) for _ in range(window * 3)])
+    assert not any(results)
+
+
+def test_cpu_spin_trips_after_the_configured_duration(supervisor):
+    supervisor.pyker.config['anomaly_detection']['cpu_spin_seconds'] = 60
+    results = feed(supervisor, [100.0] * 20, [99.0] * 20)
+
+    # The first sample only starts tracking, the spin is seen from the second one on
+    tripped = [index for index, kinds in enumerate(results) if 'cpu_spin' in kinds]
+    assert tripped[0] == 1 + 60 // INTERVAL
+    assert tripped == list(range(tripped[0], 20))
+
+
+def test_cpu_spin_restarts_when_cpu_drops(supervisor):
+    supervisor.pyker.config['anomaly_detection']['cpu_spin_seconds'] = 60
+    # Spinning for 50s, one quiet sample, then spinning again
+    cpu = [99.0] * 11 + [10.0] + [99.0] * 14
+    results = feed(supervisor, [100.0] * len(cpu), cpu)
+
+    # The quiet sample resets the timer, the spin has to last the full duration again
+    tripped = [index for index, kinds in enumerate(results) if 'cpu_spin' in kinds]
+    assert tripped == [12 + 60 // INTERVAL, 13 + 60 // INTERVAL]